@@ -9,7 +9,9 @@ of the project without affecting users.
 
 from .document import *
 from .elements import *
+from .instrumentation import *
 from .templates import *
+from .writers import *
 
 
 def new_doc() -> Document:
@@ -0,0 +1,660 @@
+"""
+The bench module houses a small benchmark suite for SnakeMD.
+The suite only depends on the standard library, and it can
+be run directly from the command line:
+
+.. code-block:: shell
+
+    python -m snakemd.bench
+    python -m snakemd.bench --scale 0.1 --only table_render csv_table
+    python -m snakemd.bench --output results.json
+
+Each benchmark covers one of the hot paths of the library
+(e.g., rendering inline text, building tables, loading CSVs).
+Results are reported as JSON, so they can be saved and compared
+across releases. Timing benchmarks report the best and mean
+wall-clock time in seconds over several runs, where every run
+works on freshly built elements (i.e., render caches start cold).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from typing import Callable
+
+from .document import Document
+from .elements import (
+    _BOLD,
+    _CODE,
+    _ITALICS,
+    _LINEBREAK,
+    _STRIKETHROUGH,
+    _cached,
+    Code,
+    Heading,
+    Inline,
+    MDList,
+    Paragraph,
+    Quote,
+    Table,
+)
+from .templates import CSVTable, TableOfContents
+
+FORMAT_VERSION = 1
+"""
+The version of the JSON result format. This number changes
+whenever the layout of the results changes.
+"""
+
+_BENCHMARKS: dict[str, Callable[[float, int], dict]] = {}
+
+
+def _benchmark(func: Callable[[float, int], dict]) -> Callable[[float, int], dict]:
+    """
+    A helper decorator which registers a benchmark with the suite.
+    Benchmarks are named after their function minus the bench prefix.
+
+    :param Callable[[float, int], dict] func:
+        a function which accepts a scale factor and a repeat count
+    :return:
+        the function
+    """
+    _BENCHMARKS[func.__name__.removeprefix("bench_")] = func
+    return func
+
+
+def _timed(
+    setup: Callable[[], object], task: Callable[[object], object], repeat: int
+) -> dict:
+    """
+    A helper function which times a benchmark. The setup function
+    is called before every run (and is not timed), so each run starts
+    from the same state.
+
+    :param Callable[[], object] setup:
+        a function which builds the input for a run
+    :param Callable[[object], object] task:
+        the function to time
+    :param int repeat:
+        the number of runs
+    :return:
+        the best and mean time of the runs in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        data = setup()
+        gc.collect()
+        start = time.perf_counter()
+        task(data)
+        times.append(time.perf_counter() - start)
+        del data
+    return {"best": min(times), "mean": statistics.fmean(times), "repeat": repeat}
+
+
+def _traced_size(build: Callable[[], object]) -> int:
+    """
+    A helper function which measures the memory retained by
+    the object returned from build.
+
+    :param Callable[[], object] build:
+        a function which builds the object to measure
+    :return:
+        the number of bytes allocated by build that are still alive
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def _count(base: int, scale: float) -> int:
+    """
+    A helper function which scales the size of a benchmark.
+
+    :param int base:
+        the size of the benchmark at a scale of 1
+    :param float scale:
+        the scale factor
+    :return:
+        the scaled size, which is always at least 1
+    """
+    return max(1, int(base * scale))
+
+
+class _DictInline(Inline):
+    """
+    An Inline subclass without __slots__, which restores the
+    per-instance __dict__ of older versions of SnakeMD.
+    """
+
+
+class _DictParagraph(Paragraph):
+    """
+    A Paragraph subclass without __slots__, which restores the
+    per-instance __dict__ of older versions of SnakeMD.
+    """
+
+
+class _ChainInline(Inline):
+    """
+    An Inline subclass which restores the rendering of older
+    versions of SnakeMD, where each style wraps the text in
+    another f-string rather than using a precomputed template.
+    """
+
+    __slots__ = ()
+
+    @_cached
+    def __str__(self) -> str:
+        text = self._text
+        styles = self._styles
+        if self._image:
+            text = f"![{text}]({self._image})"
+        if self._link:
+            text = f"[{text}]({self._link})"
+        if styles & _BOLD:
+            text = f"**{text}**"
+        if styles & _ITALICS:
+            text = f"_{text}_"
+        if styles & _STRIKETHROUGH:
+            text = f"~~{text}~~"
+        if styles & _CODE:
+            text = f"`{text}`"
+        if styles & _LINEBREAK:
+            text = f"{text}<br />"
+        return text
+
+
+@_benchmark
+def bench_inline_render(scale: float, repeat: int) -> dict:
+    """
+    Times :meth:`snakemd.Inline.__str__` over a mix of styles.
+    """
+    count = _count(100_000, scale)
+    styles = [
+        {},
+        {"bold": True},
+        {"italics": True, "strikethrough": True},
+        {"link": "https://snakemd.io", "bold": True},
+        {"code": True, "linebreak": True},
+        {"image": "logo.png", "link": "https://snakemd.io"},
+    ]
+
+    def setup() -> list[Inline]:
+        return [Inline(f"text {i}", **styles[i % len(styles)]) for i in range(count)]
+
+    def task(inlines: list[Inline]) -> None:
+        for inline in inlines:
+            str(inline)
+
+    return {"count": count, **_timed(setup, task, repeat)}
+
+
+@_benchmark
+def bench_inline_templates(scale: float, repeat: int) -> dict:
+    """
+    Compares rendering styled Inline elements using precomputed
+    templates against the f-string chain of older versions of
+    SnakeMD. Both render the same markdown from cold caches.
+    """
+    count = _count(100_000, scale)
+    styles = [
+        {"bold": True},
+        {"italics": True, "strikethrough": True},
+        {"link": "https://snakemd.io", "bold": True},
+        {"code": True, "linebreak": True},
+        {"image": "logo.png", "link": "https://snakemd.io"},
+    ]
+
+    def setup(cls: type[Inline]) -> Callable[[], list[Inline]]:
+        return lambda: [
+            cls(f"text {i}", **styles[i % len(styles)]) for i in range(count)
+        ]
+
+    def task(inlines: list[Inline]) -> None:
+        for inline in inlines:
+            str(inline)
+
+    templates = _timed(setup(Inline), task, repeat)
+    chain = _timed(setup(_ChainInline), task, repeat)
+    return {
+        "count": count,
+        "templates": templates,
+        "chain": chain,
+        "speedup": chain["best"] / templates["best"],
+    }
+
+
+@_benchmark
+def bench_paragraph_render(scale: float, repeat: int) -> dict:
+    """
+    Times :meth:`snakemd.Paragraph.__str__`, which normalizes
+    the whitespace of paragraphs written as multiline strings.
+    """
+    count = _count(20_000, scale)
+    text = """
+        SnakeMD is your ticket to generating Markdown in Python.
+        To prove it to you, we've generated this entire README using SnakeMD.
+        """
+
+    def setup() -> list[Paragraph]:
+        return [
+            Paragraph([text, Inline("bold", bold=True), text]) for _ in range(count)
+        ]
+
+    def task(paragraphs: list[Paragraph]) -> None:
+        for paragraph in paragraphs:
+            str(paragraph)
+
+    return {"count": count, **_timed(setup, task, repeat)}
+
+
+def _table_data(rows: int, columns: int) -> tuple[list[str], list[list[str]]]:
+    """
+    A helper function which generates the contents of a table.
+
+    :param int rows:
+        the number of rows
+    :param int columns:
+        the number of columns
+    :return:
+        a header and a body of strings
+    """
+    header = [f"Column {j}" for j in range(columns)]
+    body = [[f"{i * j}" for j in range(columns)] for i in range(rows)]
+    return header, body
+
+
+@_benchmark
+def bench_table_build(scale: float, repeat: int) -> dict:
+    """
+    Times the construction of a :class:`snakemd.Table`, which
+    includes wrapping every cell and measuring column widths.
+    """
+    rows = _count(20_000, scale)
+    header, body = _table_data(rows, 10)
+    return {"rows": rows, **_timed(lambda: None, lambda _: Table(header, body), repeat)}
+
+
+@_benchmark
+def bench_table_render(scale: float, repeat: int) -> dict:
+    """
+    Times :meth:`snakemd.Table.__str__` on a freshly built table.
+    """
+    rows = _count(20_000, scale)
+    header, body = _table_data(rows, 10)
+    align = [Table.Align.LEFT, Table.Align.CENTER, Table.Align.RIGHT] * 3 + [None]
+    return {
+        "rows": rows,
+        **_timed(lambda: Table(header, body, align), str, repeat),
+    }
+
+
+@_benchmark
+def bench_table_from_columns(scale: float, repeat: int) -> dict:
+    """
+    Times building and rendering a :class:`snakemd.Table` from
+    columns of numbers (see :meth:`snakemd.Table.from_columns`).
+    """
+    rows = _count(20_000, scale)
+    columns = [array("d", (i * j / 7 for i in range(rows))) for j in range(10)]
+    header = [f"Column {j}" for j in range(10)]
+
+    def task(_) -> str:
+        return str(Table.from_columns(header, columns, formats=[".3f"] * 10))
+
+    return {"rows": rows, **_timed(lambda: None, task, repeat)}
+
+
+@_benchmark
+def bench_nested_render(scale: float, repeat: int) -> dict:
+    """
+    Times the rendering of nested :class:`snakemd.MDList` and
+    :class:`snakemd.Quote` blocks.
+    """
+    count = _count(2_000, scale)
+
+    def setup() -> list[MDList | Quote]:
+        blocks = []
+        for i in range(count):
+            inner = MDList(["Sweet", "Red", MDList([Inline("Deep", bold=True)])])
+            blocks.append(MDList([f"Item {i}", inner, "End"], ordered=True))
+            blocks.append(Quote([f"Quote {i}", Quote(["Inner", Quote("Deepest")])]))
+        return blocks
+
+    def task(blocks: list[MDList | Quote]) -> None:
+        for block in blocks:
+            str(block)
+
+    return {"count": count, **_timed(setup, task, repeat)}
+
+
+@_benchmark
+def bench_table_of_contents(scale: float, repeat: int) -> dict:
+    """
+    Times :class:`snakemd.TableOfContents` over a large document.
+    """
+    count = _count(10_000, scale)
+
+    def setup() -> TableOfContents:
+        doc = Document()
+        toc = doc.add_table_of_contents(range(2, 4))
+        for i in range(count):
+            doc.add_heading(f"Section {i}", level=2 + i % 2)
+            doc.add_paragraph(f"Paragraph {i}")
+        toc.load(doc.get_elements())
+        return toc
+
+    return {"headings": count, **_timed(setup, str, repeat)}
+
+
+@_benchmark
+def bench_paragraph_replace(scale: float, repeat: int) -> dict:
+    """
+    Times :meth:`snakemd.Paragraph.replace` and
+    :meth:`snakemd.Paragraph.insert_link`.
+    """
+    count = _count(10_000, scale)
+    text = "Learn to program with The Renegade Coder (@RenegadeCoder94). " * 4
+
+    def setup() -> list[Paragraph]:
+        return [Paragraph(text) for _ in range(count)]
+
+    def task(paragraphs: list[Paragraph]) -> None:
+        for paragraph in paragraphs:
+            paragraph.replace("program", "code")
+            paragraph.insert_link("The Renegade Coder", "https://therenegadecoder.com")
+            paragraph.insert_link("@RenegadeCoder94", "https://x.com/RenegadeCoder94")
+
+    return {"count": count, **_timed(setup, task, repeat)}
+
+
+@_benchmark
+def bench_paragraph_insert_links(scale: float, repeat: int) -> dict:
+    """
+    Times :meth:`snakemd.Paragraph.insert_links` with a large
+    glossary, linking every occurrence of each term and linking
+    only the first occurrence of each term (i.e., count=1).
+    """
+    count = _count(100, scale)
+    links = {f"term{i:03}": f"/glossary#{i}" for i in range(500)}
+    text = " ".join(f"see term{i % 500:03}" for i in range(1000))
+
+    def setup() -> list[Paragraph]:
+        return [Paragraph(text) for _ in range(count)]
+
+    def link_all(paragraphs: list[Paragraph]) -> None:
+        for paragraph in paragraphs:
+            paragraph.insert_links(links)
+
+    def link_first(paragraphs: list[Paragraph]) -> None:
+        for paragraph in paragraphs:
+            paragraph.insert_links(links, count=1)
+
+    return {
+        "count": count,
+        "all": _timed(setup, link_all, repeat),
+        "first": _timed(setup, link_first, repeat),
+    }
+
+
+@_benchmark
+def bench_csv_table(scale: float, repeat: int) -> dict:
+    """
+    Times loading and rendering a :class:`snakemd.CSVTable`
+    from a generated CSV file (100 MB at a scale of 1).
+    """
+    target = _count(100 * 1024 * 1024, scale)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.csv")
+        with open(path, "w", encoding="utf-8", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["id", "name", "score", "comment"])
+            i = 0
+            while csv_file.tell() < target:
+                writer.writerows(
+                    [n, f"name {n}", n * 7 % 100, f"comment, with {n % 13} commas"]
+                    for n in range(i, i + 1000)
+                )
+                i += 1000
+        size = os.path.getsize(path)
+        result = _timed(lambda: None, lambda _: str(CSVTable(path)), repeat)
+    return {"bytes": size, "rows": i, **result}
+
+
+def _readme_section(doc: Document, i: int) -> None:
+    """
+    A helper function which adds one copy of every section in the
+    repo README (see readme.py) to a document.
+
+    :param Document doc:
+        the document to extend
+    :param int i:
+        the copy number, used to keep headings unique
+    """
+    doc.add_heading(f"Paragraphs {i}", level=2)
+    doc.add_paragraph(
+        """
+        Paragraphs are the most basic feature of any Markdown file.
+        As a result, they are very easy to create using SnakeMD.
+        """
+    )
+    doc.add_paragraph(
+        "Learn to program with The Renegade Coder (@RenegadeCoder94)."
+    ).insert_link("The Renegade Coder", "https://therenegadecoder.com")
+    doc.add_block(Paragraph([Inline("Logo", image="logo.png")]))
+    doc.add_heading(f"Lists {i}", level=3)
+    doc.add_ordered_list(["Deku", "Bakugo", "Uraraka", "Tsuyu"])
+    doc.add_unordered_list(["Crosby", "Malkin", "Lemieux"])
+    doc.add_checklist(["Pass the puck", "Shoot the puck", "Score a goal"])
+    doc.add_block(
+        MDList(
+            [
+                "Apples",
+                Inline("Onions", bold=True),
+                MDList(["Sweet", "Red"]),
+                Paragraph(["This is the end of the list!"]),
+            ]
+        )
+    )
+    doc.add_heading(f"Tables {i}", level=2)
+    doc.add_table(
+        ["Height (cm)", "Weight (kg)", "Age (y)"],
+        [["150", "70", "21"], ["164", "75", "19"], ["181", "87", "40"]],
+        [Table.Align.LEFT, Table.Align.CENTER, Table.Align.RIGHT],
+    )
+    doc.add_code("x = 5", lang="py")
+    doc.add_block(Code(Code("print('nested')", lang="py"), lang="markdown"))
+    doc.add_quote("How Now Brown Cow")
+    doc.add_horizontal_rule()
+    doc.add_raw("4<sup>2</sup> = 16<br />How cool is that?")
+    doc.add_block(Heading([Inline("Styled", italics=True), " heading"], 3))
+
+
+@_benchmark
+def bench_readme(scale: float, repeat: int) -> dict:
+    """
+    Times building and rendering a scaled-up version of the
+    repo README (see readme.py).
+    """
+    copies = _count(1_000, scale)
+
+    def task(_) -> str:
+        doc = Document()
+        doc.add_heading("Welcome to SnakeMD")
+        doc.add_table_of_contents(range(2, 4))
+        for i in range(copies):
+            _readme_section(doc, i)
+        return str(doc)
+
+    return {"copies": copies, **_timed(lambda: None, task, repeat)}
+
+
+def bench_table_memory(rows: int = 10_000, columns: int = 10) -> dict[str, float]:
+    """
+    Measures the memory cost of each cell in a table built the
+    same way as :meth:`snakemd.Document.add_table` (i.e., one
+    Paragraph and one Inline per cell). The measurement is taken
+    twice: once with the slotted element classes and once with
+    equivalent classes that keep a per-instance __dict__.
+    The cell text is created upfront, so only the elements
+    themselves are measured.
+
+    :param int rows:
+        the number of rows in the table
+    :param int columns:
+        the number of columns in the table
+    :return:
+        the bytes per cell with and without __slots__
+    """
+    header = [f"Column {i}" for i in range(columns)]
+    data = [[f"{i}:{j}" for j in range(columns)] for i in range(rows)]
+    cells = rows * columns
+
+    def build(inline: type[Inline], paragraph: type[Paragraph]) -> Table:
+        body = [[paragraph([inline(item)]) for item in row] for row in data]
+        return Table(header, body)
+
+    slots = _traced_size(lambda: build(Inline, Paragraph))
+    dicts = _traced_size(lambda: build(_DictInline, _DictParagraph))
+    return {
+        "cells": cells,
+        "slots_bytes_per_cell": slots / cells,
+        "dict_bytes_per_cell": dicts / cells,
+    }
+
+
+def bench_interned_memory(rows: int = 10_000, columns: int = 10) -> dict[str, float]:
+    """
+    Measures the memory cost of each cell in a table made up of
+    a handful of repeated values (e.g., "Yes" and "No"), with and
+    without sharing interned Inline elements
+    (see :meth:`snakemd.Inline.intern`).
+
+    :param int rows:
+        the number of rows in the table
+    :param int columns:
+        the number of columns in the table
+    :return:
+        the bytes per cell with and without interning
+    """
+    values = ("Yes", "No", "")
+    header = [f"Column {i}" for i in range(columns)]
+    data = [[values[(i + j) % 3] for j in range(columns)] for i in range(rows)]
+    cells = rows * columns
+
+    def build(inline: Callable[[str], Inline]) -> Table:
+        body = [[Paragraph([inline(item)]) for item in row] for row in data]
+        return Table(header, body)
+
+    # values that are already interned are simply reused, which only
+    # changes the result by the size of a few Inline elements
+    fresh = _traced_size(lambda: build(Inline))
+    interned = _traced_size(lambda: build(Inline.intern))
+    return {
+        "cells": cells,
+        "fresh_bytes_per_cell": fresh / cells,
+        "interned_bytes_per_cell": interned / cells,
+    }
+
+
+_BENCHMARKS["table_memory"] = lambda scale, repeat: bench_table_memory(
+    _count(10_000, scale)
+)
+_BENCHMARKS["interned_memory"] = lambda scale, repeat: bench_interned_memory(
+    _count(10_000, scale)
+)
+
+
+def run(
+    names: list[str] | None = None, scale: float = 1.0, repeat: int = 5
+) -> dict:
+    """
+    Runs the benchmark suite.
+
+    :param list[str] names:
+        the benchmarks to run; defaults to None which runs every benchmark
+    :param float scale:
+        a factor applied to the size of every benchmark; defaults to 1.0
+    :param int repeat:
+        the number of timed runs per benchmark; defaults to 5
+    :raises ValueError:
+        when a benchmark name is not recognized
+    :return:
+        the results in the JSON result format
+    """
+    names = names or list(_BENCHMARKS)
+    unknown = [name for name in names if name not in _BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    return {
+        "format": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "benchmarks": {name: _BENCHMARKS[name](scale, repeat) for name in names},
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Runs the benchmark suite from the command line and prints
+    (or saves) the results as JSON.
+
+    :param list[str] argv:
+        the command line arguments; defaults to sys.argv
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m snakemd.bench", description="Benchmarks SnakeMD."
+    )
+    parser.add_argument(
+        "--only", nargs="+", metavar="NAME", help="the benchmarks to run"
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="a size factor for every benchmark"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="the number of runs per benchmark"
+    )
+    parser.add_argument("--output", help="a file to save the results to")
+    parser.add_argument(
+        "--list", action="store_true", help="list the benchmarks and exit"
+    )
+    args = parser.parse_args(argv)
+    if args.list:
+        print("\n".join(_BENCHMARKS))
+        return
+    try:
+        results = run(args.only, args.scale, args.repeat)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,16 @@ generating markdown documents.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import operator
 import os
 import pathlib
 import random
-from typing import Iterable
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Callable, Iterable, Iterator, Mapping, TextIO
 
 from .elements import (
     Block,
@@ -22,7 +27,9 @@ from .elements import (
     Quote,
     Raw,
     Table,
+    _compile_targets,
 )
+from .instrumentation import _emit, _observers
 from .templates import (
     Alert,
     CSVTable,
@@ -33,6 +40,123 @@ from .templates import (
 
 logger = logging.getLogger(__name__)
 
+PROFILES = ("default", "compact")
+"""
+The names of the supported render profiles (see :meth:`Document.render`).
+"""
+
+
+def _render_timed(render: Callable[[Block], str], block: Block) -> tuple[float, str]:
+    """
+    A helper function which renders a block and measures how long
+    it took. It lives at the module level, so it can be sent to the
+    worker processes of :meth:`Document.render`.
+
+    :param Callable[[Block], str] render:
+        the renderer of the chosen profile
+    :param Block block:
+        the block to render
+    :return:
+        the time it took in seconds and the rendered block
+    """
+    start = time.perf_counter()
+    rendered = render(block)
+    return time.perf_counter() - start, rendered
+
+
+class _ElementList(list):
+    """
+    A list of document elements which keeps an ordered index of
+    the headings it contains, so templates like TableOfContents
+    can find them without scanning every element. Appending keeps
+    the index up to date; any other change that could move or
+    remove a heading marks the index as stale, and it is rebuilt
+    the next time it is queried.
+
+    :param Iterable[Element] elements:
+        the initial elements
+    """
+
+    __slots__ = ("_headings", "_stale")
+
+    def __init__(self, elements: Iterable[Element] = ()) -> None:
+        super().__init__(elements)
+        self._headings: list[Heading] = []
+        self._stale = True
+
+    def __reduce__(self) -> tuple:
+        # the index is cheap to rebuild, so only the elements are pickled
+        return type(self), (list(self),)
+
+    def get_headings(self) -> list[Heading]:
+        """
+        Retrieves the headings in the list, in order.
+
+        :return:
+            the heading index, which should not be modified
+        """
+        if self._stale:
+            self._headings = [block for block in self if isinstance(block, Heading)]
+            self._stale = False
+        return self._headings
+
+    def append(self, block: Element) -> None:
+        super().append(block)
+        if isinstance(block, Heading) and not self._stale:
+            self._headings.append(block)
+
+    def extend(self, blocks: Iterable[Element]) -> None:
+        blocks = list(blocks)
+        super().extend(blocks)
+        if not self._stale:
+            self._headings.extend(b for b in blocks if isinstance(b, Heading))
+
+    def __iadd__(self, blocks: Iterable[Element]) -> _ElementList:
+        self.extend(blocks)
+        return self
+
+    def insert(self, index: int, block: Element) -> None:
+        super().insert(index, block)
+        if isinstance(block, Heading):
+            self._stale = True
+
+    def pop(self, index: int = -1) -> Element:
+        block = super().pop(index)
+        if isinstance(block, Heading):
+            self._stale = True
+        return block
+
+    def remove(self, block: Element) -> None:
+        super().remove(block)
+        if isinstance(block, Heading):
+            self._stale = True
+
+    def clear(self) -> None:
+        super().clear()
+        self._headings = []
+        self._stale = False
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._stale = True
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._stale = True
+
+    def __imul__(self, count: int) -> _ElementList:
+        super().__imul__(count)
+        self._stale = True
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._stale = True
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._stale = True
+
 
 class Document:
     """
@@ -54,16 +178,26 @@ class Document:
         import os
         os.remove("README.md")
 
-    :param list[Element] elements:
-        an optional list of elements that make up a markdown document
+    :param None | Iterable[Element] elements:
+        an optional list of elements that make up a markdown document;
+        lists are used as is, so later changes to the list are reflected
+        in the document
 
         .. versionadded:: 2.2
             Included to make __repr__ more useful
+
+        .. versionchanged:: 2.5
+            Documents created without a list keep an index of their
+            headings for templates (e.g., :class:`snakemd.TableOfContents`)
     """
 
-    def __init__(self, elements: list[Element] = None) -> None:
-        self._elements: list[Element] = elements or []
-        logger.info("Created new document: %r", self)
+    def __init__(self, elements: None | Iterable[Element] = None) -> None:
+        # Lists are shared with the caller, so they cannot be indexed
+        if isinstance(elements, list):
+            self._elements: list[Element] = elements
+        else:
+            self._elements = _ElementList(elements or ())
+        logger.info("Created new document with %d elements", len(self._elements))
 
     def __str__(self) -> str:
         """
@@ -80,14 +214,7 @@ class Document:
         :return:
             the document as a markdown string
         """
-        # load templates
-        for block in self._elements:
-            if isinstance(block, Template):
-                block.load(self._elements)
-        # render all
-        document = "\n\n".join(str(block) for block in self._elements)
-        logger.info("Rendered document: %r", document)
-        return document
+        return "".join(self.iter_render())
 
     def __repr__(self) -> str:
         """
@@ -107,6 +234,244 @@ class Document:
         """
         return f"Document(elements={self._elements!r})"
 
+    def iter_render(self, profile: str = "default") -> Iterator[str]:
+        """
+        Renders the markdown document one piece at a time. Unlike
+        :py:class:`str`, which joins every block into a single string,
+        this generator yields each rendered block and the separators
+        between them in order. As a result, only one block needs to
+        be held in memory at a time, which is handy for very
+        large documents.
+
+        .. doctest:: document
+
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_heading("First")
+            Heading(text=[...], level=1)
+            >>> doc.add_paragraph("Hello!")
+            Paragraph(content=[...])
+            >>> list(doc.iter_render())
+            ['# First', '\\n\\n', 'Hello!']
+
+        .. versionadded:: 2.5
+            Included to support streaming large documents
+
+        :raises ValueError:
+            when the profile is not recognized
+        :param str profile:
+            one of :data:`snakemd.PROFILES`; defaults to "default"
+            (see :meth:`render`)
+        :return:
+            an iterator over the pieces of the markdown document
+        """
+        render = self._get_renderer(profile)
+        self._load_templates()
+        # render one block at a time
+        previous = None
+        for block in self._elements:
+            if previous is not None:
+                yield self._get_separator(previous, profile)
+            previous = block
+            if _observers:
+                start = time.perf_counter()
+                rendered = render(block)
+                _emit("render", block, time.perf_counter() - start, len(rendered))
+                yield rendered
+            else:
+                yield render(block)
+
+    async def aiter_render(
+        self, chunk_rows: int = 1000, profile: str = "default"
+    ) -> AsyncIterator[str]:
+        """
+        Renders the markdown document one piece at a time without
+        blocking the event loop. Like :meth:`iter_render`, this
+        asynchronous generator yields each block and the separators
+        between them in order. However, control is handed back to the
+        event loop after every piece, and tables are split into
+        pieces of at most :code:`chunk_rows` lines, so even very large
+        tables do not stall other tasks. CSV tables are parsed in a
+        separate thread (see :py:func:`asyncio.to_thread`) before they
+        are rendered. In the compact profile, blocks are not split.
+
+        .. doctest:: document
+
+            >>> import asyncio
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_heading("First")
+            Heading(text=[...], level=1)
+            >>> async def render():
+            ...     return [piece async for piece in doc.aiter_render()]
+            >>> asyncio.run(render())
+            ['# First']
+
+        .. versionadded:: 2.5
+            Included to support asynchronous applications
+
+        :raises ValueError:
+
+            - when chunk_rows is less than 1
+            - when the profile is not recognized
+        :param int chunk_rows:
+            the maximum number of lines per piece; defaults to 1000
+        :param str profile:
+            one of :data:`snakemd.PROFILES`; defaults to "default"
+            (see :meth:`render`)
+        :return:
+            an asynchronous iterator over the pieces of the markdown document
+        """
+        render = self._get_renderer(profile)
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be at least 1 but was {chunk_rows}")
+        self._load_templates()
+        previous = None
+        for block in self._elements:
+            if previous is not None:
+                yield self._get_separator(previous, profile)
+            previous = block
+            if profile == "default":
+                chunks = block._iter_chunks(chunk_rows)
+            else:
+                chunks = map(render, (block,))
+            # parsing a large CSV file would otherwise block the event loop
+            offload = isinstance(block, CSVTable)
+            elapsed = 0.0
+            size = 0
+            while True:
+                start = time.perf_counter()
+                if offload:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                    offload = False
+                else:
+                    chunk = next(chunks, None)
+                elapsed += time.perf_counter() - start
+                if chunk is None:
+                    break
+                size += len(chunk)
+                yield chunk
+                await asyncio.sleep(0)
+            if _observers:
+                _emit("render", block, elapsed, size)
+
+    def render(self, workers: int | None = None, profile: str = "default") -> str:
+        """
+        Renders the markdown document, optionally spreading the work
+        across a pool of processes. Without workers, this method is
+        equivalent to :py:class:`str`. With workers, templates are
+        loaded and rendered in the current process (they depend on
+        the rest of the document), while every other block is
+        rendered independently in a :py:class:`concurrent.futures.ProcessPoolExecutor`.
+        The results are joined in their original order, so the
+        output is identical to the serial output.
+
+        Parallel rendering pays off for documents with many large
+        blocks (e.g., tables, code). Because blocks are sent to
+        the workers, they must be picklable.
+
+        The output can also be made smaller using the compact profile,
+        which renders markdown that displays the same but without any
+        cosmetic whitespace: table cells are not padded, alignment rows
+        use a single dash per column, and blocks that end on their own
+        line (i.e., headings and horizontal rules) are followed by a
+        single newline rather than a blank line.
+
+        .. doctest:: document
+
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_heading("First")
+            Heading(text=[...], level=1)
+            >>> doc.render() == str(doc)
+            True
+            >>> doc.add_table(["Rank", "Player"], [["1st", "Crosby"]])
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(doc.render(profile="compact"))
+            # First
+            |Rank|Player|
+            |-|-|
+            |1st|Crosby|
+
+        .. versionadded:: 2.5
+            Included to support rendering large documents on many cores
+
+        :param None | int workers:
+            the number of worker processes to use
+
+            - defaults to :code:`None` which renders the document
+              in the current process
+            - set to an integer greater than one to render blocks
+              in a pool of that many processes
+        :param str profile:
+            the render profile, which is one of :data:`snakemd.PROFILES`
+
+            - defaults to :code:`"default"` which renders the document
+              the same as :py:class:`str`
+            - set to :code:`"compact"` to render the smallest markdown
+              that displays the same
+        :raises ValueError:
+            when the profile is not recognized
+        :return:
+            the document as a markdown string
+        """
+        render = self._get_renderer(profile)
+        if workers is None or workers < 2:
+            return "".join(self.iter_render(profile))
+        self._load_templates()
+        rendered: list[str | None] = [None] * len(self._elements)
+        elapsed = [0.0] * len(self._elements)
+        pending: list[int] = []
+        for i, block in enumerate(self._elements):
+            if isinstance(block, Template) or getattr(block, "_cache", None):
+                elapsed[i], rendered[i] = _render_timed(render, block)
+            else:
+                pending.append(i)
+        if pending:
+            chunksize = max(1, len(pending) // (workers * 4))
+            timed = functools.partial(_render_timed, render)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                blocks = (self._elements[i] for i in pending)
+                for i, outcome in zip(
+                    pending, executor.map(timed, blocks, chunksize=chunksize)
+                ):
+                    elapsed[i], rendered[i] = outcome
+        if _observers:
+            # workers cannot reach the observers, so events are sent from here
+            for i, block in enumerate(self._elements):
+                _emit("render", block, elapsed[i], len(rendered[i]))
+        pieces = [rendered[0]] if rendered else []
+        for i in range(1, len(rendered)):
+            pieces.append(self._get_separator(self._elements[i - 1], profile))
+            pieces.append(rendered[i])
+        return "".join(pieces)
+
+    def render_to(self, fp: TextIO, profile: str = "default") -> None:
+        """
+        Renders the markdown document directly to a file-like object.
+        Blocks are written as they are rendered (see :meth:`iter_render`),
+        so the full document never has to exist as a single string.
+
+        .. doctest:: document
+
+            >>> import io
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_heading("First")
+            Heading(text=[...], level=1)
+            >>> buffer = io.StringIO()
+            >>> doc.render_to(buffer)
+            >>> buffer.getvalue()
+            '# First'
+
+        .. versionadded:: 2.5
+            Included to support streaming large documents
+
+        :param TextIO fp:
+            any object with a text-based write method (e.g., an open file)
+        :param str profile:
+            one of :data:`snakemd.PROFILES`; defaults to "default"
+            (see :meth:`render`)
+        """
+        for piece in self.iter_render(profile):
+            fp.write(piece)
+
     def get_elements(self) -> list[Element]:
         """
         A getter method which allows the user to retrieve
@@ -147,8 +512,7 @@ class Document:
         :return:
             the :class:`Block` added to this Document
         """
-        self._elements.append(block)
-        logger.info("Added custom block to document: %r", block)
+        self._add(block)
         return block
 
     def add_raw(self, text: str) -> Raw:
@@ -171,8 +535,7 @@ class Document:
             the :class:`Raw` block added to this Document
         """
         raw = Raw(text)
-        self._elements.append(raw)
-        logger.info("Added raw block to document: %r", text)
+        self._add(raw)
         return raw
 
     def add_heading(self, text: str, level: int = 1) -> Heading:
@@ -195,8 +558,7 @@ class Document:
             the :class:`Heading` added to this Document
         """
         heading = Heading(Inline(text), level)
-        self._elements.append(heading)
-        logger.info("Added heading to document: %r", heading)
+        self._add(heading)
         return heading
 
     def add_paragraph(self, text: str) -> Paragraph:
@@ -217,8 +579,7 @@ class Document:
             the :class:`Paragraph` added to this Document
         """
         paragraph = Paragraph([Inline(text)])
-        self._elements.append(paragraph)
-        logger.info("Added paragraph to document: %r", paragraph)
+        self._add(paragraph)
         return paragraph
 
     def add_ordered_list(self, items: Iterable[str]) -> MDList:
@@ -241,8 +602,7 @@ class Document:
             the :class:`MDList` added to this Document
         """
         md_list = MDList(items, ordered=True)
-        self._elements.append(md_list)
-        logger.info("Added ordered list to document: %r", md_list)
+        self._add(md_list)
         return md_list
 
     def add_unordered_list(self, items: Iterable[str]) -> MDList:
@@ -265,8 +625,7 @@ class Document:
             the :class:`MDList` added to this Document
         """
         md_list = MDList(items)
-        self._elements.append(md_list)
-        logger.info("Added unordered list to document: %r", md_list)
+        self._add(md_list)
         return md_list
 
     def add_checklist(self, items: Iterable[str]) -> Checklist:
@@ -289,8 +648,7 @@ class Document:
             the :class:`MDList` added to this Document
         """
         checklist = Checklist(items, checked=False)
-        self._elements.append(checklist)
-        logger.info("Added checklist to document: %r", checklist)
+        self._add(checklist)
         return checklist
 
     def add_table(
@@ -299,6 +657,7 @@ class Document:
         data: Iterable[Iterable[str]],
         align: Iterable[Table.Align] = None,
         indent: int = 0,
+        intern: bool = False,
     ) -> Table:
         """
         A convenience method which adds a table to the document:
@@ -326,14 +685,30 @@ class Document:
             defaults to None
         :param int indent:
             indent size for the whole table
+        :param bool intern:
+            whether table cells with the same text should share a single
+            immutable Inline element (see :meth:`snakemd.Inline.intern`);
+            defaults to False
+
+            .. versionadded:: 2.5
+                Included to reduce memory usage in large tables
+
         :return:
             the :class:`Table` added to this Document
         """
         header = [Paragraph([text]) for text in header]
-        data = [[Paragraph([item]) for item in row] for row in data]
+        if intern:
+            data = [
+                [
+                    Paragraph([Inline.intern(item) if isinstance(item, str) else item])
+                    for item in row
+                ]
+                for row in data
+            ]
+        else:
+            data = [[Paragraph([item]) for item in row] for row in data]
         table = Table(header, data, align, indent)
-        self._elements.append(table)
-        logger.info("Added table to document: %r", table)
+        self._add(table)
         return table
 
     def add_table_from_csv(self, path: os.PathLike) -> CSVTable:
@@ -345,7 +720,7 @@ class Document:
 
             >>> doc = snakemd.new_doc()
             >>> doc.add_table_from_csv("../tests/resources/python-support.csv")
-            Table(header=[...], body=[...], align=None, indent=0)
+            CSVTable(path='...', ...)
             >>> print(doc) # doctest: +NORMALIZE_WHITESPACE
             | Python              | 3.11 | 3.10 | 3.9 | 3.8 |
             | ------------------- | ---- | ---- | --- | --- |
@@ -359,8 +734,7 @@ class Document:
             the :class:`Table` added to this Document
         """
         table = CSVTable(path)
-        self._elements.append(table)
-        logger.info("Added table to document: %r", table)
+        self._add(table)
         return table
 
     def add_code(self, code: str, lang: str = "generic") -> Code:
@@ -385,8 +759,7 @@ class Document:
             the :class:`Code` block added to this Document
         """
         code_block = Code(code, lang=lang)
-        self._elements.append(code_block)
-        logger.info("Added code block to document: %r", code_block)
+        self._add(code_block)
         return code_block
 
     def add_quote(self, text: str) -> Quote:
@@ -407,8 +780,7 @@ class Document:
             the :class:`Quote` added to this Document
         """
         quote = Quote(text)
-        self._elements.append(quote)
-        logger.info("Added quote to document: %r", quote)
+        self._add(quote)
         return quote
 
     def add_horizontal_rule(self) -> HorizontalRule:
@@ -427,8 +799,7 @@ class Document:
             the :class:`HorizontalRule` added to this Document
         """
         horizontal_rule = HorizontalRule()
-        self._elements.append(horizontal_rule)
-        logger.info("Added horizontal rule to document: %r", horizontal_rule)
+        self._add(horizontal_rule)
         return horizontal_rule
 
     def add_table_of_contents(self, levels: range = range(2, 3)) -> TableOfContents:
@@ -462,8 +833,7 @@ class Document:
             the :class:`TableOfContents` added to this Document
         """
         toc = TableOfContents(levels=levels)
-        self._elements.append(toc)
-        logger.info("Added table of contents to document: %r", toc)
+        self._add(toc)
         return toc
 
     def add_alert(self, message: str, kind: Alert.Kind = Alert.Kind.NOTE) -> Alert:
@@ -487,10 +857,130 @@ class Document:
             the :class:`Alert` added to this Document
         """
         alert = Alert(message, kind)
-        self._elements.append(alert)
-        logger.info("Added alert to document: %r", alert)
+        self._add(alert)
         return alert
 
+    async def adump(
+        self,
+        name: str,
+        directory: str | os.PathLike = "",
+        ext: str = "md",
+        encoding: str = "utf-8",
+        buffer_size: int = 1 << 16,
+    ) -> None:
+        """
+        Outputs the markdown document to a file without blocking the
+        event loop. This method works just like :meth:`dump`, except that
+        the document is rendered using :meth:`aiter_render` and all file
+        system work (e.g., making directories, writing) is offloaded to a
+        thread using :py:func:`asyncio.to_thread`. Rendered pieces are
+        gathered into batches of roughly :code:`buffer_size` characters
+        before they are written.
+
+        .. doctest:: document
+
+            >>> import asyncio
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_horizontal_rule()
+            HorizontalRule()
+            >>> asyncio.run(doc.adump("README"))
+
+        .. versionadded:: 2.5
+            Included to support asynchronous applications
+
+        :param str name:
+            the name of the markdown file to output without the file extension
+        :param str | os.PathLike directory:
+            the output directory for the markdown file; defaults to ""
+        :param str ext:
+            the output file extension; defaults to "md"
+        :param str encoding:
+            the encoding to use; defaults to utf-8
+        :param int buffer_size:
+            the number of characters to gather before each write;
+            defaults to 65536
+        """
+        await asyncio.to_thread(
+            pathlib.Path(directory).mkdir, parents=True, exist_ok=True
+        )
+        output_file = await asyncio.to_thread(
+            open, os.path.join(directory, f"{name}.{ext}"), "w+", encoding=encoding
+        )
+        try:
+            batch: list[str] = []
+            size = 0
+            async for piece in self.aiter_render():
+                batch.append(piece)
+                size += len(piece)
+                if size >= buffer_size:
+                    await asyncio.to_thread(output_file.writelines, batch)
+                    batch, size = [], 0
+            if batch:
+                await asyncio.to_thread(output_file.writelines, batch)
+        finally:
+            await asyncio.to_thread(output_file.close)
+        logger.info("Dumped document to %s with filename %s.%s", directory, name, ext)
+
+    @staticmethod
+    def _get_renderer(profile: str):
+        """
+        A helper method which looks up the function that renders
+        a block for the given profile. The function is picklable,
+        so it can be sent to worker processes.
+
+        :raises ValueError:
+            when the profile is not recognized
+        :param str profile:
+            one of :data:`snakemd.PROFILES`
+        :return:
+            a function which renders a block as a string
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}; expected one of {PROFILES}")
+        if profile == "compact":
+            return operator.methodcaller("_render_compact")
+        return str
+
+    @staticmethod
+    def _get_separator(block: Element, profile: str) -> str:
+        """
+        A helper method which picks the whitespace that follows
+        a block. Blocks are normally separated by a blank line,
+        but headings and horizontal rules always end their line,
+        so a single newline is enough in the compact profile.
+
+        :param Element block:
+            the block before the separator
+        :param str profile:
+            one of :data:`snakemd.PROFILES`
+        :return:
+            the separator
+        """
+        if profile == "compact" and isinstance(block, (Heading, HorizontalRule)):
+            return "\n"
+        return "\n\n"
+
+    def _load_templates(self) -> None:
+        """
+        A helper method which injects the contents of the document
+        into every template, right before the document is rendered.
+        """
+        for block in self._elements:
+            if isinstance(block, Template):
+                block.load(self._elements)
+
+    def _add(self, block: Element) -> None:
+        """
+        A helper method which appends a block to the document and
+        notifies any observers (see :func:`snakemd.instrument`).
+
+        :param Element block:
+            the block to append
+        """
+        self._elements.append(block)
+        if _observers:
+            _emit("add", block)
+
     def scramble(self) -> None:
         """
         A silly method which mixes all of the blocks in this document in
@@ -508,12 +998,144 @@ class Document:
         random.shuffle(self._elements)
         logger.info("Scrambled document")
 
+    def autolink(
+        self,
+        glossary: Mapping[str, str],
+        first_occurrence_only: bool = True,
+        scope: str = "section",
+    ) -> int:
+        """
+        Links every term of a glossary throughout the document.
+        Every paragraph is searched, including paragraphs nested
+        in lists, checklists, quotes, alerts, and tables, but
+        headings are not. Table cells that are plain strings are
+        turned into paragraphs when they contain a term. Raw blocks
+        (including lines of quotes and alerts given as plain
+        strings), code blocks, and CSV tables are never searched. Like
+        :meth:`snakemd.Paragraph.insert_links`, code and text that
+        is already linked are skipped, and the longest term at the
+        earliest position wins. However, all of the terms are
+        compiled into a single matcher up front, and each paragraph
+        is only searched once, no matter how many terms there are.
+
+        By default, only the first occurrence of each term in each
+        section (i.e., between headings) is linked. When a term has
+        already been linked, later occurrences are left as text,
+        even if a shorter term appears inside of them.
+
+        .. doctest:: document
+
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_paragraph("SnakeMD is written in Python, like pip.")
+            Paragraph(content=[...])
+            >>> doc.add_heading("Usage")
+            Heading(text=[...], level=1)
+            >>> doc.add_paragraph("Install SnakeMD using pip.")
+            Paragraph(content=[...])
+            >>> doc.autolink({"SnakeMD": "https://snakemd.io", "pip": "/pip"})
+            4
+            >>> print(doc)
+            [SnakeMD](https://snakemd.io) is written in Python, like [pip](/pip).
+            <BLANKLINE>
+            # Usage
+            <BLANKLINE>
+            Install [SnakeMD](https://snakemd.io) using [pip](/pip).
+
+        .. versionadded:: 2.5
+            Included to support linking large glossaries
+
+        :raises ValueError:
+            when the scope is not "section" or "document"
+        :param Mapping[str, str] glossary:
+            the url or path for each term
+        :param bool first_occurrence_only:
+            whether to only link the first occurrence of each term;
+            defaults to True
+        :param str scope:
+            where first occurrences are counted from when
+            first_occurrence_only is set; either "section" to start
+            over at every heading or "document" to link each term
+            once in the whole document; defaults to "section"
+        :return:
+            the number of links inserted
+        """
+        if scope not in ("section", "document"):
+            raise ValueError(f"scope must be 'section' or 'document' but was {scope!r}")
+        terms = frozenset(term for term in glossary if term)
+        if not terms:
+            return 0
+        pattern = _compile_targets(terms)
+        linked: set[str] = set()
+        inserted = 0
+
+        def find(inline: Inline) -> Iterator[tuple[int, int, Inline]]:
+            nonlocal inserted
+            for match in pattern.finditer(inline.get_text()):
+                term = match.group()
+                if first_occurrence_only:
+                    if term in linked:
+                        continue
+                    linked.add(term)
+                inserted += 1
+                link = Inline(term, link=glossary[term])
+                yield match.start(), match.end(), link._apply_styles_from(inline)
+
+        for block in self._elements:
+            for element in block._walk():
+                if isinstance(element, Heading) and scope == "section":
+                    linked.clear()
+                elif isinstance(element, Table):
+                    element._wrap_cells(pattern)
+                elif isinstance(element, Paragraph):
+                    element._rewrite(find)
+        logger.info("Inserted %d links", inserted)
+        return inserted
+
+    def optimize(self) -> None:
+        """
+        Shrinks the document without changing how it renders.
+        Every paragraph is compacted (see
+        :meth:`snakemd.Paragraph.compact`), including paragraphs
+        nested in lists, quotes, and tables, and adjacent raw blocks
+        are merged into one. This pays off after heavy use of
+        methods like :meth:`snakemd.Paragraph.replace`, which leave
+        paragraphs made of many small Inline elements.
+
+        .. doctest:: document
+
+            >>> doc = snakemd.new_doc()
+            >>> doc.add_raw("<!-- generated -->")
+            Raw(text='<!-- generated -->')
+            >>> doc.add_raw("<br>")
+            Raw(text='<br>')
+            >>> doc.optimize()
+            >>> doc.get_elements()
+            [Raw(text='<!-- generated -->\\n\\n<br>')]
+
+        .. versionadded:: 2.5
+            Included to cut the memory and render time of edited documents
+        """
+        blocks: list[Element] = []
+        for block in self._elements:
+            for element in block._walk():
+                if isinstance(element, Paragraph):
+                    element.compact()
+            if isinstance(block, Raw) and blocks and isinstance(blocks[-1], Raw):
+                # Blocks are separated by a blank line in every profile
+                blocks[-1] = Raw(f"{blocks[-1]}\n\n{block}")
+            else:
+                blocks.append(block)
+        if len(blocks) != len(self._elements):
+            self._elements[:] = blocks
+        logger.info("Optimized document")
+
     def dump(
         self,
         name: str,
         directory: str | os.PathLike = "",
         ext: str = "md",
         encoding: str = "utf-8",
+        compact: bool = False,
     ) -> None:
         """
         Outputs the markdown document to a file. This method assumes the output
@@ -541,10 +1163,16 @@ class Document:
             the output file extension; defaults to "md"
         :param str encoding:
             the encoding to use; defaults to utf-8
+        :param bool compact:
+            whether to write the smallest markdown that displays
+            the same (see :meth:`render`); defaults to False
+
+            .. versionadded:: 2.5
+                Included to reduce the size of large documents
         """
         pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
         with open(
             os.path.join(directory, f"{name}.{ext}"), "w+", encoding=encoding
         ) as output_file:
-            output_file.write(str(self))
+            self.render_to(output_file, "compact" if compact else "default")
         logger.info("Dumped document to %s with filename %s.%s", directory, name, ext)
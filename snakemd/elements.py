@@ -5,13 +5,131 @@ elements that can be added to a Document.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import heapq
+import itertools
 import logging
+import operator
+import re
+import sys
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Mapping
 from enum import Enum, auto
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
+# Inline style flags (see Inline._styles)
+_BOLD = 1 << 0
+_ITALICS = 1 << 1
+_STRIKETHROUGH = 1 << 2
+_CODE = 1 << 3
+_LINEBREAK = 1 << 4
+_FROZEN = 1 << 5
+
+# Extra flags used only to look up the render template of an Inline
+_IMAGE = 1 << 6
+_LINK = 1 << 7
+_MARKUP = _BOLD | _ITALICS | _STRIKETHROUGH | _CODE | _LINEBREAK
+
+
+def _inline_template(key: int) -> tuple[str, ...]:
+    """
+    A helper function which builds the template that renders an
+    Inline element with the given combination of styles. Styles
+    wrap one another in a fixed order, from images on the inside
+    to line breaks on the outside. The template is the markup that
+    goes around the text, then the image, and then the link of the
+    element, whichever of them are present (e.g., :code:`("**[",
+    "](", ")**")` for bold links).
+
+    :param int key:
+        the style flags of the element, plus _IMAGE and _LINK
+        when the element has an image or a link
+    :return:
+        the pieces of markup for the combination of styles
+    """
+    template = "{0}"
+    if key & _IMAGE:
+        template = f"![{template}]({{1}})"
+    if key & _LINK:
+        template = f"[{template}]({{2}})"
+    if key & _BOLD:
+        template = f"**{template}**"
+    if key & _ITALICS:
+        template = f"_{template}_"
+    if key & _STRIKETHROUGH:
+        template = f"~~{template}~~"
+    if key & _CODE:
+        template = f"`{template}`"
+    if key & _LINEBREAK:
+        # Note: doing this the markdown way (i.e., space-space-newline)
+        # does not work with the current implementation of Paragraph
+        template = f"{template}<br />"
+    return tuple(re.split(r"\{[012]\}", template))
+
+
+# Every combination of styles is rendered from one precomputed template
+_INLINE_TEMPLATES = tuple(map(_inline_template, range(_LINK << 1)))
+
+
+def _cached(render):
+    """
+    A helper decorator for the __str__ method of elements. The
+    rendered string is stored on the element and reused until
+    one of the element's mutators (or the mutators of any of
+    its children) invalidates it.
+
+    :param render:
+        the __str__ method to wrap
+    :return:
+        the wrapped __str__ method
+    """
+
+    @functools.wraps(render)
+    def wrapper(self) -> str:
+        if self._cache is None:
+            self._cache = render(self)
+        return self._cache
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_targets(targets: frozenset[str]) -> re.Pattern:
+    """
+    A helper function which compiles a set of target strings
+    into a single pattern that finds all of them in one pass.
+    Longer targets are tried first, so the pattern matches the
+    longest target at the leftmost position (e.g., "Python 3"
+    rather than "Python"). Patterns are cached, so the same set
+    of targets can be applied to many paragraphs cheaply.
+
+    :param frozenset[str] targets:
+        the strings to find
+    :return:
+        the compiled pattern
+    """
+    ordered = sorted(targets, key=lambda target: (-len(target), target))
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """
+    A helper function which compiles a regular expression. Up to
+    128 of the most recently used patterns are kept, so applying the
+    same pattern to many paragraphs only compiles it once.
+
+    :param str pattern:
+        the regular expression
+    :return:
+        the compiled pattern
+    """
+    return re.compile(pattern)
+
 
 class Element(ABC):
     """
@@ -21,8 +139,19 @@ class Element(ABC):
     the built-in :py:class:`str` constructor. They must also be
     able to be converted into development strings using the
     :py:func:`repr` function.
+
+    .. versionchanged:: 2.5
+        Elements now cache their rendered strings. Any mutator
+        that changes an element clears its cache as well as the
+        caches of every element that contains it.
     """
 
+    __slots__ = ("_cache", "_parents")
+
+    def __init__(self) -> None:
+        self._cache: str | None = None
+        self._parents: None | Element | list[Element] = None
+
     @abstractmethod
     def __str__(self) -> str:
         """
@@ -48,6 +177,114 @@ class Element(ABC):
             an unambiguous representation of the element
         """
 
+    def _adopt(self, children: Iterable) -> None:
+        """
+        A helper method which registers self as the parent of
+        each of the provided children. That way, changes to any
+        of the children can invalidate the render cache of self.
+        Children that are not elements (e.g., strings) are skipped.
+
+        Most elements only ever have one parent, so a lone parent
+        is stored directly rather than in a list to save memory.
+
+        :param Iterable children:
+            the items nested directly inside of self
+        """
+        for child in children:
+            # plain strings are by far the most common child (e.g., table cells)
+            if isinstance(child, str) or not isinstance(child, Element):
+                continue
+            if isinstance(child, Inline) and child._styles & _FROZEN:
+                continue  # interned inline elements never change
+            parents = getattr(child, "_parents", None)
+            if parents is None:
+                child._parents = self
+            elif isinstance(parents, list):
+                if not any(parent is self for parent in parents):
+                    parents.append(self)
+            elif parents is not self:
+                child._parents = [parents, self]
+
+    def _disown(self, children: Iterable) -> None:
+        """
+        A helper method which undoes :meth:`_adopt` for children
+        that were removed from self, so changes to them no longer
+        invalidate the render cache of self.
+
+        :param Iterable children:
+            the items that were removed from self
+        """
+        for child in children:
+            if isinstance(child, str) or not isinstance(child, Element):
+                continue
+            parents = getattr(child, "_parents", None)
+            if parents is self:
+                child._parents = None
+            elif isinstance(parents, list):
+                parents[:] = [parent for parent in parents if parent is not self]
+
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and every element
+        nested inside of self, in the order they are rendered.
+        Elements that contain other elements (e.g., lists) override
+        this method.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+
+    def _render_compact(self) -> str:
+        """
+        A helper method which renders self using as few characters
+        as possible without changing how the markdown is displayed
+        (see :meth:`snakemd.Document.render`). Most elements are
+        already minimal, so they render as usual; elements with
+        cosmetic whitespace (e.g., tables) override this method.
+
+        :return:
+            self as a compact markdown string
+        """
+        return str(self)
+
+    def _iter_chunks(self, size: int) -> Iterator[str]:
+        """
+        A helper method which renders self in pieces of at most
+        size lines that, when concatenated, match :py:class:`str`
+        exactly. Elements that can be slow to render (e.g., tables)
+        override this method to render each piece on demand, so that
+        asynchronous rendering can pause between pieces (see
+        :meth:`snakemd.Document.aiter_render`).
+
+        :param int size:
+            the maximum number of lines per piece
+        :return:
+            an iterator over the pieces of self
+        """
+        text = str(self)
+        if text.count("\n") < size:
+            yield text
+            return
+        lines = text.split("\n")
+        for start in range(0, len(lines), size):
+            piece = "\n".join(lines[start : start + size])
+            yield piece if start + size >= len(lines) else piece + "\n"
+
+    def _invalidate(self) -> None:
+        """
+        A helper method which clears the render cache of self and
+        of every element that contains self. Mutators must call
+        this method whenever they change the rendered output.
+        """
+        self._cache = None
+        parents = self._parents
+        if isinstance(parents, list):
+            for parent in parents:
+                parent._invalidate()
+        elif parents is not None:
+            parents._invalidate()
+
 
 class Inline(Element):
     """
@@ -112,6 +349,11 @@ class Inline(Element):
           end of the element (i.e., `<br>`)
     """
 
+    __slots__ = ("_text", "_image", "_link", "_styles")
+
+    _interned: dict[tuple[type, str], Inline] = {}
+    _intern_limit: int = 1 << 16
+
     def __init__(
         self,
         text: str,
@@ -123,14 +365,17 @@ class Inline(Element):
         code: bool = False,
         linebreak: bool = False,
     ) -> None:
+        super().__init__()
         self._text = text
         self._image = image
         self._link = link
-        self._bold = bold
-        self._italics = italics
-        self._strikethrough = strikethrough
-        self._code = code
-        self._linebreak = linebreak
+        self._styles: int = (
+            (_BOLD if bold else 0)
+            | (_ITALICS if italics else 0)
+            | (_STRIKETHROUGH if strikethrough else 0)
+            | (_CODE if code else 0)
+            | (_LINEBREAK if linebreak else 0)
+        )
 
     def __str__(self) -> str:
         """
@@ -138,6 +383,14 @@ class Inline(Element):
         inline can represent many different types of data from
         stylized text to code, links, and images.
 
+        Each combination of styles has a precomputed template
+        (see :func:`_inline_template`), so rendering is a single
+        lookup. Like other elements, the result is cached until
+        one of the mutators runs, but the cache is checked here
+        directly rather than through :func:`_cached` because
+        inline elements are rendered far more often than any
+        other element.
+
         .. doctest:: inline
 
             >>> inline = Inline("This is formatted text", bold=True, italics=True)
@@ -147,24 +400,28 @@ class Inline(Element):
         :return:
             the Inline object as a markdown string
         """
-        text = self._text
+        if (text := self._cache) is not None:
+            return text
+        key = self._styles & _MARKUP
         if self._image:
-            text = f"![{text}]({self._image})"
+            key |= _IMAGE
         if self._link:
-            text = f"[{text}]({self._link})"
-        if self._bold:
-            text = f"**{text}**"
-        if self._italics:
-            text = f"_{text}_"
-        if self._strikethrough:
-            text = f"~~{text}~~"
-        if self._code:
-            text = f"`{text}`"
-        if self._linebreak:
-            # Note: doing this the markdown way (i.e., space-space-newline)
-            # does not work with the current implementation of Paragraph
-            text = f"{text}<br />"
-        logger.debug("Rendered inline text: %r", text)
+            key |= _LINK
+        if not key:
+            text = self._text
+        elif key < _IMAGE:
+            before, after = _INLINE_TEMPLATES[key]
+            text = f"{before}{self._text}{after}"
+        elif key & _IMAGE and key & _LINK:
+            before, middle, between, after = _INLINE_TEMPLATES[key]
+            text = (
+                f"{before}{self._text}{middle}{self._image}"
+                f"{between}{self._link}{after}"
+            )
+        else:
+            before, middle, after = _INLINE_TEMPLATES[key]
+            text = f"{before}{self._text}{middle}{self._image or self._link}{after}"
+        self._cache = text
         return text
 
     def __repr__(self) -> str:
@@ -177,19 +434,63 @@ class Inline(Element):
         :return:
             the Inline object as a development string
         """
+        styles = self._styles
         return (
             f"Inline("
             f"text={self._text!r}, "
             f"image={self._image!r}, "
             f"link={self._link!r}, "
-            f"bold={self._bold!r}, "
-            f"italics={self._italics!r}, "
-            f"strikethrough={self._strikethrough!r}, "
-            f"code={self._code!r}, "
-            f"linebreak={self._linebreak!r}"
+            f"bold={bool(styles & _BOLD)!r}, "
+            f"italics={bool(styles & _ITALICS)!r}, "
+            f"strikethrough={bool(styles & _STRIKETHROUGH)!r}, "
+            f"code={bool(styles & _CODE)!r}, "
+            f"linebreak={bool(styles & _LINEBREAK)!r}"
             ")"
         )
 
+    @classmethod
+    def intern(cls, text: str) -> Inline:
+        """
+        Retrieves a shared, unstyled Inline element for the given text.
+        Repeated calls with the same text return the same object, so
+        documents with many duplicate values (e.g., "Yes" and "No" in
+        a large table) only pay for one Inline per distinct value.
+
+        Because interned elements are shared, they are immutable:
+        any mutator that would change an interned element raises
+        a TypeError. To style an interned value, create a new
+        Inline from its text instead. Subclasses of Inline are
+        interned separately, so each class gets back its own type.
+
+        At most :code:`Inline._intern_limit` values (65536 by default)
+        are kept. Past that limit, values that are not already
+        interned are no longer shared: each call silently returns a
+        new immutable Inline element.
+
+        .. doctest:: inline
+
+            >>> Inline.intern("Yes") is Inline.intern("Yes")
+            True
+            >>> str(Inline.intern("Yes"))
+            'Yes'
+
+        .. versionadded:: 2.5
+            Included to reduce memory usage in large tables and lists
+
+        :param str text:
+            the inline text to render
+        :return:
+            an immutable Inline element shared by all callers
+        """
+        key = (cls, text)
+        inline = cls._interned.get(key)
+        if inline is None:
+            inline = cls(text)
+            inline._styles = _FROZEN
+            if len(cls._interned) < cls._intern_limit:
+                cls._interned[key] = inline
+        return inline
+
     def is_text(self) -> bool:
         """
         Checks if this Inline element is a text-only element. If not, it must
@@ -204,7 +505,7 @@ class Inline(Element):
         :return:
             True if this is a text-only element; False otherwise
         """
-        return not (self._code or self._image or self._link)
+        return not (self._styles & _CODE or self._image or self._link)
 
     def is_link(self) -> bool:
         """
@@ -270,8 +571,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._bold = True
-        return self
+        return self._set_style(_BOLD, True)
 
     def unbold(self) -> Inline:
         """
@@ -286,8 +586,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._bold = False
-        return self
+        return self._set_style(_BOLD, False)
 
     def italicize(self) -> Inline:
         """
@@ -302,8 +601,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._italics = True
-        return self
+        return self._set_style(_ITALICS, True)
 
     def unitalicize(self) -> Inline:
         """
@@ -318,8 +616,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._italics = False
-        return self
+        return self._set_style(_ITALICS, False)
 
     def strikethrough(self) -> Inline:
         """
@@ -334,8 +631,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._strikethrough = True
-        return self
+        return self._set_style(_STRIKETHROUGH, True)
 
     def unstrikethrough(self) -> Inline:
         """
@@ -352,8 +648,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._strikethrough = False
-        return self
+        return self._set_style(_STRIKETHROUGH, False)
 
     def code(self) -> Inline:
         """
@@ -368,8 +663,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._code = True
-        return self
+        return self._set_style(_CODE, True)
 
     def uncode(self) -> Inline:
         """
@@ -384,8 +678,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._code = False
-        return self
+        return self._set_style(_CODE, False)
 
     def breakline(self) -> Inline:
         """
@@ -400,8 +693,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._linebreak = True
-        return self
+        return self._set_style(_LINEBREAK, True)
 
     def unbreakline(self) -> Inline:
         """
@@ -416,8 +708,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._linebreak = False
-        return self
+        return self._set_style(_LINEBREAK, False)
 
     def link(self, link: str) -> Inline:
         """
@@ -434,8 +725,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._link = link
-        return self
+        return self._set_link(link)
 
     def unlink(self) -> Inline:
         """
@@ -452,8 +742,7 @@ class Inline(Element):
         :return:
             self
         """
-        self._link = None
-        return self
+        return self._set_link(None)
 
     def reset(self) -> Inline:
         """
@@ -475,12 +764,15 @@ class Inline(Element):
         :return:
             self
         """
+        if self._image is None and self._link is None and not (
+            self._styles & (_BOLD | _ITALICS | _STRIKETHROUGH | _CODE)
+        ):
+            return self
+        self._check_mutable()
         self._image = None
         self._link = None
-        self._code = False
-        self._italics = False
-        self._bold = False
-        self._strikethrough = False
+        self._styles &= _LINEBREAK
+        self._invalidate()
         return self
 
     def _apply_styles_from(self, text: Inline) -> Inline:
@@ -490,12 +782,62 @@ class Inline(Element):
         related to the behavior of is_text(). In other words, link, image, 
         and code information is not copied over.  
         """
-        self._bold = text._bold
-        self._italics = text._italics
-        self._strikethrough = text._strikethrough
-        self._linebreak = text._linebreak
+        mask = _BOLD | _ITALICS | _STRIKETHROUGH | _LINEBREAK
+        styles = (self._styles & ~mask) | (text._styles & mask)
+        if styles != self._styles:
+            self._check_mutable()
+            self._styles = styles
+            self._invalidate()
         return self
 
+    def _set_style(self, flag: int, enabled: bool) -> Inline:
+        """
+        A helper method which turns a single style flag on or off.
+        The render cache is only cleared when the style changes.
+
+        :param int flag:
+            the style flag to set (e.g., bold)
+        :param bool enabled:
+            whether the style should be applied
+        :return:
+            self
+        """
+        styles = self._styles | flag if enabled else self._styles & ~flag
+        if styles != self._styles:
+            self._check_mutable()
+            self._styles = styles
+            self._invalidate()
+        return self
+
+    def _set_link(self, link: None | str) -> Inline:
+        """
+        A helper method which sets the link of self. The render
+        cache is only cleared when the link changes.
+
+        :param None | str link:
+            the URL or path to apply to this Inline element
+        :return:
+            self
+        """
+        if link != self._link:
+            self._check_mutable()
+            self._link = link
+            self._invalidate()
+        return self
+
+    def _check_mutable(self) -> None:
+        """
+        A helper method which guards interned Inline elements
+        (see :meth:`intern`) from being changed.
+
+        :raises TypeError:
+            when self is an interned Inline element
+        """
+        if self._styles & _FROZEN:
+            raise TypeError(
+                f"Interned inline elements cannot be modified: {self._text!r}"
+            )
+
 
 class Block(Element):  # pylint: disable=too-few-public-methods
     """
@@ -505,6 +847,8 @@ class Block(Element):  # pylint: disable=too-few-public-methods
     tables (i.e., :code:`<table>`), and lists (e.g., :code:`<ol>`, :code:`<ul>`, etc.).
     """
 
+    __slots__ = ()
+
 
 class Code(Block):
     """
@@ -526,11 +870,15 @@ class Code(Block):
         the programming language for the code block; defaults to 'generic'
     """
 
+    __slots__ = ("_code", "_lang", "_backticks")
+
     def __init__(self, code: str | Code, lang: str = "generic"):
+        super().__init__()
         self._code = code
         self._lang = lang
         self._backticks = self._process_backticks(code)
 
+    @_cached
     def __str__(self) -> str:
         """
         Renders the code block as a markdown string. Markdown code
@@ -551,9 +899,7 @@ class Code(Block):
             the code block as a markdown string
         """
         ticks = "`" * self._backticks
-        code_block = f"{ticks}{self._lang}\n{self._code}\n{ticks}"
-        logger.debug("Rendered code block: %r", code_block)
-        return code_block
+        return f"{ticks}{self._lang}\n{self._code}\n{ticks}"
 
     def __repr__(self) -> str:
         """
@@ -627,13 +973,17 @@ class Heading(Block):
         the heading level between 1 and 6
     """
 
+    __slots__ = ("_text", "_level")
+
     def __init__(self, text: str | Inline | Iterable[Inline | str], level: int) -> None:
         if level < 1 or level > 6:
             raise ValueError(f"Heading level must be between 1 and 6 but was {level}")
+        super().__init__()
         self._text: list[Inline] = self._process_text(text)
         self._level: int = level
-        logger.debug("Created new heading: %r", self)
+        self._adopt(self._text)
 
+    @_cached
     def __str__(self) -> str:
         """
         Renders the heading as a markdown string. Markdown headings
@@ -650,9 +1000,7 @@ class Heading(Block):
             the heading as a markdown string
         """
         heading = [str(item) for item in self._text]
-        heading = f"{'#' * self._level} {''.join(heading)}"
-        logger.debug("Rendered heading: %r", heading)
-        return heading
+        return f"{'#' * self._level} {''.join(heading)}"
 
     def __repr__(self) -> str:
         """
@@ -678,6 +1026,19 @@ class Heading(Block):
         """
         return f"Heading(text={self._text!r}, level={self._level})"
 
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and its Inline
+        elements (and anything nested in them). See
+        :meth:`Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        for item in self._text:
+            yield from item._walk()
+
     @staticmethod
     def _process_text(text: str | Inline | Iterable[Inline | str]) -> list[Inline]:
         """
@@ -696,7 +1057,6 @@ class Heading(Block):
             processed = [
                 item if isinstance(item, Inline) else Inline(item) for item in text
             ]
-        logger.debug("Processed heading text: %r", processed)
         return processed
 
     def promote(self) -> Heading:
@@ -715,6 +1075,7 @@ class Heading(Block):
         """
         if self._level > 1:
             self._level -= 1
+            self._invalidate()
         return self
 
     def demote(self) -> Heading:
@@ -733,6 +1094,7 @@ class Heading(Block):
         """
         if self._level < 6:
             self._level += 1
+            self._invalidate()
         return self
 
     def get_text(self) -> str:
@@ -783,6 +1145,8 @@ class HorizontalRule(Block):
         from snakemd import HorizontalRule
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """
         Renders the horizontal rule as a markdown string. Markdown
@@ -793,9 +1157,7 @@ class HorizontalRule(Block):
         :return:
             the horizontal rule as a markdown string
         """
-        horizontal_rule = "***"
-        logger.debug("Rendered horizontal rule: %r", horizontal_rule)
-        return horizontal_rule
+        return "***"
 
     def __repr__(self) -> str:
         """
@@ -851,12 +1213,15 @@ class MDList(Block):
             Use :class:`snakemd.Checklist` template instead
     """
 
+    __slots__ = ("_items", "_ordered", "_checked", "_space")
+
     def __init__(
         self,
         items: Iterable[str | Inline | Block],
         ordered: bool = False,
         checked: None | bool | Iterable[bool] = None,
     ) -> None:
+        super().__init__()
         self._items: list[Block] = self._process_items(items)
         self._ordered: bool = ordered
         self._checked: bool | list[bool] = (
@@ -872,7 +1237,9 @@ class MDList(Block):
                 "match number of booleans supplied by checked parameter: "
                 f"{self._checked}"
             )
+        self._adopt(self._items)
 
+    @_cached
     def __str__(self) -> str:
         """
         Renders the markdown list as a markdown string. Markdown lists
@@ -901,7 +1268,8 @@ class MDList(Block):
         i = 1
         for item in self._items:
             if isinstance(item, MDList):
-                item._space = self._space + " " * self._get_indent_size(self._ordered, i)
+                indent = self._get_indent_size(self._ordered, i)
+                item._indent(self._space + " " * indent)
                 output.append(str(item))
             else:
                 # Create the start of the row based on `order` parameter
@@ -922,9 +1290,7 @@ class MDList(Block):
 
                 output.append(row)
                 i += 1
-        mdlist = "\n".join(output)
-        logger.debug("Rendered markdown list: %r", mdlist)
-        return mdlist
+        return "\n".join(output)
 
     def __repr__(self) -> str:
         """
@@ -950,6 +1316,32 @@ class MDList(Block):
             f")"
         )
 
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and every element
+        nested inside of the list. See :meth:`Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        for block in self._items:
+            yield from block._walk()
+
+    def _indent(self, space: str) -> None:
+        """
+        A helper method which sets the leading whitespace of self.
+        Nested lists are indented by their parent list at render
+        time, so the render cache is only cleared when the
+        indentation actually changes.
+
+        :param str space:
+            the whitespace to place in front of every list item
+        """
+        if self._space != space:
+            self._space = space
+            self._invalidate()
+
     @staticmethod
     def _process_items(items) -> list[Block]:
         """
@@ -1026,9 +1418,14 @@ class Paragraph(Block):
           styling, etc.)
     """
 
+    __slots__ = ("_content",)
+
     def __init__(self, content: str | Iterable[str | Inline]):
+        super().__init__()
         self._content: list[Inline] = self._process_content(content)
+        self._adopt(self._content)
 
+    @_cached
     def __str__(self) -> str:
         """
         Renders the paragraph as a markdown string. Markdown paragraphs
@@ -1068,6 +1465,19 @@ class Paragraph(Block):
         """
         return f"Paragraph(content={self._content!r})"
 
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and its Inline
+        elements (and anything nested in them). See
+        :meth:`Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        for item in self._content:
+            yield from item._walk()
+
     @staticmethod
     def _process_content(content) -> list[Inline]:
         """
@@ -1088,7 +1498,6 @@ class Paragraph(Block):
                     processed.append(Inline(item))
                 else:
                     processed.append(item)
-        logger.debug("Processed paragraph content: %r", processed)
         return processed
 
     def _replace_any(self, target: str, text: Inline, count: int = -1) -> Paragraph:
@@ -1114,6 +1523,7 @@ class Paragraph(Block):
             self
         """
         content: list[Inline] = []
+        replaced: list[Inline] = []
         for inline_text in self._content:
             # Skip inline elements that we don't care about
             if not inline_text.is_text() or target not in inline_text.get_text():
@@ -1121,6 +1531,7 @@ class Paragraph(Block):
                 continue
 
             # Split the inline element into pieces
+            replaced.append(inline_text)
             items = [
                 Inline(item)._apply_styles_from(inline_text)
                 for item in inline_text.get_text().split(target, count)
@@ -1142,6 +1553,118 @@ class Paragraph(Block):
             content[:-1] = map(lambda item: item.unbreakline(), content[:-1])
                 
         self._content = content
+        self._disown(replaced)
+        self._adopt(content)
+        self._invalidate()
+        return self
+
+    def _substitute(
+        self,
+        rules: Mapping[str, Callable[[Inline], Inline]],
+        count: int | Mapping[str, int] = -1,
+    ) -> Paragraph:
+        """
+        A helper method which replaces every target string in the
+        paragraph in a single pass. Unlike :meth:`_replace_any`,
+        all of the targets are found at once (see
+        :func:`_compile_targets`). Each match is passed to the rule
+        for its target as a new Inline element, which already has
+        the styles of the text it came from, and the rule returns
+        the Inline element to put in its place. The pattern is only
+        compiled once, so when a target runs out, its later matches
+        are left as text (i.e., shorter targets inside of them are
+        not replaced either).
+
+        :param Mapping[str, Callable[[Inline], Inline]] rules:
+            a rule for each target string
+        :param int | Mapping[str, int] count:
+            the number of times to replace each target; either one
+            limit for every target, or a limit per target (missing
+            targets are unlimited); defaults to -1 (all)
+        :return:
+            self
+        """
+        if isinstance(count, Mapping):
+            limits = {target: count.get(target, -1) for target in rules}
+        else:
+            limits = dict.fromkeys(rules, count)
+        targets = frozenset(target for target in rules if target and limits[target])
+        if not targets:
+            return self
+        pattern = _compile_targets(targets)
+        remaining = len(targets)
+
+        def find(inline: Inline) -> Iterator[tuple[int, int, Inline]]:
+            nonlocal remaining
+            if not remaining:
+                return
+            for match in pattern.finditer(inline.get_text()):
+                target = match.group()
+                # Skip targets that have run out rather than recompiling
+                if not limits[target]:
+                    continue
+                yield (
+                    match.start(),
+                    match.end(),
+                    rules[target](Inline(target)._apply_styles_from(inline)),
+                )
+                if limits[target] > 0:
+                    limits[target] -= 1
+                    if not limits[target]:
+                        remaining -= 1
+                        if not remaining:
+                            return
+
+        return self._rewrite(find)
+
+    def _rewrite(
+        self, find: Callable[[Inline], Iterable[tuple[int, int, Inline]]]
+    ) -> Paragraph:
+        """
+        A helper method which splits the text Inline elements of
+        the paragraph around matches and swaps in replacements, in
+        a single pass over the paragraph. The text between matches
+        keeps the styles of the original Inline element, and only
+        the Inline elements with matches are split. Code, images,
+        and links are skipped.
+
+        :param Callable[[Inline], Iterable[tuple[int, int, Inline]]] find:
+            a function which finds the matches in an Inline element,
+            in order, as the start and end of each match along with
+            the Inline element to put in its place
+        :return:
+            self
+        """
+        content: list[Inline] = []
+        replaced: list[Inline] = []
+        for inline in self._content:
+            if not isinstance(inline, Inline) or not inline.is_text():
+                content.append(inline)
+                continue
+            text = inline.get_text()
+            pieces: list[Inline] = []
+            position = 0
+            for start, end, replacement in find(inline):
+                if start > position:
+                    piece = Inline(text[position:start])
+                    pieces.append(piece._apply_styles_from(inline))
+                pieces.append(replacement)
+                position = end
+            if not pieces:
+                content.append(inline)
+                continue
+            if position < len(text):
+                pieces.append(Inline(text[position:])._apply_styles_from(inline))
+            # Only the last piece keeps the line break of the original
+            for piece in pieces[:-1]:
+                piece.unbreakline()
+            content.extend(pieces)
+            replaced.append(inline)
+        if replaced:
+            self._content = content
+            self._disown(replaced)
+            self._adopt(content)
+            self._invalidate()
         return self
 
     def add(self, text: str | Inline) -> Paragraph:
@@ -1162,6 +1685,71 @@ class Paragraph(Block):
         if isinstance(text, str):
             text = Inline(text)
         self._content.append(text)
+        self._adopt([text])
+        self._invalidate()
+        return self
+
+    def compact(self) -> Paragraph:
+        """
+        Shrinks the paragraph without changing how it renders.
+        Methods like :meth:`replace` and :meth:`insert_link` split
+        the text of a paragraph into many small Inline elements;
+        this method merges runs of adjacent unstyled Inline elements
+        into one and drops Inline elements that render nothing.
+        Styled Inline elements are kept as is, except that an
+        unstyled run may absorb a line break at its end.
+
+        Merged Inline elements are replaced by new ones, so later
+        changes to the originals no longer affect the paragraph.
+
+        .. doctest:: paragraph
+
+            >>> from snakemd import Inline
+            >>> paragraph = Paragraph(["Hello", ", ", "world", Inline("!", bold=True)])
+            >>> paragraph.compact()
+            Paragraph(content=[Inline(text='Hello, world',...), Inline(text='!',...)])
+            >>> str(paragraph)
+            'Hello, world**!**'
+
+        .. versionadded:: 2.5
+            Included to cut the memory and render time of edited paragraphs
+
+        :return:
+            self
+        """
+        content: list[Inline] = []
+        removed: list[Inline] = []
+        run: list[Inline] = []
+
+        def flush() -> None:
+            if len(run) > 1:
+                text = "".join(item._text for item in run)
+                linebreak = bool(run[-1]._styles & _LINEBREAK)
+                content.append(Inline(text, linebreak=linebreak))
+                removed.extend(run)
+            else:
+                content.extend(run)
+            run.clear()
+
+        for item in self._content:
+            if isinstance(item, Inline) and not (item._image or item._link):
+                styles = item._styles & _MARKUP
+                if not styles and not item._text:
+                    removed.append(item)  # renders as an empty string
+                    continue
+                if styles in (0, _LINEBREAK):
+                    run.append(item)
+                    if styles:
+                        flush()  # nothing can follow a line break
+                    continue
+            flush()
+            content.append(item)
+        flush()
+        if removed:
+            # The rendered paragraph is unchanged, so the cache is kept
+            self._content = content
+            self._disown(removed)
+            self._adopt(content)
         return self
 
     def replace(self, target: str, replacement: str, count: int = -1) -> Paragraph:
@@ -1216,6 +1804,244 @@ class Paragraph(Block):
         """
         return self._replace_any(target, Inline(target, link=link), count)
 
+    def replace_many(
+        self, replacements: Mapping[str, str], count: int | Mapping[str, int] = -1
+    ) -> Paragraph:
+        """
+        A convenience method which replaces many target strings at
+        once. Unlike calling :meth:`replace` once per target, the
+        paragraph is only searched once, no matter how many targets
+        there are. When targets overlap, the longest target at the
+        earliest position wins, and replacements are never searched
+        again (e.g., swapping two words works as expected). Once a
+        target reaches its count, later matches of it are left as is.
+
+        .. doctest:: paragraph
+
+            >>> paragraph = Paragraph("I come in piece, not in war")
+            >>> paragraph.replace_many({"piece": "peace", "war": "anger"})
+            Paragraph(content=[...])
+            >>> str(paragraph)
+            'I come in peace, not in anger'
+
+        .. versionadded:: 2.5
+            Included to speed up large numbers of replacements
+
+        :param Mapping[str, str] replacements:
+            the string to insert in place of each target string
+        :param int | Mapping[str, int] count:
+            the number of times to replace each target; either one
+            limit for every target, or a limit per target (missing
+            targets are unlimited); defaults to -1 (all)
+        :return:
+            self
+        """
+
+        def rule(text: str) -> Callable[[Inline], Inline]:
+            return lambda inline: Inline(text)._apply_styles_from(inline)
+
+        rules = {target: rule(text) for target, text in replacements.items()}
+        return self._substitute(rules, count)
+
+    def insert_links(
+        self, links: Mapping[str, str], count: int | Mapping[str, int] = -1
+    ) -> Paragraph:
+        """
+        A convenience method which inserts links for many target
+        strings at once (e.g., a glossary of terms). Like
+        :meth:`replace_many`, the paragraph is only searched once,
+        and the longest target at the earliest position wins. Like
+        :meth:`insert_link`, text that is already linked is skipped.
+
+        .. doctest:: paragraph
+
+            >>> paragraph = Paragraph("SnakeMD is written in Python")
+            >>> paragraph.insert_links({
+            ...     "SnakeMD": "https://snakemd.io",
+            ...     "Python": "https://python.org"
+            ... })
+            Paragraph(content=[...])
+            >>> str(paragraph)
+            '[SnakeMD](https://snakemd.io) is written in [Python](https://python.org)'
+
+        .. versionadded:: 2.5
+            Included to speed up linking many terms
+
+        :param Mapping[str, str] links:
+            the url or path for each target string
+        :param int | Mapping[str, int] count:
+            the number of links to insert for each target; either one
+            limit for every target, or a limit per target (missing
+            targets are unlimited); defaults to -1 (all)
+        :return:
+            self
+        """
+        rules = {
+            target: lambda inline, url=url: inline.link(url)
+            for target, url in links.items()
+        }
+        return self._substitute(rules, count)
+
+    def apply_rules(
+        self,
+        rules: Mapping[str, Callable[[Inline], Inline]],
+        count: int | Mapping[str, int] = -1,
+    ) -> Paragraph:
+        """
+        A general version of :meth:`replace_many` which lets each
+        target string be transformed by a function, such as one of
+        the styling methods of :class:`snakemd.Inline`. Each match
+        is passed to the function as a new Inline element with the
+        styles of the text around it, and the function returns the
+        Inline element to put in its place.
+
+        .. doctest:: paragraph
+
+            >>> from snakemd import Inline
+            >>> paragraph = Paragraph("Always test your code")
+            >>> paragraph.apply_rules({"Always": Inline.bold, "code": Inline.code})
+            Paragraph(content=[...])
+            >>> str(paragraph)
+            '**Always** test your `code`'
+
+        .. versionadded:: 2.5
+            Included to support styling many strings at once
+
+        :param Mapping[str, Callable[[Inline], Inline]] rules:
+            a function for each target string which receives a match
+            as an Inline element and returns its replacement
+        :param int | Mapping[str, int] count:
+            the number of times to apply each rule; either one
+            limit for every target, or a limit per target (missing
+            targets are unlimited); defaults to -1 (all)
+        :return:
+            self
+        """
+        return self._substitute(rules, count)
+
+    def sub(
+        self,
+        pattern: str | re.Pattern,
+        repl: str | Callable[[re.Match], str | Inline],
+        count: int = -1,
+    ) -> Paragraph:
+        """
+        A regular expression version of :meth:`replace`, which is
+        modeled after :py:func:`re.sub`. Every match in the text of
+        the paragraph is replaced, keeping the styles of the text
+        around it, while code, images, and links are skipped. Like
+        :py:func:`re.sub`, the replacement may be a template with
+        backreferences (e.g., :code:`r"\\1"`), or a function which
+        receives the match and returns the replacement. Functions
+        may also return an Inline element, which is used as is.
+
+        Patterns given as strings are compiled once and cached, so
+        they are cheap to reuse across many paragraphs.
+
+        .. doctest:: paragraph
+
+            >>> paragraph = Paragraph("Released on 2023-04-01")
+            >>> paragraph.sub(r"(\\d+)-(\\d+)-(\\d+)", r"\\2/\\3/\\1")
+            Paragraph(content=[...])
+            >>> str(paragraph)
+            'Released on 04/01/2023'
+
+        .. versionadded:: 2.5
+            Included to support replacing patterns of text
+
+        :param str | re.Pattern pattern:
+            the regular expression to find
+        :param str | Callable[[re.Match], str | Inline] repl:
+            the replacement template, or a function which converts
+            a match to its replacement
+        :param int count:
+            the number of matches to replace; defaults to -1 (all)
+        :return:
+            self
+        """
+
+        def make(match: re.Match, inline: Inline) -> Inline:
+            value = repl(match) if callable(repl) else match.expand(repl)
+            if isinstance(value, Inline):
+                return value
+            return Inline(value)._apply_styles_from(inline)
+
+        return self._sub(pattern, make, count)
+
+    def link_pattern(
+        self, pattern: str | re.Pattern, url_template: str, count: int = -1
+    ) -> Paragraph:
+        """
+        A regular expression version of :meth:`insert_link`, which
+        links every match of a pattern. The url of each link is built
+        from the match using a template with backreferences, the same
+        as :meth:`sub` (e.g., :code:`r"\\g<0>"` for the whole match).
+        Text that is already linked is skipped.
+
+        .. doctest:: paragraph
+
+            >>> paragraph = Paragraph("Fixed in ABC-1234 and ABC-99")
+            >>> paragraph.link_pattern(r"ABC-(\\d+)", r"/tickets/\\1")
+            Paragraph(content=[...])
+            >>> str(paragraph)
+            'Fixed in [ABC-1234](/tickets/1234) and [ABC-99](/tickets/99)'
+
+        .. versionadded:: 2.5
+            Included to support linking patterns of text (e.g., ticket IDs)
+
+        :param str | re.Pattern pattern:
+            the regular expression to link
+        :param str url_template:
+            the url or path of each link, which may refer to groups
+            of the match
+        :param int count:
+            the number of links to insert; defaults to -1 (all)
+        :return:
+            self
+        """
+
+        def make(match: re.Match, inline: Inline) -> Inline:
+            link = Inline(match.group(), link=match.expand(url_template))
+            return link._apply_styles_from(inline)
+
+        return self._sub(pattern, make, count)
+
+    def _sub(
+        self,
+        pattern: str | re.Pattern,
+        make: Callable[[re.Match, Inline], Inline],
+        count: int = -1,
+    ) -> Paragraph:
+        """
+        A helper method which replaces the matches of a regular
+        expression (see :meth:`sub` and :meth:`link_pattern`).
+
+        :param str | re.Pattern pattern:
+            the regular expression to find
+        :param Callable[[re.Match, Inline], Inline] make:
+            a function which converts a match and the Inline element
+            it was found in to the Inline element to put in its place
+        :param int count:
+            the number of matches to replace; defaults to -1 (all)
+        :return:
+            self
+        """
+        if isinstance(pattern, str):
+            pattern = _compile_pattern(pattern)
+        remaining = count
+
+        def find(inline: Inline) -> Iterator[tuple[int, int, Inline]]:
+            nonlocal remaining
+            if not remaining:
+                return
+            for match in pattern.finditer(inline.get_text()):
+                yield match.start(), match.end(), make(match, inline)
+                remaining -= 1
+                if not remaining:
+                    return
+
+        return self._rewrite(find)
+
     def replace_link(
         self, target_link: str, replacement_link: str, count: int = -1
     ) -> Paragraph:
@@ -1268,10 +2094,15 @@ class Quote(Block):
           (i.e., all items will be separated by newlines)
     """
 
+    __slots__ = ("_lines", "_depth")
+
     def __init__(self, content: str | Iterable[str | Inline | Block]) -> None:
+        super().__init__()
         self._lines: list[Block] = self._process_content(content)
         self._depth = 1
+        self._adopt(self._lines)
 
+    @_cached
     def __str__(self) -> str:
         """
         Renders the quote as a markdown string. Markdown quotes
@@ -1308,7 +2139,7 @@ class Quote(Block):
         quote_markers = f"{'> ' * self._depth}"
         for line in self._lines:
             if isinstance(line, Quote):
-                line._depth = self._depth + 1  # pylint: disable=W0201
+                line._nest(self._depth + 1)
                 formatted_lines.extend([quote_markers, str(line), quote_markers])
             else:
                 split = f"\n{quote_markers}".join(str(line).splitlines())
@@ -1318,6 +2149,32 @@ class Quote(Block):
     def __repr__(self) -> str:
         return f"Quote(content={self._lines!r})"
 
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and every element
+        nested inside of the quote. See :meth:`Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        for block in self._lines:
+            yield from block._walk()
+
+    def _nest(self, depth: int) -> None:
+        """
+        A helper method which sets the nesting depth of self.
+        Nested quotes are configured by their parent quote at
+        render time, so the render cache is only cleared when
+        the depth actually changes.
+
+        :param int depth:
+            the number of quote markers to place on each line
+        """
+        if self._depth != depth:
+            self._depth = depth
+            self._invalidate()
+
     @staticmethod
     def _process_content(lines) -> list[Block]:
         """
@@ -1341,7 +2198,6 @@ class Quote(Block):
                     processed_lines.append(Paragraph([line]))
                 else:
                     processed_lines.append(line)
-        logger.debug("Processed quote lines: %r", processed_lines)
         return processed_lines
 
 
@@ -1355,7 +2211,10 @@ class Raw(Block):
     :param str text: the raw text to append to a Document
     """
 
+    __slots__ = ("_text",)
+
     def __init__(self, text: str) -> None:
+        super().__init__()
         self._text = text
 
     def __str__(self) -> str:
@@ -1372,6 +2231,98 @@ class Raw(Block):
         return f"Raw(text={self._text!r})"
 
 
+def _row_format(widths: list[int], indent: int = 0) -> str:
+    """
+    A helper function which builds a format string that pads a
+    row of rendered cells to the column widths, for example:
+    :code:`"| {:<5} | {:<8} |"`.
+
+    :param list[int] widths:
+        the width of each column
+    :param int indent:
+        indent size for the row; defaults to 0
+    :return:
+        a format string which accepts one argument per column
+    """
+    columns = " | ".join(f"{{:<{width}}}" for width in widths)
+    return f"{' ' * indent}| {columns} |"
+
+
+def _separator_row(
+    widths: list[int], align: None | Iterable[Table.Align] = None, indent: int = 0
+) -> str:
+    """
+    A helper function which renders the row that separates the
+    header from the body of a table, including the alignment
+    markers.
+
+    :param list[int] widths:
+        the width of each column
+    :param None | Iterable[Table.Align] align:
+        the column alignment; defaults to None
+    :param int indent:
+        indent size for the row; defaults to 0
+    :return:
+        the alignment row as a markdown string
+    """
+    if not align:
+        dashes = " | ".join("-" * width for width in widths)
+        return f"{' ' * indent}| {dashes} |"
+    meta = []
+    for alignment, width in zip(align, widths):
+        if alignment == Table.Align.LEFT:
+            meta.append(f":{'-' * (width - 1)}")
+        elif alignment == Table.Align.RIGHT:
+            meta.append(f"{'-' * (width - 1)}:")
+        else:
+            meta.append(f":{'-' * (width - 2)}:")
+    return f"{' ' * indent}| {' | '.join(meta)} |"
+
+
+class _Columns:
+    """
+    A read-only view of a table body stored column by column,
+    as built by :meth:`Table.from_columns`. Every value is already
+    rendered to a string, so there are no per-cell elements. For
+    reading, the view behaves like a list of rows.
+
+    :param list[list[str]] columns:
+        the rendered values of each column
+    :param list[int] widths:
+        the width of the widest value in each column
+    """
+
+    __slots__ = ("columns", "widths")
+
+    def __init__(self, columns: list[list[str]], widths: list[int]) -> None:
+        self.columns = columns
+        self.widths = widths
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def __getitem__(self, index: int | slice) -> list[str] | list[list[str]]:
+        if isinstance(index, slice):
+            return [list(row) for row in zip(*(col[index] for col in self.columns))]
+        return [column[index] for column in self.columns]
+
+    def __iter__(self) -> Iterator[list[str]]:
+        return map(list, self.rows())
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def rows(self) -> Iterator[tuple[str, ...]]:
+        """
+        Iterates over the rows of the view without copying them
+        into lists.
+
+        :return:
+            an iterator over the rows as tuples
+        """
+        return zip(*self.columns)
+
+
 class Table(Block):
     """
     A table is a standalone block of rows and columns. Data is rendered
@@ -1395,6 +2346,17 @@ class Table(Block):
         indent size for the whole table; defaults to 0
     """
 
+    __slots__ = (
+        "_header",
+        "_body",
+        "_cells",
+        "_widths",
+        "_lengths",
+        "_plan",
+        "_align",
+        "_indent",
+    )
+
     class Align(Enum):
         """
         Align is an enum only used by the Table class to specify the alignment
@@ -1412,7 +2374,7 @@ class Table(Block):
         align: None | Iterable[Align] = None,
         indent: int = 0,
     ) -> None:
-        logger.debug("Initializing table: (%r, %r, %r)", header, body, align)
+        super().__init__()
         self._header: list[Paragraph]
         self._body: list[list[Paragraph]]
         self._header, self._body = self._process_table(header, body or [])
@@ -1422,10 +2384,17 @@ class Table(Block):
             raise ValueError("Table rows are not all the same length")
         if body and len(self._header) != len(self._body[0]):
             raise ValueError("Table header and rows have different lengths")
-        self._widths: list[int] = self._process_widths(self._header, self._body)
+        self._cells: tuple[list[str], list[list[str]] | _Columns] | None = None
+        self._widths: list[int] | None = None
+        self._lengths: list[Counter] | None = None
+        self._plan: tuple[str, str] | None = None
         self._align = align
         self._indent = indent
+        self._adopt(self._header)
+        for row in self._body:
+            self._adopt(row)
 
+    @_cached
     def __str__(self) -> str:
         """
         Renders the table as a markdown string. Table markdown
@@ -1445,30 +2414,7 @@ class Table(Block):
         :return:
             a table as a markdown string
         """
-        rows = []
-        header = [
-            str(item).ljust(self._widths[i]) for i, item in enumerate(self._header)
-        ]
-        body = [
-            [str(item).ljust(self._widths[i]) for i, item in enumerate(row)]
-            for row in self._body
-        ]
-        rows.append(f"{' ' * self._indent}| {' | '.join(header)} |")
-        if not self._align:
-            dashes = " | ".join("-" * width for width in self._widths)
-            rows.append(f"{' ' * self._indent}| {dashes} |")
-        else:
-            meta = []
-            for align, width in zip(self._align, self._widths):
-                if align == Table.Align.LEFT:
-                    meta.append(f":{'-' * (width - 1)}")
-                elif align == Table.Align.RIGHT:
-                    meta.append(f"{'-' * (width - 1)}:")
-                else:
-                    meta.append(f":{'-' * (width - 2)}:")
-            rows.append(f"{' ' * self._indent}| {' | '.join(meta)} |")
-        rows.extend((f"{' ' * self._indent}| {' | '.join(row)} |" for row in body))
-        return "\n".join(rows)
+        return "\n".join(self._iter_lines())
 
     def __repr__(self) -> str:
         return (
@@ -1480,6 +2426,474 @@ class Table(Block):
             f")"
         )
 
+    @classmethod
+    def from_columns(
+        cls,
+        header: Iterable[str | Inline | Paragraph],
+        columns: Iterable[Iterable],
+        formats: None | Iterable[None | str | Callable[[object], str]] = None,
+        align: None | Iterable[Align] = None,
+        indent: int = 0,
+    ) -> Table:
+        """
+        Creates a table from columns of data rather than rows.
+        Each column may be any sequence of values, such as a list,
+        an :py:class:`array.array`, an object supporting the buffer
+        protocol, or an array-like object (e.g., a NumPy array).
+        Values are rendered to strings column by column as the
+        table is built, and the body is stored column-wise without
+        creating any elements per cell. As a result, this is much
+        cheaper than :meth:`snakemd.Document.add_table` for large
+        numeric tables. However, cells cannot be styled.
+
+        When NumPy is installed, columns of integers, booleans, and
+        strings without a format are converted in bulk. Otherwise,
+        values are converted one at a time using :py:class:`str`.
+
+        .. doctest:: table
+
+            >>> from array import array
+            >>> table = Table.from_columns(
+            ...     ["Player", "Goals", "Shooting"],
+            ...     [["Crosby", "McDavid"], array("i", [42, 64]), [0.153, 0.2]],
+            ...     formats=[None, None, ".1%"]
+            ... )
+            >>> print(table)
+            | Player  | Goals | Shooting |
+            | ------- | ----- | -------- |
+            | Crosby  | 42    | 15.3%    |
+            | McDavid | 64    | 20.0%    |
+
+        .. versionadded:: 2.5
+            Included to support large tables of columnar data
+
+        :raises ValueError:
+
+            - when the number of columns does not match the header
+            - when the columns are of varying lengths
+            - when the number of formats does not match the header
+        :param Iterable[str | Inline | Paragraph] header:
+            the header row of labels
+        :param Iterable[Iterable] columns:
+            the columns of data
+        :param None | Iterable[None | str | Callable[[object], str]] formats:
+            the format of each column, given as either a format
+            specification for :py:func:`format` (e.g., :code:`".2f"`),
+            a function which converts a value to a string, or None
+            to use :py:class:`str`; defaults to None
+        :param None | Iterable[Align] align:
+            the column alignment; defaults to None
+        :param int indent:
+            indent size for the whole table; defaults to 0
+        :return:
+            the table
+        """
+        table = cls(header, align=align, indent=indent)
+        columns = list(columns)
+        formats = [None] * len(columns) if formats is None else list(formats)
+        if len(columns) != len(table._header):
+            raise ValueError(
+                f"Unable to add {len(columns)} columns "
+                f"to table with header of width {len(table._header)}"
+            )
+        if len(formats) != len(columns):
+            raise ValueError(
+                f"Expected {len(columns)} formats but received {len(formats)}"
+            )
+        rendered, widths = [], []
+        for column, spec in zip(columns, formats):
+            cells, width = cls._process_column(column, spec)
+            rendered.append(cells)
+            widths.append(width)
+        if rendered and any(len(cells) != len(rendered[0]) for cells in rendered):
+            raise ValueError("Table columns are not all the same length")
+        table._body = _Columns(rendered, widths)
+        return table
+
+    @staticmethod
+    def _process_column(
+        column: Iterable, spec: None | str | Callable[[object], str]
+    ) -> tuple[list[str], int]:
+        """
+        Renders a column of values to strings in bulk and measures
+        the widest one. Array-like columns are converted using NumPy
+        when it is installed; objects supporting the buffer protocol
+        are unpacked using :py:class:`memoryview`.
+
+        :param Iterable column:
+            the column of values
+        :param None | str | Callable[[object], str] spec:
+            the format of the column
+        :return:
+            the rendered column and its width
+        """
+        if hasattr(column, "__array__"):
+            # array-like columns come from numpy (or libraries built on
+            # it), in which case numpy has already been imported
+            numpy = sys.modules.get("numpy")
+            if numpy is not None:
+                array = numpy.asarray(column)
+                if spec is None and array.ndim == 1 and array.dtype.kind in "biuU":
+                    cells = array.astype(str)
+                    width = int(numpy.char.str_len(cells).max()) if len(cells) else 0
+                    return cells.tolist(), width
+                column = array.tolist()
+        if not isinstance(column, (list, tuple)):
+            try:
+                column = memoryview(column).tolist()
+            except (TypeError, ValueError, NotImplementedError):
+                column = list(column)
+        if spec is None:
+            cells = list(map(str, column))
+        elif callable(spec):
+            cells = list(map(spec, column))
+        else:
+            cells = [format(value, spec) for value in column]
+        return cells, max(map(len, cells), default=0)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[object],
+        columns: None | Iterable[str] = None,
+        align: None | Iterable[Align] = None,
+        indent: int = 0,
+    ) -> Table:
+        """
+        Creates a table from records, where each record becomes a
+        row. Records may be dictionaries (or any other mapping),
+        named tuples, dataclasses, or any object with attributes.
+        By default, the header is inferred from the first record
+        (i.e., the keys of a dictionary, or the fields of a named
+        tuple or dataclass). Otherwise, the columns select which
+        fields to include and in what order.
+
+        Records are streamed into the table without building an
+        intermediate list of rows. Fields are read using a getter
+        (see :py:mod:`operator`) that is built once per type of
+        record, so even millions of records are cheap to convert.
+        Values are rendered using :py:class:`str`.
+
+        .. doctest:: table
+
+            >>> from collections import namedtuple
+            >>> Player = namedtuple("Player", ["name", "goals"])
+            >>> players = [Player("Crosby", 42), Player("McDavid", 64)]
+            >>> table = Table.from_records(players)
+            >>> print(table)
+            | name    | goals |
+            | ------- | ----- |
+            | Crosby  | 42    |
+            | McDavid | 64    |
+            >>> records = [{"name": "Crosby", "team": "PIT", "goals": 42}]
+            >>> print(Table.from_records(records, columns=["team", "goals"]))
+            | team | goals |
+            | ---- | ----- |
+            | PIT  | 42    |
+
+        .. versionadded:: 2.5
+            Included to support building tables from structured data
+
+        :raises ValueError:
+
+            - when columns is None and the records are empty
+            - when columns is None and the fields of the first
+              record cannot be inferred
+            - when a record is missing one of the columns
+        :param Iterable[object] records:
+            the records of data, one per row
+        :param None | Iterable[str] columns:
+            the names of the fields to include as columns; defaults
+            to None which uses every field of the first record
+        :param None | Iterable[Align] align:
+            the column alignment; defaults to None
+        :param int indent:
+            indent size for the whole table; defaults to 0
+        :return:
+            the table
+        """
+        iterator = iter(records)
+        if columns is None:
+            first = next(iterator, None)
+            if first is None:
+                raise ValueError("Unable to infer columns from empty records")
+            columns = cls._get_fields(first)
+            iterator = itertools.chain((first,), iterator)
+        columns = list(columns)
+        table = cls(columns, align=align, indent=indent)
+        return table.add_rows(cls._iter_records(iterator, columns))
+
+    @staticmethod
+    def _get_fields(record: object) -> list[str]:
+        """
+        A helper method which infers the names of the fields of a
+        record (see :meth:`from_records`).
+
+        :raises ValueError:
+            when the fields of the record cannot be inferred
+        :param object record:
+            the record
+        :return:
+            the names of the fields of the record
+        """
+        if isinstance(record, Mapping):
+            return [str(key) for key in record]
+        if isinstance(record, tuple) and hasattr(record, "_fields"):
+            return list(record._fields)
+        if dataclasses.is_dataclass(record) and not isinstance(record, type):
+            return [field.name for field in dataclasses.fields(record)]
+        raise ValueError(
+            f"Unable to infer columns from record of type {type(record).__name__}; "
+            f"provide the columns instead"
+        )
+
+    @staticmethod
+    def _get_extractor(
+        record_type: type, columns: list[str]
+    ) -> Callable[[object], tuple]:
+        """
+        A helper method which builds a function that reads the
+        given fields from records of the given type, in order.
+        Mappings are read by key, named tuples by position, and
+        anything else by attribute.
+
+        :param type record_type:
+            the type of the records
+        :param list[str] columns:
+            the names of the fields to read
+        :return:
+            a function which returns the fields of a record as a tuple
+        """
+        if issubclass(record_type, Mapping):
+            getter = operator.itemgetter(*columns)
+        elif issubclass(record_type, tuple) and hasattr(record_type, "_fields"):
+            fields = record_type._fields
+            if all(column in fields for column in columns):
+                getter = operator.itemgetter(*map(fields.index, columns))
+            else:
+                getter = operator.attrgetter(*columns)
+        else:
+            getter = operator.attrgetter(*columns)
+        if len(columns) == 1:
+            return lambda record: (getter(record),)
+        return getter
+
+    @classmethod
+    def _iter_records(
+        cls, records: Iterator[object], columns: list[str]
+    ) -> Iterator[tuple]:
+        """
+        A helper method which converts records to rows, building
+        one extractor per type of record (see :meth:`from_records`).
+
+        :raises ValueError:
+            when a record is missing one of the columns
+        :param Iterator[object] records:
+            the records of data
+        :param list[str] columns:
+            the names of the fields to read
+        :return:
+            an iterator over the rows
+        """
+        extractors: dict[type, Callable[[object], tuple]] = {}
+        for record in records:
+            record_type = type(record)
+            if (extract := extractors.get(record_type)) is None:
+                extract = cls._get_extractor(record_type, columns)
+                extractors[record_type] = extract
+            try:
+                yield extract(record)
+            except (KeyError, AttributeError) as error:
+                raise ValueError(
+                    f"Unable to read columns {columns} from record {record!r}"
+                ) from error
+
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and every element
+        nested inside of the cells of the table, header first.
+        Cells that are plain strings are skipped. See
+        :meth:`Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        if isinstance(self._body, _Columns):
+            rows = [self._header]
+        else:
+            rows = itertools.chain([self._header], self._body)
+        for cell in itertools.chain.from_iterable(rows):
+            if isinstance(cell, Element):
+                yield from cell._walk()
+
+    def _wrap_cells(self, pattern: re.Pattern) -> None:
+        """
+        A helper method which wraps every plain string cell that
+        matches the pattern in a Paragraph, so the cell can be edited
+        like any other (see :meth:`snakemd.Document.autolink`).
+        The table renders the same either way.
+
+        :param re.Pattern pattern:
+            the pattern that selects the cells to wrap
+        """
+
+        def matches(cell) -> bool:
+            return isinstance(cell, str) and pattern.search(cell) is not None
+
+        def wrap(row: list) -> list:
+            if not any(map(matches, row)):
+                return row
+            # rows may be shared with the rendered cells, so replace them
+            cells = [Paragraph([cell]) if matches(cell) else cell for cell in row]
+            self._adopt(new for new, cell in zip(cells, row) if new is not cell)
+            return cells
+
+        self._header = wrap(self._header)
+        if isinstance(self._body, _Columns):
+            values = itertools.chain.from_iterable(self._body.columns)
+            if not any(map(matches, values)):
+                return
+            self._materialize()
+        self._body = [wrap(row) for row in self._body]
+
+    def _materialize(self) -> None:
+        """
+        A helper method which converts a column-wise body
+        (see :meth:`from_columns`) into a list of rows, so it can
+        be modified like any other table.
+        """
+        if isinstance(self._body, _Columns):
+            self._body = [list(row) for row in self._body.rows()]
+            self._cells = None
+            self._widths = None
+            self._lengths = None
+            self._plan = None
+
+    def _iter_lines(self) -> Iterator[str]:
+        """
+        A helper method which renders the table one line at a time
+        (i.e., the header, the alignment row, and then each row of
+        the body).
+
+        :return:
+            an iterator over the lines of the table
+        """
+        header, body = self._get_cells()
+        row_format, separator = self._get_plan()
+        yield row_format.format(*header)
+        yield separator
+        rows = body.rows() if isinstance(body, _Columns) else body
+        yield from itertools.starmap(row_format.format, rows)
+
+    def _get_cells(self) -> tuple[list[str], list[list[str]] | _Columns]:
+        """
+        A helper method which renders every cell of the table
+        exactly once and measures the column widths along the way.
+        The rendered cells are kept until the table or one of its
+        cells changes. Column-wise bodies are already rendered,
+        so they are reused as is.
+
+        :return:
+            the rendered header and the rendered rows of the body
+        """
+        if self._cells is None:
+            header = [str(item) for item in self._header]
+            if isinstance(self._body, _Columns):
+                body = self._body
+                widths = list(map(max, map(len, header), body.widths))
+            else:
+                body = [list(map(str, row)) for row in self._body]
+                widths = self._process_widths(header, body)
+            self._widths = widths
+            self._cells = (header, body)
+            self._plan = None
+        return self._cells
+
+    def _get_plan(self) -> tuple[str, str]:
+        """
+        A helper method which builds the format string for a row
+        of the table and the alignment row, both of which depend
+        only on the column widths. The plan is kept until the
+        column widths change.
+
+        :return:
+            the row format string and the rendered alignment row
+        """
+        if self._plan is None:
+            self._get_cells()
+            self._plan = (
+                _row_format(self._widths, self._indent),
+                _separator_row(self._widths, self._align, self._indent),
+            )
+        return self._plan
+
+    def _render_compact(self) -> str:
+        """
+        A helper method which renders the table without padding
+        any of the cells, and with the shortest valid alignment
+        row (e.g., :code:`|:-|-:|`). The table displays the same
+        as the padded version, but it may be much smaller.
+
+        :return:
+            the table as a compact markdown string
+        """
+        header, body = self._get_cells()
+        indent = " " * self._indent
+        if not self._align:
+            markers = ["-"] * len(header)
+        else:
+            shortest = {Table.Align.LEFT: ":-", Table.Align.RIGHT: "-:"}
+            markers = [
+                shortest.get(align, ":-:") for align, _ in zip(self._align, header)
+            ]
+        rows = body.rows() if isinstance(body, _Columns) else body
+        lines = [header, markers]
+        return "\n".join(
+            f"{indent}|{'|'.join(row)}|" for row in itertools.chain(lines, rows)
+        )
+
+    def _invalidate(self) -> None:
+        """
+        A helper method which clears the rendered cells and column
+        widths of the table along with its render cache. Called
+        whenever one of the cells changes.
+        """
+        self._cells = None
+        self._widths = None
+        self._lengths = None
+        self._plan = None
+        super()._invalidate()
+
+    def _iter_chunks(self, size: int) -> Iterator[str]:
+        """
+        A helper method which renders the table in pieces of
+        at most size lines. See :meth:`snakemd.Document.aiter_render`.
+
+        :param int size:
+            the maximum number of lines per piece
+        :return:
+            an iterator over the pieces of the table
+        """
+        if self._cache is not None:
+            yield self._cache
+            return
+        lines = self._iter_lines()
+        separator = ""
+        while batch := list(itertools.islice(lines, size)):
+            yield separator + "\n".join(batch)
+            separator = "\n"
+
+    def _count_cells(self) -> int:
+        """
+        A helper method which counts the cells in the table,
+        including the header. See :func:`snakemd.instrument`.
+
+        :return:
+            the number of cells in the table
+        """
+        return len(self._header) * (len(self._body) + 1)
+
     @staticmethod
     def _process_table(
         header, body
@@ -1507,7 +2921,6 @@ class Table(Block):
                 processed_header.append(Paragraph([item]))
             else:
                 processed_header.append(item)
-        logger.debug("Processed header input: %r", processed_header)
 
         # Process body
         for row in body:
@@ -1518,7 +2931,6 @@ class Table(Block):
                 else:
                     processed_row.append(item)
             processed_body.append(processed_row)
-        logger.debug("Processed table body: %r", processed_body)
 
         return processed_header, processed_body
 
@@ -1542,6 +2954,94 @@ class Table(Block):
                     widths[i] = width
         return widths
 
+    def add_rows(self, rows: Iterable[Iterable[str | Inline | Paragraph]]) -> Table:
+        """
+        A convenience method which adds many rows to the end of the
+        table at once. Rows may come from any iterable, including
+        generators, and are consumed in batches. Compared to calling
+        :meth:`add_row` for every row, the rows are checked and the
+        column widths are updated once per batch rather than once
+        per row.
+
+        .. doctest:: table
+
+            >>> table = Table(["Rank", "Player"])
+            >>> table.add_rows([f"{i}", name] for i, name in enumerate(["Crosby"]))
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(table)
+            | Rank | Player |
+            | ---- | ------ |
+            | 0    | Crosby |
+
+        .. versionadded:: 2.5
+            Included to speed up building large tables row-by-row
+
+        :raises ValueError:
+            when any row is not the same width as the table header,
+            in which case none of the rows are added
+        :param Iterable[Iterable[str | Inline | Paragraph]] rows:
+            the rows of data
+        :return:
+            self
+        """
+        self._materialize()
+        columns = len(self._header)
+        start = len(self._body)
+        iterator = iter(rows)
+        while batch := [list(row) for row in itertools.islice(iterator, 4096)]:
+            if any(len(row) != columns for row in batch):
+                width = next(len(row) for row in batch if len(row) != columns)
+                if len(self._body) > start:
+                    self._disown(itertools.chain.from_iterable(self._body[start:]))
+                    del self._body[start:]
+                    self._invalidate()
+                raise ValueError(
+                    f"Unable to add row with width {width} "
+                    f"to table with header of width {columns}"
+                )
+            self._body.extend(batch)
+            if set(map(type, itertools.chain.from_iterable(batch))) - {str}:
+                self._adopt(itertools.chain.from_iterable(batch))
+            if self._cells is not None:
+                cells = [list(map(str, row)) for row in batch]
+                self._cells[1].extend(cells)
+                widths = [
+                    max(width, *map(len, column))
+                    for width, column in zip(self._widths, zip(*cells))
+                ]
+                if widths != self._widths:
+                    self._widths = widths
+                    self._plan = None
+                if self._lengths is not None:
+                    for counter, column in zip(self._lengths, zip(*cells)):
+                        counter.update(map(len, column))
+        super()._invalidate()
+        return self
+
+    def _extend(self, rows: list[list[str]], widths: list[int]) -> None:
+        """
+        A helper method which appends rows of plain strings that
+        have already been checked against the header and measured,
+        such as rows parsed in bulk from a CSV file. Because the
+        rows only contain strings, they double as their own
+        rendered cells, so nothing is rendered or measured again.
+
+        :param list[list[str]] rows:
+            the rows to append
+        :param list[int] widths:
+            the width of each column across the rows
+        """
+        self._materialize()
+        _, body = self._get_cells()
+        self._body.extend(rows)
+        body.extend(rows)
+        self._widths = list(map(max, self._widths, widths))
+        if self._lengths is not None:
+            for counter, column in zip(self._lengths, zip(*rows)):
+                counter.update(map(len, column))
+        self._plan = None
+        super()._invalidate()
+
     def add_row(self, row: Iterable[str | Inline | Paragraph]) -> Table:
         """
         A convenience method which adds a row to the end of table.
@@ -1573,10 +3073,10 @@ class Table(Block):
 
         # Consume row
         row_list = list(row)
-        logger.debug("Adding row to table: %r", row_list)
+        self._materialize()
 
         # Verify that it's safe to add
-        if len(row) != len(self._header):
+        if len(row_list) != len(self._header):
             raise ValueError(
                 f"Unable to add row with width {len(row_list)} "
                 f"to table with header of width {len(self._header)}"
@@ -1584,11 +3084,379 @@ class Table(Block):
 
         # Add it to table
         self._body.append(row_list)
+        self._adopt(row_list)
+
+        # Update rendered cells and widths if they are in use
+        if self._cells is not None:
+            cells = [str(item) for item in row_list]
+            self._cells[1].append(cells)
+            for i, cell in enumerate(cells):
+                if len(cell) > self._widths[i]:
+                    self._widths[i] = len(cell)
+                    self._plan = None
+            if self._lengths is not None:
+                for counter, cell in zip(self._lengths, cells):
+                    counter[len(cell)] += 1
+
+        # Only the render cache is stale; the other rows are unchanged
+        super()._invalidate()
+
+        return self
+
+    def insert_row(self, index: int, row: Iterable[str | Inline | Paragraph]) -> Table:
+        """
+        A convenience method which inserts a row into the table
+        before the given index, like :py:meth:`list.insert`. Like
+        :meth:`add_row`, only the new row is rendered and measured.
+
+        .. doctest:: table
+
+            >>> table = Table(["Rank", "Player"], [["2nd", "McDavid"]])
+            >>> table.insert_row(0, ["1st", "Crosby"])
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(table)
+            | Rank | Player  |
+            | ---- | ------- |
+            | 1st  | Crosby  |
+            | 2nd  | McDavid |
+
+        .. versionadded:: 2.5
+            Included to support tables that change often
+
+        :raises ValueError:
+            when the row is not the same width as the table header
+        :param int index:
+            the index of the row to insert before
+        :param Iterable[str | Inline | Paragraph] row:
+            a row of data
+        :return:
+            self
+        """
+        row_list = list(row)
+        self._materialize()
+        if len(row_list) != len(self._header):
+            raise ValueError(
+                f"Unable to add row with width {len(row_list)} "
+                f"to table with header of width {len(self._header)}"
+            )
+        self._body.insert(index, row_list)
+        self._adopt(row_list)
+        if self._cells is not None:
+            cells = [str(item) for item in row_list]
+            self._cells[1].insert(index, cells)
+            self._update_widths(added=[cells])
+        super()._invalidate()
+        return self
+
+    def update_cell(
+        self, row: int, column: int | str, value: str | Inline | Paragraph
+    ) -> Table:
+        """
+        Replaces one cell in the body of the table. Rather than
+        measuring the whole table again, the number of cells of each
+        length is tracked per column, so the column widths can grow
+        and shrink as cells change in constant time on average.
+
+        .. doctest:: table
+
+            >>> table = Table(["Player", "Status"], [["Crosby", "Injured"]])
+            >>> table.update_cell(0, "Status", "OK")
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(table)
+            | Player | Status |
+            | ------ | ------ |
+            | Crosby | OK     |
+
+        .. versionadded:: 2.5
+            Included to support tables that change often
+
+        :raises ValueError:
+
+            - when the row is not in the table
+            - when the column is not in the table
+        :param int row:
+            the index of the row in the body of the table
+        :param int | str column:
+            the index of the column or the text of its header
+        :param str | Inline | Paragraph value:
+            the new contents of the cell
+        :return:
+            self
+        """
+        self._materialize()
+        row = self._get_row_index(row)
+        column = self._get_column_index(column)
+        # rows may be shared with the rendered cells, so replace them
+        row_list = list(self._body[row])
+        old = row_list[column]
+        row_list[column] = value
+        self._body[row] = row_list
+        self._disown([old])
+        self._adopt([value])
+        if self._cells is not None:
+            self._get_lengths()
+            old_cells = self._cells[1][row]
+            cells = list(old_cells)
+            cells[column] = str(value)
+            self._cells[1][row] = cells
+            self._update_widths(removed=[old_cells], added=[cells])
+        super()._invalidate()
+        return self
+
+    def delete_row(self, index: int) -> Table:
+        """
+        Removes a row from the body of the table. Like
+        :meth:`update_cell`, the column widths shrink as needed
+        without measuring the rest of the table.
+
+        .. doctest:: table
+
+            >>> table = Table(["Player"], [["McDavid"], ["Crosby"]])
+            >>> table.delete_row(0)
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(table)
+            | Player |
+            | ------ |
+            | Crosby |
+
+        .. versionadded:: 2.5
+            Included to support tables that change often
+
+        :raises ValueError:
+            when the row is not in the table
+        :param int index:
+            the index of the row in the body of the table
+        :return:
+            self
+        """
+        self._materialize()
+        index = self._get_row_index(index)
+        self._disown(self._body.pop(index))
+        if self._cells is not None:
+            self._get_lengths()
+            self._update_widths(removed=[self._cells[1].pop(index)])
+        super()._invalidate()
+        return self
+
+    def sort_by(
+        self,
+        column: int | str,
+        key: None | Callable[[str], object] = None,
+        reverse: bool = False,
+    ) -> Table:
+        """
+        Sorts the rows of the table by one of its columns. Cells
+        are compared by their rendered text, or by the result of
+        key when it is provided. Either way, the key is computed
+        once per row rather than once per comparison, and the
+        rendered cells are reused when the table is rendered.
+        Like :py:meth:`list.sort`, the sort is stable.
+
+        .. doctest:: table
+
+            >>> table = Table(
+            ... ["Player", "Goals"],
+            ... [["Crosby", "42"], ["McDavid", "64"], ["Matthews", "69"]]
+            ... )
+            >>> table.sort_by("Goals", key=int, reverse=True)
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(table)
+            | Player   | Goals |
+            | -------- | ----- |
+            | Matthews | 69    |
+            | McDavid  | 64    |
+            | Crosby   | 42    |
 
-        # Update widths as needed
-        for i, item in enumerate(row_list):
-            item_width = len(str(item))
-            if item_width > self._widths[i]:
-                self._widths[i] = item_width
+        .. versionadded:: 2.5
+            Included to support building leaderboards
 
+        :raises ValueError:
+            when the column is not in the table
+        :param int | str column:
+            the index of the column or the text of its header
+        :param None | Callable[[str], object] key:
+            a function which converts the rendered text of a cell
+            to a sort key (e.g., :py:class:`float`); defaults to None
+            which sorts by the text itself
+        :param bool reverse:
+            whether to sort in descending order; defaults to False
+        :return:
+            self
+        """
+        index = self._get_column_index(column)
+        self._materialize()
+        header, cells = self._get_cells()
+        keys = [row[index] for row in cells]
+        if key is not None:
+            keys = list(map(key, keys))
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        self._body = [self._body[i] for i in order]
+        self._cells = (header, [cells[i] for i in order])
+        super()._invalidate()  # the widths are unchanged
         return self
+
+    def top_k(
+        self,
+        rows: Iterable[Iterable[str | Inline | Paragraph]],
+        k: int,
+        column: int | str,
+        key: None | Callable[[str], object] = None,
+        reverse: bool = True,
+    ) -> Table:
+        """
+        Adds the top k rows from an iterable of rows to the end of
+        the table, ordered by one of the columns. Rows are read one
+        at a time and only the best k are kept (using a heap), so
+        the iterable can be far larger than memory. The result is
+        the same as sorting every row and adding the first k.
+
+        .. doctest:: table
+
+            >>> table = Table(["Player", "Goals"])
+            >>> rows = (["Crosby", "42"], ["McDavid", "64"], ["Matthews", "69"])
+            >>> table.top_k(rows, 2, "Goals", key=int)
+            Table(header=[...], body=[...], align=None, indent=0)
+            >>> print(table)
+            | Player   | Goals |
+            | -------- | ----- |
+            | Matthews | 69    |
+            | McDavid  | 64    |
+
+        .. versionadded:: 2.5
+            Included to support building leaderboards
+
+        :raises ValueError:
+
+            - when k is negative
+            - when the column is not in the table
+            - when any of the rows is too short to have the column
+            - when any of the top rows is not the same width
+              as the table header
+        :param Iterable[Iterable[str | Inline | Paragraph]] rows:
+            the rows to choose from
+        :param int k:
+            the number of rows to add
+        :param int | str column:
+            the index of the column or the text of its header
+        :param None | Callable[[str], object] key:
+            a function which converts the rendered text of a cell
+            to a sort key (e.g., :py:class:`float`); defaults to None
+            which orders rows by the text itself
+        :param bool reverse:
+            whether to keep the largest rows in descending order;
+            defaults to True. Set to False to keep the smallest rows
+            in ascending order instead
+        :return:
+            self
+        """
+        if k < 0:
+            raise ValueError(f"k must be at least 0 but was {k}")
+        index = self._get_column_index(column)
+
+        def row_key(row: list) -> object:
+            try:
+                text = str(row[index])
+            except IndexError as error:
+                raise ValueError(
+                    f"Unable to find column {index} in row of width {len(row)}"
+                ) from error
+            return text if key is None else key(text)
+
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return self.add_rows(select(k, map(list, rows), key=row_key))
+
+    def _get_column_index(self, column: int | str) -> int:
+        """
+        A helper method which finds the index of a column.
+
+        :raises ValueError:
+            when the column is not in the table
+        :param int | str column:
+            the index of the column or the text of its header
+        :return:
+            the index of the column
+        """
+        if isinstance(column, str):
+            labels = [str(item) for item in self._header]
+            if column not in labels:
+                raise ValueError(f"Unable to find column {column!r} in table header")
+            return labels.index(column)
+        if not -len(self._header) <= column < len(self._header):
+            raise ValueError(
+                f"Unable to find column {column} in table with "
+                f"header of width {len(self._header)}"
+            )
+        return column % len(self._header)
+
+    def _get_row_index(self, row: int) -> int:
+        """
+        A helper method which checks the index of a row in the
+        body of the table.
+
+        :raises ValueError:
+            when the row is not in the table
+        :param int row:
+            the index of the row, which may be negative
+        :return:
+            the index of the row counting from the start
+        """
+        if not -len(self._body) <= row < len(self._body):
+            raise ValueError(
+                f"Unable to find row {row} in table with {len(self._body)} rows"
+            )
+        return row % len(self._body)
+
+    def _get_lengths(self) -> list[Counter]:
+        """
+        A helper method which counts the rendered cells of each
+        length in every column, including the header. The counts
+        are built the first time a cell is updated or a row is
+        deleted, and they are kept up to date from then on.
+
+        :return:
+            the number of cells of each length, one counter per column
+        """
+        if self._lengths is None:
+            header, body = self._get_cells()
+            self._lengths = [
+                Counter(map(len, map(operator.itemgetter(i), body)))
+                for i in range(len(header))
+            ]
+            for counter, cell in zip(self._lengths, header):
+                counter[len(cell)] += 1
+        return self._lengths
+
+    def _update_widths(
+        self, removed: Iterable[list[str]] = (), added: Iterable[list[str]] = ()
+    ) -> None:
+        """
+        A helper method which updates the column widths as rendered
+        rows are added to and removed from the body of the table.
+        Removing rows requires the lengths from :meth:`_get_lengths`,
+        so that when the widest cell in a column is removed, the new
+        width is found by counting down from the old width rather
+        than measuring every cell again.
+
+        :param Iterable[list[str]] removed:
+            the rendered rows that were removed
+        :param Iterable[list[str]] added:
+            the rendered rows that were added
+        """
+        widths = self._widths
+        for row in added:
+            for i, cell in enumerate(row):
+                if self._lengths is not None:
+                    self._lengths[i][len(cell)] += 1
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+                    self._plan = None
+        for row in removed:
+            for i, cell in enumerate(row):
+                counter = self._lengths[i]
+                counter[len(cell)] -= 1
+                if not counter[len(cell)]:
+                    del counter[len(cell)]
+                    # the header is always counted, so this stops
+                    while not counter[widths[i]]:
+                        widths[i] -= 1
+                        self._plan = None
@@ -0,0 +1,127 @@
+"""
+The instrumentation module houses the hooks used to observe
+documents as they are built and rendered. Observers are opt-in:
+when none are registered, documents skip all of the bookkeeping
+(e.g., timing, measuring) that goes into an event.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, NamedTuple
+
+
+class Event(NamedTuple):
+    """
+    An event is a structured record of something that happened
+    to a document, such as a block being added to it or rendered.
+    Events are passed to every registered observer
+    (see :func:`snakemd.instrument`).
+
+    .. versionadded:: 2.5
+        Included to replace the verbose logging on hot paths
+    """
+
+    action: str
+    """
+    The kind of event that occurred; either :code:`"add"`
+    when a block is added to a document or :code:`"render"`
+    when a block is rendered as part of a document.
+    """
+
+    element: str
+    """
+    The class name of the element involved (e.g., :code:`"Table"`).
+    """
+
+    elapsed: float
+    """
+    The time spent on the action in seconds; always
+    :code:`0.0` for :code:`"add"` events.
+    """
+
+    size: int
+    """
+    The number of characters in the rendered element; always
+    :code:`0` for :code:`"add"` events.
+    """
+
+    cells: int
+    """
+    The number of cells in the element, including the header;
+    always :code:`0` for elements that are not tables.
+    """
+
+
+_observers: list[Callable[[Event], None]] = []
+
+
+def instrument(observer: Callable[[Event], None]) -> Callable[[Event], None]:
+    """
+    Registers an observer which will be called with an :class:`Event`
+    every time a block is added to or rendered by a document. Because
+    this function returns the observer, it can also be used as a
+    decorator.
+
+    .. testsetup:: instrument
+
+        import snakemd
+
+    .. doctest:: instrument
+
+        >>> events = []
+        >>> observer = snakemd.instrument(events.append)
+        >>> doc = snakemd.new_doc()
+        >>> doc.add_heading("Hello!")
+        Heading(text=[...], level=1)
+        >>> events[0]
+        Event(action='add', element='Heading', elapsed=0.0, size=0, cells=0)
+        >>> snakemd.uninstrument(observer)
+
+    .. versionadded:: 2.5
+        Included to replace the verbose logging on hot paths
+
+    :param Callable[[Event], None] observer:
+        any callable which accepts an Event
+    :return:
+        the observer
+    """
+    _observers.append(observer)
+    return observer
+
+
+def uninstrument(observer: Callable[[Event], None]) -> None:
+    """
+    Removes an observer that was previously registered using
+    :func:`snakemd.instrument`. Fails silently if the observer
+    was never registered.
+
+    .. versionadded:: 2.5
+        Included to replace the verbose logging on hot paths
+
+    :param Callable[[Event], None] observer:
+        the observer to remove
+    """
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def _emit(action: str, element, elapsed: float = 0.0, size: int = 0) -> None:
+    """
+    A helper function which builds an event and passes it to every
+    registered observer. Callers are expected to check that
+    observers exist before doing any work to build the event.
+
+    :param str action:
+        the kind of event
+    :param Element element:
+        the element involved in the event
+    :param float elapsed:
+        the time spent on the action in seconds
+    :param int size:
+        the number of characters in the rendered element
+    """
+    count_cells = getattr(element, "_count_cells", None)
+    cells = count_cells() if count_cells else 0
+    event = Event(action, type(element).__name__, elapsed, size, cells)
+    for observer in _observers:
+        observer(event)
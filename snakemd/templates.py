@@ -5,11 +5,17 @@ and all of it's children.
 
 from __future__ import annotations
 
+import collections
 import csv
+import io
+import itertools
 import logging
+import mmap
 import os
 import re
-from typing import Iterable
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
 from enum import Enum, auto
 
 from .elements import Block, Element, Heading, Inline, MDList, Quote, Table
@@ -42,7 +48,10 @@ class Template(Element):  # pylint: disable=too-few-public-methods
     they must call the load function manually.
     """
 
+    __slots__ = ("_elements",)
+
     def __init__(self) -> None:
+        super().__init__()
         self._elements: list[Element] = None  # DO NOT MODIFY
 
     def load(self, elements: list[Element]) -> None:
@@ -76,6 +85,8 @@ class Alert(Template):
         the message you would like to show with the alert
     """
 
+    __slots__ = ("_kind", "_message", "_alert")
+
     class Kind(Enum):
         """
         Kind is an enum representing the different
@@ -127,6 +138,7 @@ class Alert(Template):
         self._kind = kind
         self._message = message
         self._alert = Quote([f"[!{self._kind.name}]", self._message])
+        self._adopt([self._alert])
 
     def __str__(self) -> str:
         """
@@ -148,6 +160,18 @@ class Alert(Template):
         """
         return repr(self._alert)
 
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and every element
+        nested inside of the alert. The alert marker is a raw block,
+        so it is never edited. See :meth:`snakemd.Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        yield from self._alert._walk()
+
 
 class Checklist(Template):
     """
@@ -177,6 +201,8 @@ class Checklist(Template):
           status of the top-level list elements directly
     """
 
+    __slots__ = ("_items", "_checked", "_space")
+
     def __init__(
         self,
         items: Iterable[str | Inline | Block],
@@ -189,6 +215,7 @@ class Checklist(Template):
                 checked, bool) else list(checked)
         )
         self._space = ""
+        self._adopt(self._items)
         if (
             isinstance(self._checked, list)
             and MDList._top_level_count(self._items) != len(self._checked)
@@ -218,7 +245,7 @@ class Checklist(Template):
         i = 1
         for item in self._items:
             if isinstance(item, Checklist | MDList):
-                item._space = self._space + " " * 2
+                item._indent(self._space + " " * 2)
                 output.append(str(item))
             else:
                 row = f"{self._space}-"
@@ -233,9 +260,7 @@ class Checklist(Template):
                 output.append(row)
             i += 1
 
-        checklist = "\n".join(output)
-        logger.debug("Rendered checklist: %r", checklist)
-        return checklist
+        return "\n".join(output)
 
     def __repr__(self) -> str:
         """
@@ -262,6 +287,29 @@ class Checklist(Template):
             f")"
         )
 
+    def _walk(self) -> Iterator[Element]:
+        """
+        A helper method which iterates over self and every element
+        nested inside of the checklist. See
+        :meth:`snakemd.Element._walk`.
+
+        :return:
+            an iterator over self and the elements inside of self
+        """
+        yield self
+        for block in self._items:
+            yield from block._walk()
+
+    def _indent(self, space: str) -> None:
+        """
+        A helper method which sets the leading whitespace of self.
+        See :class:`snakemd.MDList` for more details.
+
+        :param str space:
+            the whitespace to place in front of every list item
+        """
+        self._space = space
+
 
 class CSVTable(Template):
     """
@@ -275,21 +323,119 @@ class CSVTable(Template):
     Future iterations may also allow for different
     CSV dialects like Excel.
 
+    Like other templates, CSV tables are lazy loaded:
+    the CSV file is not parsed until the table is
+    rendered. For large files, the number of rows can
+    be limited using max_rows, in which case only the
+    selected rows are parsed and a note with the number
+    of remaining rows is added below the table. Rows are
+    located using an index of where each row starts in
+    the file, so any page of the file can be rendered
+    without parsing the rows before it.
+
+    .. testsetup:: csv_table
+
+        from snakemd import CSVTable
+
+    .. doctest:: csv_table
+
+        >>> table = CSVTable(
+        ...     "../tests/resources/python-support.csv",
+        ...     max_rows=1,
+        ...     sample="tail"
+        ... )
+        >>> print(table)
+        | Python         | 3.11 | 3.10 | 3.9 | 3.8 |
+        | -------------- | ---- | ---- | --- | --- |
+        | SnakeMD < 0.12 |      | Yes  | Yes | Yes |
+        <BLANKLINE>
+        _2 more rows_
+
     .. versionadded:: 2.2
         Included to showcase the possibilities of
         templates
 
+    .. versionchanged:: 2.5
+        CSV files are parsed at render time, and the
+        rows can be limited using max_rows, sample, and page.
+        Large files can also be parsed in parallel using workers
+
+    :raises ValueError:
+
+        - when max_rows is less than 1
+        - when sample is not "head" or "tail"
+        - when page is negative or used without max_rows
+        - when the CSV file is empty
     :param os.Pathlike path:
         the path to a CSV file
     :param str encoding:
         the encoding of the CSV file; defaults to utf-8
+    :param None | int max_rows:
+        the maximum number of rows to render, not counting the
+        header; defaults to None which renders every row
+    :param str sample:
+        which rows to render when max_rows is set; either "head"
+        for the first rows or "tail" for the last rows; defaults
+        to "head"
+    :param int page:
+        the page of rows to render when max_rows is set, counting
+        from the start of the file for "head" samples or from the
+        end of the file for "tail" samples; defaults to 0
+    :param bool note:
+        whether to add a note with the number of rows that were
+        not rendered; defaults to True
+    :param None | int workers:
+        the number of processes used to parse the whole CSV file
+        in chunks; defaults to None which parses the file serially.
+        The output is identical either way, but parsing in parallel
+        only pays off for very large files (i.e., hundreds of MB).
+        Ignored when max_rows is set
     """
 
-    def __init__(self, path: os.PathLike, encoding: str = "utf-8") -> None:
+    __slots__ = (
+        "_path",
+        "_encoding",
+        "_max_rows",
+        "_sample",
+        "_page",
+        "_note",
+        "_workers",
+        "_table",
+        "_omitted",
+        "_stamp",
+        "_offsets",
+    )
+
+    def __init__(
+        self,
+        path: os.PathLike,
+        encoding: str = "utf-8",
+        max_rows: None | int = None,
+        sample: str = "head",
+        page: int = 0,
+        note: bool = True,
+        workers: None | int = None,
+    ) -> None:
         super().__init__()
+        if not os.stat(path).st_size:  # fail early on missing or empty files
+            raise ValueError(f"Unable to find a header in empty file {path}")
+        if max_rows is not None and max_rows < 1:
+            raise ValueError(f"max_rows must be at least 1 but was {max_rows}")
+        if sample not in ("head", "tail"):
+            raise ValueError(f"sample must be 'head' or 'tail' but was {sample!r}")
+        if page < 0 or (page and max_rows is None):
+            raise ValueError(f"page {page} requires max_rows and cannot be negative")
         self._path = path
         self._encoding = encoding
-        self._table = self._process_csv(path, encoding)
+        self._max_rows = max_rows
+        self._sample = sample
+        self._page = page
+        self._note = note
+        self._workers = workers
+        self._table: Table = None
+        self._omitted = 0
+        self._stamp: tuple[int, int] = None
+        self._offsets: array = None
 
     def __str__(self) -> str:
         """
@@ -299,17 +445,350 @@ class CSVTable(Template):
         :return:
             the CSVTable as a markdown string
         """
-        return str(self._table)
+        table = self._get_table()
+        return str(table) + self._get_note()
 
     def __repr__(self) -> str:
         """
         Renders self as an unambiguous string for development.
-        See :class:`snakemd.Table` for more details.
+        In this case, it displays in the style of a dataclass,
+        where the constructor arguments are listed with their
+        values. The CSV file is not parsed.
+
+        .. doctest:: csv_table
+
+            >>> CSVTable("../tests/resources/python-support.csv", max_rows=1)
+            CSVTable(path='...', encoding='utf-8', max_rows=1, ...)
 
         :return:
             the CSVTable as a development string
         """
-        return repr(self._table)
+        return (
+            f"CSVTable("
+            f"path={self._path!r}, "
+            f"encoding={self._encoding!r}, "
+            f"max_rows={self._max_rows!r}, "
+            f"sample={self._sample!r}, "
+            f"page={self._page!r}, "
+            f"note={self._note!r}, "
+            f"workers={self._workers!r}"
+            f")"
+        )
+
+    def _iter_chunks(self, size: int) -> Iterator[str]:
+        """
+        A helper method which renders the table in pieces.
+        See :meth:`snakemd.Document.aiter_render`.
+
+        :param int size:
+            the maximum number of lines per piece
+        :return:
+            an iterator over the pieces of the table
+        """
+        yield from self._get_table()._iter_chunks(size)
+        if note := self._get_note():
+            yield note
+
+    def _render_compact(self) -> str:
+        """
+        A helper method which renders the table without padding.
+        See :meth:`snakemd.Document.render`.
+
+        :return:
+            the CSVTable as a compact markdown string
+        """
+        return self._get_table()._render_compact() + self._get_note()
+
+    def _count_cells(self) -> int:
+        """
+        A helper method which counts the cells in the table,
+        including the header. See :func:`snakemd.instrument`.
+        Counting never parses the CSV file, so the count is zero
+        until the table has been rendered.
+
+        :return:
+            the number of cells in the table
+        """
+        return self._table._count_cells() if self._table is not None else 0
+
+    def _get_note(self) -> str:
+        """
+        A helper method which renders the note about rows
+        that were left out of the table, if any.
+
+        :return:
+            the note, including the separating blank line, or
+            an empty string
+        """
+        if not self._note or not self._omitted:
+            return ""
+        rows = "row" if self._omitted == 1 else "rows"
+        return f"\n\n{Inline(f'{self._omitted} more {rows}', italics=True)}"
+
+    def _get_table(self) -> Table:
+        """
+        A helper method which parses the CSV file into a Table
+        the first time it is needed. The table is parsed again
+        if the file changes on disk.
+
+        :return:
+            the CSV file as a markdown Table
+        """
+        stat = os.stat(self._path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if self._table is None or stamp != self._stamp:
+            if stamp != self._stamp:
+                self._offsets = None
+            self._stamp = stamp
+            if self._max_rows is None and self._workers and self._workers > 1:
+                self._table = self._process_csv_parallel()
+                self._omitted = 0
+            elif self._max_rows is None:
+                self._table = self._process_csv(self._path, self._encoding)
+                self._omitted = 0
+            else:
+                self._table = self._process_rows()
+        return self._table
+
+    def _select(self, total: int) -> tuple[int, int]:
+        """
+        A helper method which computes the range of rows to
+        render based on max_rows, sample, and page.
+
+        :param int total:
+            the number of rows in the CSV file, excluding the header
+        :return:
+            the index of the first row and one past the last row
+        """
+        if self._sample == "head":
+            start = min(total, self._page * self._max_rows)
+            return start, min(total, start + self._max_rows)
+        stop = max(0, total - self._page * self._max_rows)
+        return max(0, stop - self._max_rows), stop
+
+    def _process_rows(self) -> Table:
+        """
+        A helper method which parses only the selected rows of
+        the CSV file into a Table. Files in encodings where newlines
+        and quotes are single bytes (e.g., UTF-8) are memory mapped
+        and indexed; anything else is read through a buffered reader.
+
+        :return:
+            the selected rows of the CSV file as a markdown Table
+        """
+        if not self._is_byte_compatible(self._encoding):
+            return self._process_rows_buffered()
+        with open(self._path, "rb") as csv_file:
+            try:
+                mapped = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return self._process_rows_buffered()
+            with mapped:
+                if mapped.find(b"\n") == -1 and mapped.find(b"\r") != -1:
+                    return self._process_rows_buffered()  # old Mac line endings
+                if self._offsets is None:
+                    self._offsets = self._index_records(mapped)
+                offsets = self._offsets
+                if len(offsets) < 2:
+                    return self._process_rows_buffered()
+                start, stop = self._select(len(offsets) - 2)
+                self._omitted = len(offsets) - 2 - (stop - start)
+                header = self._parse(mapped[offsets[0] : offsets[1]])
+                rows = self._parse(mapped[offsets[start + 1] : offsets[stop + 1]])
+        table = Table(header=next(header))
+        table.add_rows(rows)
+        return table
+
+    def _process_rows_buffered(self) -> Table:
+        """
+        A helper method which parses the selected rows of the CSV
+        file by reading through the whole file once. Used when the
+        file cannot be memory mapped and indexed.
+
+        :return:
+            the selected rows of the CSV file as a markdown Table
+        """
+        with open(self._path, encoding=self._encoding) as csv_file:
+            csv_reader = csv.reader(csv_file)
+            header = next(csv_reader, None)
+            if header is None:
+                raise ValueError(f"Unable to find a header in empty file {self._path}")
+            # keep just enough rows to cover the selection
+            last = collections.deque(maxlen=(self._page + 1) * self._max_rows)
+            if self._sample == "head":
+                last = collections.deque(
+                    itertools.islice(csv_reader, last.maxlen), maxlen=last.maxlen
+                )
+                total = len(last) + sum(1 for _ in csv_reader)
+                skipped = 0
+            else:
+                total = 0
+                for row in csv_reader:
+                    last.append(row)
+                    total += 1
+                skipped = total - len(last)
+        start, stop = self._select(total)
+        table = Table(header=header)
+        table.add_rows(itertools.islice(last, start - skipped, stop - skipped))
+        self._omitted = total - (stop - start)
+        return table
+
+    def _process_csv_parallel(self) -> Table:
+        """
+        A helper method which parses the whole CSV file into a
+        Table using a pool of processes. The file is split into
+        chunks at record boundaries, and each process parses and
+        measures one chunk at a time. The rows and column widths
+        of the chunks are then merged in order. Files that cannot
+        be memory mapped and indexed are parsed serially.
+
+        :return:
+            the CSV file as a markdown Table
+        """
+        if not self._is_byte_compatible(self._encoding):
+            return self._process_csv(self._path, self._encoding)
+        with open(self._path, "rb") as csv_file:
+            try:
+                mapped = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return self._process_csv(self._path, self._encoding)
+            with mapped:
+                if mapped.find(b"\n") == -1:
+                    return self._process_csv(self._path, self._encoding)
+                parts = min(self._workers * 4, len(mapped) // (1 << 20) + 1)
+                bounds = self._split_records(mapped, parts)
+                header = next(self._parse(mapped[: bounds[0]]), None)
+        if header is None:
+            return self._process_csv(self._path, self._encoding)
+        table = Table(header=header)
+        if len(bounds) < 2:
+            return table
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            chunks = executor.map(
+                _parse_chunk,
+                itertools.repeat(self._path),
+                itertools.repeat(self._encoding),
+                bounds[:-1],
+                bounds[1:],
+                itertools.repeat(len(header)),
+            )
+            for rows, widths in chunks:
+                table._extend(rows, widths)
+        return table
+
+    @staticmethod
+    def _split_records(data: bytes | mmap.mmap, parts: int) -> list[int]:
+        """
+        A helper method which splits a CSV file into roughly equal
+        chunks of whole records. Like :meth:`_index_records`, quotes
+        are counted to avoid splitting inside of quoted fields, but
+        only the quotes before each split need to be counted.
+
+        :param bytes | mmap.mmap data:
+            the raw bytes of the CSV file
+        :param int parts:
+            the number of chunks to aim for
+        :return:
+            the offset of the end of the header followed by the
+            offset of the end of each chunk
+        """
+        size = len(data)
+        bounds = []
+        quotes = 0
+        position = 0
+        for part in range(parts):
+            target = max(position, size * part // parts)
+            for block in range(position, target, 1 << 20):
+                quotes += data[block : min(block + (1 << 20), target)].count(b'"')
+            position = target
+            # move forward to the end of the current record
+            while (newline := data.find(b"\n", position)) != -1:
+                quotes += data[position:newline].count(b'"')
+                position = newline + 1
+                if quotes % 2 == 0:
+                    break
+            else:
+                position = size
+            if not bounds or position > bounds[-1]:
+                bounds.append(position)
+        if bounds[-1] != size:
+            bounds.append(size)
+        return bounds
+
+    def _parse(self, data: bytes) -> Iterator[list[str]]:
+        """
+        A helper method which parses a run of complete CSV
+        records from the raw bytes of the file.
+
+        :param bytes data:
+            the raw bytes of one or more records
+        :return:
+            an iterator over the parsed records
+        """
+        return _parse_records(data, self._encoding)
+
+    @staticmethod
+    def _is_byte_compatible(encoding: str) -> bool:
+        """
+        A helper method which checks that newlines and quotes
+        are encoded as the same single bytes as in ASCII, which
+        is required to index the file without decoding it.
+
+        :param str encoding:
+            the encoding of the CSV file
+        :return:
+            True if the file can be indexed as raw bytes
+        """
+        try:
+            return '\n"\r'.encode(encoding) == b'\n"\r'
+        except (LookupError, UnicodeError):
+            return False
+
+    @staticmethod
+    def _index_records(data: bytes | mmap.mmap) -> array:
+        """
+        A helper method which finds where each CSV record starts.
+        Newlines inside of quoted fields do not end a record,
+        which is detected by counting quotes: a newline ends a
+        record only if the record so far contains an even number
+        of quotes (escaped quotes are doubled, so they cancel out).
+
+        :param bytes | mmap.mmap data:
+            the raw bytes of the CSV file
+        :return:
+            the offset of the start of every record followed by
+            the offset of the end of the last record
+        """
+        offsets = array("Q", [0])
+        size = len(data)
+        quotes = 0
+        position = 0
+        while position < size:
+            # work through the file in blocks of whole lines
+            stop = data.find(b"\n", min(position + (1 << 20), size) - 1)
+            stop = size if stop == -1 else stop + 1
+            block = data[position:stop]
+            if not quotes and block.find(b'"') == -1:
+                # without quotes, every newline ends a record
+                lines = block.split(b"\n")
+                lines.pop()
+                starts = itertools.accumulate(
+                    map((1).__add__, map(len, lines)), initial=position
+                )
+                offsets.extend(itertools.islice(starts, 1, None))
+                position = stop
+                continue
+            base = position
+            while (newline := block.find(b"\n", position - base)) != -1:
+                quotes += block.count(b'"', position - base, newline)
+                position = base + newline + 1
+                if quotes % 2 == 0:
+                    offsets.append(position)
+                    quotes = 0
+            position = stop
+        if offsets[-1] != len(data):
+            offsets.append(len(data))
+        return offsets
 
     @staticmethod
     def _process_csv(path: os.PathLike, encoding: str) -> Table:
@@ -317,6 +796,8 @@ class CSVTable(Template):
         A helper method for processing the CSV file into
         a Table object.
 
+        :raises ValueError:
+            when the CSV file is empty
         :param os.Pathlike path:
             the path to the CSV file
         :param str encoding:
@@ -326,13 +807,70 @@ class CSVTable(Template):
         """
         with open(path, encoding=encoding) as csv_file:
             csv_reader = csv.reader(csv_file)
-            header = next(csv_reader)
+            header = next(csv_reader, None)
+            if header is None:
+                raise ValueError(f"Unable to find a header in empty file {path}")
             table = Table(header=header)
-            for row in csv_reader:
-                table.add_row(row=row)
+            table.add_rows(csv_reader)
             return table
 
 
+def _parse_records(data: bytes, encoding: str) -> Iterator[list[str]]:
+    """
+    A helper function which parses a run of complete CSV records
+    from raw bytes. Newlines are translated the same way as when
+    the file is opened in text mode, so the records match what
+    :func:`csv.reader` produces for the whole file.
+
+    :param bytes data:
+        the raw bytes of one or more records
+    :param str encoding:
+        the encoding of the bytes
+    :return:
+        an iterator over the parsed records
+    """
+    return csv.reader(io.StringIO(data.decode(encoding), newline=None))
+
+
+def _parse_chunk(
+    path: os.PathLike, encoding: str, start: int, stop: int, columns: int
+) -> tuple[list[list[str]], list[int]]:
+    """
+    A helper function which parses and measures one chunk of a
+    CSV file in a worker process (see :class:`CSVTable`).
+
+    :raises ValueError:
+        when a row is not the same width as the header
+    :param os.PathLike path:
+        the path to the CSV file
+    :param str encoding:
+        the encoding of the CSV file
+    :param int start:
+        the offset of the first record in the chunk
+    :param int stop:
+        the offset of the end of the last record in the chunk
+    :param int columns:
+        the number of columns in the header
+    :return:
+        the rows of the chunk and the width of each column
+    """
+    with open(path, "rb") as csv_file:
+        csv_file.seek(start)
+        data = csv_file.read(stop - start)
+    rows = list(_parse_records(data, encoding))
+    widths = [0] * columns
+    for row in rows:
+        if len(row) != columns:
+            raise ValueError(
+                f"Unable to add row with width {len(row)} "
+                f"to table with header of width {columns}"
+            )
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    return rows, widths
+
+
 class TableOfContents(Template):
     """
     A Table of Contents is an element containing an ordered list
@@ -348,6 +886,8 @@ class TableOfContents(Template):
         to include in the table of contents; defaults to range(2, 3)
     """
 
+    __slots__ = ("_levels",)
+
     def __init__(self, levels: range = range(2, 3)) -> None:
         super().__init__()
         self._levels: range = levels
@@ -382,13 +922,19 @@ class TableOfContents(Template):
     def _get_headings(self) -> list[Heading]:
         """
         Retrieves the list of headings from the current document.
+        Documents keep an index of their headings, which is used
+        when available to avoid scanning every element.
 
         :return:
             a list heading objects
         """
+        if hasattr(self._elements, "get_headings"):
+            headings = self._elements.get_headings()
+        else:
+            headings = self._elements
         return [
             heading
-            for heading in self._elements
+            for heading in headings
             if isinstance(heading, Heading) and heading.get_level() in self._levels
         ]
 
@@ -0,0 +1,432 @@
+"""
+The writers module houses tools for writing markdown
+output in bulk, such as the DocumentWriter and
+TableWriter classes.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import logging
+import os
+import pathlib
+import queue
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, TextIO
+
+from .document import Document
+from .elements import Inline, Paragraph, Table, _row_format, _separator_row
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentWriter:
+    """
+    A document writer is a background service for dumping many
+    documents to disk. Rather than writing each document in the
+    calling thread like :meth:`snakemd.Document.dump`, documents
+    are submitted to a pool of threads which render and write
+    them while the caller moves on to building the next document.
+
+    The number of documents waiting to be written is bounded, so
+    a caller that produces documents faster than they can be
+    written will block on :meth:`submit` until there is room.
+    Output directories are created once and remembered, so
+    writing thousands of documents to the same directory does
+    not repeatedly hit the file system.
+
+    Because documents are rendered in the background, a document
+    should not be modified after it has been submitted.
+
+    .. testsetup:: writer
+
+        import snakemd
+
+    .. testcleanup:: writer
+
+        import os
+        os.remove("README.md")
+
+    .. doctest:: writer
+
+        >>> doc = snakemd.new_doc()
+        >>> doc.add_heading("Hello!")
+        Heading(text=[...], level=1)
+        >>> with snakemd.DocumentWriter() as writer:
+        ...     future = writer.submit(doc, "README")
+        >>> future.result()
+        'README.md'
+
+    .. versionadded:: 2.5
+        Included to support writing many documents at once
+
+    :param None | int workers:
+        the number of writer threads; defaults to None which
+        uses the :py:class:`concurrent.futures.ThreadPoolExecutor` default
+    :param int max_pending:
+        the maximum number of documents waiting to be written
+        before :meth:`submit` blocks; defaults to 64
+    :param int buffer_size:
+        the size of the write buffer for each file in bytes;
+        defaults to 64 KiB
+    """
+
+    def __init__(
+        self,
+        workers: None | int = None,
+        max_pending: int = 64,
+        buffer_size: int = 1 << 16,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1 but was {max_pending}")
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="snakemd-writer"
+        )
+        # one token per pending document, so put blocks while the queue is full
+        self._pending: queue.Queue[None] = queue.Queue(max_pending)
+        self._buffer_size = buffer_size
+        self._directories: set[str] = set()
+
+    def __enter__(self) -> DocumentWriter:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def submit(
+        self,
+        doc: Document,
+        name: str,
+        directory: str | os.PathLike = "",
+        ext: str = "md",
+        encoding: str = "utf-8",
+    ) -> Future[str]:
+        """
+        Queues a document to be written to a file. The parameters
+        mirror :meth:`snakemd.Document.dump`. If the queue is full,
+        this method blocks until one of the pending documents
+        has been written.
+
+        :param Document doc:
+            the document to write
+        :param str name:
+            the name of the markdown file to output without the file extension
+        :param str | os.PathLike directory:
+            the output directory for the markdown file; defaults to ""
+        :param str ext:
+            the output file extension; defaults to "md"
+        :param str encoding:
+            the encoding to use; defaults to utf-8
+        :return:
+            a future which resolves to the path of the written file
+            (or raises any error that occurred while writing it)
+        """
+        self._pending.put(None)
+        try:
+            future = self._executor.submit(
+                self._write, doc, name, directory, ext, encoding
+            )
+        except BaseException:
+            self._pending.get_nowait()
+            raise
+        future.add_done_callback(lambda _: self._pending.get_nowait())
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stops accepting documents and releases the writer threads.
+        Called automatically when the writer is used as a context
+        manager.
+
+        :param bool wait:
+            whether to block until every pending document is written;
+            defaults to True
+        """
+        self._executor.shutdown(wait=wait)
+        logger.info("Closed document writer")
+
+    def _write(
+        self,
+        doc: Document,
+        name: str,
+        directory: str | os.PathLike,
+        ext: str,
+        encoding: str,
+    ) -> str:
+        """
+        A helper method which writes a single document on a
+        writer thread.
+
+        :return:
+            the path of the written file
+        """
+        directory = os.fspath(directory)
+        if directory not in self._directories:
+            pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+            self._directories.add(directory)
+        path = os.path.join(directory, f"{name}.{ext}")
+        with open(
+            path, "w+", encoding=encoding, buffering=self._buffer_size
+        ) as output_file:
+            doc.render_to(output_file)
+        return path
+
+
+class TableWriter:
+    """
+    A table writer streams a markdown table to a file (or any
+    other object with a :code:`write` method, such as a socket
+    opened with :py:meth:`socket.socket.makefile`) without ever
+    holding the whole table in memory. The output is identical
+    to rendering a :class:`snakemd.Table` with the same header,
+    rows, alignment, and indent.
+
+    Because markdown tables are padded to the widest item in each
+    column, the column widths must be known before the first row
+    is written. The writer supports three strategies for finding
+    them:
+
+    - :code:`"fixed"`: the widths are provided upfront, so rows
+      are written in a single pass. Items wider than their column
+      are written in full, which keeps the table valid but breaks
+      the alignment of that row.
+    - :code:`"scan"`: the rows are read twice, once to measure
+      the widths and once to write them. The rows must be
+      re-iterable (e.g., a list or an object that reopens a file
+      on every iteration; see :meth:`write_csv`).
+    - :code:`"spill"`: the rows are read once, measured, and
+      rendered to a temporary file, which is then read back and
+      written out. This works for any iterable, including
+      generators, at the cost of disk space.
+
+    .. testsetup:: table_writer
+
+        import snakemd
+
+    .. doctest:: table_writer
+
+        >>> import io
+        >>> writer = snakemd.TableWriter(["Rank", "Player"])
+        >>> output = io.StringIO()
+        >>> writer.write(output, (row for row in [["1st", "Crosby"]]))
+        1
+        >>> print(output.getvalue())
+        | Rank | Player |
+        | ---- | ------ |
+        | 1st  | Crosby |
+
+    .. versionadded:: 2.5
+        Included to support writing very large tables
+
+    :raises ValueError:
+        when the number of widths does not match the header
+    :param Iterable[str | Inline | Paragraph] header:
+        the header row of labels
+    :param None | Iterable[Table.Align] align:
+        the column alignment; defaults to None
+    :param int indent:
+        indent size for the whole table; defaults to 0
+    :param None | Iterable[int] widths:
+        the fixed width of each column; defaults to None
+    :param int buffer_rows:
+        the number of rows written to the output at a time;
+        defaults to 1024
+    """
+
+    STRATEGIES = ("fixed", "scan", "spill")
+    """
+    The names of the supported width strategies.
+    """
+
+    def __init__(
+        self,
+        header: Iterable[str | Inline | Paragraph],
+        align: None | Iterable[Table.Align] = None,
+        indent: int = 0,
+        widths: None | Iterable[int] = None,
+        buffer_rows: int = 1024,
+    ) -> None:
+        self._header = [self._render_cell(item) for item in header]
+        self._align = None if align is None else list(align)
+        self._indent = indent
+        self._widths = None if widths is None else list(widths)
+        if self._widths is not None and len(self._widths) != len(self._header):
+            raise ValueError(
+                f"Expected {len(self._header)} widths "
+                f"but received {len(self._widths)}"
+            )
+        self._buffer_rows = max(1, buffer_rows)
+
+    def write(
+        self,
+        fp: TextIO,
+        rows: Iterable[Iterable[str | Inline | Paragraph]],
+        strategy: None | str = None,
+    ) -> int:
+        """
+        Writes a table with the given rows to a file-like object.
+        The table is written without a trailing newline, like
+        :class:`snakemd.Table`.
+
+        :raises ValueError:
+
+            - when the strategy is not recognized
+            - when the fixed strategy is requested without widths
+            - when the scan strategy is requested for rows that
+              can only be iterated once
+            - when a row is not the same width as the header
+        :param TextIO fp:
+            the file-like object to write to
+        :param Iterable[Iterable[str | Inline | Paragraph]] rows:
+            the rows of the table
+        :param None | str strategy:
+            one of :attr:`STRATEGIES`; defaults to None which uses
+            fixed widths if they were provided, a scan if the rows
+            can be iterated more than once, or a spill otherwise
+        :return:
+            the number of rows written
+        """
+        reiterable = iter(rows) is not rows
+        if strategy is None:
+            if self._widths is not None:
+                strategy = "fixed"
+            else:
+                strategy = "scan" if reiterable else "spill"
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy!r}; expected one of {self.STRATEGIES}"
+            )
+        if strategy == "fixed":
+            if self._widths is None:
+                raise ValueError("The fixed strategy requires widths")
+            return self._write_rows(fp, self._widths, map(self._render_row, rows))
+        if strategy == "scan":
+            if not reiterable:
+                raise ValueError("The scan strategy requires re-iterable rows")
+            widths = self._measure(map(self._render_row, rows))
+            return self._write_rows(fp, widths, map(self._render_row, rows))
+        with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as spill_file:
+            spill = csv.writer(spill_file)
+            widths = self._measure(self._tee(map(self._render_row, rows), spill))
+            spill_file.seek(0)
+            return self._write_rows(fp, widths, csv.reader(spill_file))
+
+    def write_csv(
+        self,
+        fp: TextIO,
+        path: str | os.PathLike,
+        encoding: str = "utf-8",
+        skip_header: bool = True,
+        strategy: str = "scan",
+    ) -> int:
+        """
+        Writes a table with the rows of a CSV file to a file-like
+        object. By default, the CSV file is read twice: once to
+        measure the widths and once to write the rows.
+
+        :param TextIO fp:
+            the file-like object to write to
+        :param str | os.PathLike path:
+            the path to the CSV file
+        :param str encoding:
+            the encoding of the CSV file; defaults to utf-8
+        :param bool skip_header:
+            whether the first row of the CSV file is a header that
+            should be skipped; defaults to True
+        :param str strategy:
+            one of :attr:`STRATEGIES`; defaults to "scan"
+        :return:
+            the number of rows written
+        """
+        return self.write(fp, _CSVRows(path, encoding, skip_header), strategy)
+
+    @staticmethod
+    def _render_cell(item: str | Inline | Paragraph) -> str:
+        """
+        A helper method which renders a cell the same way a
+        Table would (i.e., as a Paragraph).
+        """
+        return " ".join(str(item).split())
+
+    def _render_row(self, row: Iterable[str | Inline | Paragraph]) -> list[str]:
+        """
+        A helper method which renders every cell in a row and
+        verifies that the row is the same width as the header.
+        """
+        cells = [self._render_cell(item) for item in row]
+        if len(cells) != len(self._header):
+            raise ValueError(
+                f"Unable to add row with width {len(cells)} "
+                f"to table with header of width {len(self._header)}"
+            )
+        return cells
+
+    def _measure(self, rows: Iterable[list[str]]) -> list[int]:
+        """
+        A helper method which computes the column widths of the
+        header and the rendered rows.
+        """
+        widths = [len(cell) for cell in self._header]
+        for row in rows:
+            for i, cell in enumerate(row):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+        return widths
+
+    @staticmethod
+    def _tee(rows: Iterable[list[str]], spill) -> Iterator[list[str]]:
+        """
+        A helper method which copies each row to a CSV writer
+        while passing it along.
+        """
+        for row in rows:
+            spill.writerow(row)
+            yield row
+
+    def _write_rows(
+        self, fp: TextIO, widths: list[int], rows: Iterable[list[str]]
+    ) -> int:
+        """
+        A helper method which writes the header, the alignment row,
+        and then the rendered rows in batches of buffer_rows.
+
+        :return:
+            the number of rows written
+        """
+        row_format = _row_format(widths, self._indent)
+        fp.write(row_format.format(*self._header))
+        fp.write("\n" + _separator_row(widths, self._align, self._indent))
+        count = 0
+        while batch := list(itertools.islice(rows, self._buffer_rows)):
+            fp.write("\n" + "\n".join(itertools.starmap(row_format.format, batch)))
+            count += len(batch)
+        logger.info("Wrote table with %d rows", count)
+        return count
+
+
+class _CSVRows:  # pylint: disable=too-few-public-methods
+    """
+    A re-iterable source of rows from a CSV file. The file is
+    reopened every time the rows are iterated.
+
+    :param str | os.PathLike path:
+        the path to the CSV file
+    :param str encoding:
+        the encoding of the CSV file
+    :param bool skip_header:
+        whether to skip the first row of the CSV file
+    """
+
+    def __init__(self, path: str | os.PathLike, encoding: str, skip_header: bool):
+        self._path = path
+        self._encoding = encoding
+        self._skip_header = skip_header
+
+    def __iter__(self) -> Iterator[list[str]]:
+        with open(self._path, encoding=self._encoding, newline="") as csv_file:
+            rows = csv.reader(csv_file)
+            if self._skip_header:
+                next(rows, None)
+            yield from rows
@@ -1,6 +1,13 @@
+import asyncio
+import io
 import os
+import pickle
 
-from snakemd import Document, Heading, HorizontalRule, Paragraph, Alert
+import markdown
+import pytest
+
+import snakemd
+from snakemd import Document, Heading, HorizontalRule, Inline, Paragraph, Alert, Table
 
 # Method tests (singles)
 
@@ -140,6 +147,13 @@ def test_add_table_one_row():
     assert str(doc) == "| x | y |\n| - | - |\n| 1 | 2 |"
 
 
+def test_add_table_intern():
+    doc = Document()
+    table = doc.add_table(["x", "y"], [["Yes", "No"], ["No", "Yes"]], intern=True)
+    assert str(doc) == "| x   | y   |\n| --- | --- |\n| Yes | No  |\n| No  | Yes |"
+    assert table._body[0][0]._content[0] is table._body[1][1]._content[0]
+
+
 def test_add_block_horizontal_rule():
     doc = Document()
     doc.add_block(HorizontalRule())
@@ -167,6 +181,133 @@ def test_dump_empty():
     os.remove("test.md")
 
 
+def test_iter_render_empty():
+    doc = Document()
+    assert list(doc.iter_render()) == []
+
+
+def test_iter_render_many():
+    doc = Document()
+    doc.add_heading("Test Document")
+    doc.add_paragraph("This is a test document.")
+    doc.add_horizontal_rule()
+    pieces = list(doc.iter_render())
+    assert pieces == [
+        "# Test Document", "\n\n", "This is a test document.", "\n\n", "***"
+    ]
+    assert "".join(pieces) == str(doc)
+
+
+def test_render_to():
+    doc = Document()
+    doc.add_heading("Section 1", level=2)
+    doc.add_table_of_contents()
+    buffer = io.StringIO()
+    doc.render_to(buffer)
+    assert buffer.getvalue() == str(doc)
+
+
+def test_dump_many():
+    doc = Document()
+    doc.add_heading("Test Document")
+    doc.add_code("x = 5")
+    doc.dump("test")
+    with open("test.md", encoding="utf-8") as f:
+        assert f.read() == str(doc)
+    os.remove("test.md")
+
+
+def test_render_after_mutation():
+    doc = Document()
+    heading = doc.add_heading("Test Document", level=2)
+    paragraph = doc.add_paragraph("Go here")
+    assert str(doc) == "## Test Document\n\nGo here"
+    heading.promote()
+    paragraph.insert_link("here", "https://snakemd.io")
+    assert str(doc) == "# Test Document\n\nGo [here](https://snakemd.io)"
+
+
+async def _collect(doc, chunk_rows=1000, profile="default"):
+    return [piece async for piece in doc.aiter_render(chunk_rows, profile)]
+
+
+def test_aiter_render_empty():
+    assert asyncio.run(_collect(Document())) == []
+
+
+def test_aiter_render_matches_str():
+    doc = Document()
+    doc.add_heading("Section 1", level=2)
+    doc.add_table_of_contents()
+    doc.add_table(["x", "y"], [[str(i), str(i * i)] for i in range(25)])
+    doc.add_paragraph("Done")
+    pieces = asyncio.run(_collect(doc, chunk_rows=10))
+    assert "".join(pieces) == str(doc)
+    assert len(pieces) == 9
+
+
+def test_aiter_render_cached_table():
+    doc = Document()
+    doc.add_table(["x"], [[str(i)] for i in range(25)])
+    expected = str(doc)
+    assert asyncio.run(_collect(doc, chunk_rows=10)) == [expected]
+
+
+def test_aiter_render_splits_blocks():
+    doc = Document()
+    doc.add_code("\n".join(f"line {i}" for i in range(25)))
+    doc.add_paragraph("Done")
+    pieces = asyncio.run(_collect(doc, chunk_rows=10))
+    assert "".join(pieces) == str(doc)
+    assert len(pieces) == 5
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(doc, chunk_rows=0))
+
+
+def test_aiter_render_compact():
+    doc = Document()
+    doc.add_heading("Title")
+    doc.add_table(["x", "y"], [[str(i), str(i * i)] for i in range(25)])
+    doc.add_paragraph("Done")
+    pieces = asyncio.run(_collect(doc, chunk_rows=10, profile="compact"))
+    assert "".join(pieces) == doc.render(profile="compact")
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(doc, profile="unknown"))
+
+
+def test_aiter_render_events():
+    events = []
+    doc = Document()
+    doc.add_heading("Title")
+    doc.add_table(["x"], [[str(i)] for i in range(25)])
+    observer = snakemd.instrument(events.append)
+    try:
+        rendered = "".join(asyncio.run(_collect(doc, chunk_rows=10)))
+    finally:
+        snakemd.uninstrument(observer)
+    assert [event.element for event in events] == ["Heading", "Table"]
+    assert sum(event.size for event in events) + 2 == len(rendered)
+
+
+def test_aiter_render_csv_table(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("x,y\n" + "".join(f"{i},{i * i}\n" for i in range(25)))
+    doc = Document()
+    doc.add_raw("Start")
+    doc.add_block(snakemd.CSVTable(path))
+    pieces = asyncio.run(_collect(doc, chunk_rows=10))
+    assert "".join(pieces) == str(doc)
+
+
+def test_adump(tmp_path):
+    doc = Document()
+    doc.add_heading("Test Document")
+    doc.add_table(["x"], [[str(i)] for i in range(100)])
+    asyncio.run(doc.adump("test", tmp_path / "out", buffer_size=64))
+    with open(tmp_path / "out" / "test.md", encoding="utf-8") as f:
+        assert f.read() == str(doc)
+
+
 # Method tests (2-combos)
 
 
@@ -175,3 +316,256 @@ def test_document_add_heading_and_paragraph():
     doc.add_heading("Test Document")
     doc.add_paragraph("This is a test document.")
     assert str(doc) == "# Test Document\n\nThis is a test document."
+
+
+def test_render_serial():
+    doc = Document()
+    doc.add_heading("Test Document")
+    doc.add_paragraph("This is a test document.")
+    assert doc.render() == str(doc)
+    assert doc.render(workers=1) == str(doc)
+
+
+def test_render_workers():
+    doc = Document()
+    doc.add_table_of_contents()
+    for i in range(20):
+        doc.add_heading(f"Section {i}", level=2)
+        doc.add_table(["x", "y"], [[str(i), str(i * j)] for j in range(10)])
+        doc.add_code(f"x = {i}", lang="python")
+    doc.add_paragraph("Done")
+    rendered = doc.render(workers=2)
+    assert rendered == str(doc)
+    doc.add_paragraph("Fresh")
+    assert doc.render(workers=2) == rendered + "\n\nFresh"
+
+
+def test_document_heading_index():
+    doc = Document()
+    doc.add_heading("First")
+    second = doc.add_heading("Second", level=2)
+    doc.add_paragraph("Text")
+    elements = doc.get_elements()
+    assert elements.get_headings() == [elements[0], second]
+    elements.pop(1)
+    assert elements.get_headings() == [elements[0]]
+    elements += [Paragraph(["More"]), second]
+    assert elements.get_headings() == [elements[0], second]
+    elements.clear()
+    assert elements.get_headings() == []
+
+
+def test_document_shares_element_list():
+    elements = [Heading("First", 1)]
+    doc = Document(elements)
+    elements.append(Paragraph(["Added later"]))
+    assert doc.get_elements() is elements
+    assert str(doc) == "# First\n\nAdded later"
+    doc.add_table_of_contents()
+    elements.append(Heading("Second", 2))
+    assert "[Second](#second)" in str(doc)
+
+
+def test_document_pickle():
+    doc = Document()
+    doc.add_heading("First")
+    doc.add_table_of_contents()
+    doc.add_heading("Second", level=2)
+    copy = pickle.loads(pickle.dumps(doc))
+    assert str(copy) == str(doc)
+    copy.add_heading("Third", level=2)
+    assert "[Third](#third)" in str(copy)
+
+
+def _stats_doc():
+    doc = Document()
+    doc.add_heading("Stats")
+    doc.add_table(
+        ["Name", "Goals", "Team"],
+        [["Sidney Crosby", "42", "PIT"], ["", "7", "TOR"]],
+        [Table.Align.LEFT, Table.Align.RIGHT, Table.Align.CENTER],
+    )
+    doc.add_horizontal_rule()
+    doc.add_heading("Notes", level=2)
+    doc.add_paragraph("Done")
+    return doc
+
+
+def test_document_render_compact():
+    doc = _stats_doc()
+    assert doc.render(profile="compact") == (
+        "# Stats\n"
+        "|Name|Goals|Team|\n"
+        "|:-|-:|:-:|\n"
+        "|Sidney Crosby|42|PIT|\n"
+        "||7|TOR|\n\n"
+        "***\n"
+        "## Notes\n"
+        "Done"
+    )
+
+
+def test_document_render_compact_displays_the_same():
+    doc = _stats_doc()
+    compact = doc.render(profile="compact")
+    expected = markdown.markdown(str(doc), extensions=["tables"])
+    assert markdown.markdown(compact, extensions=["tables"]) == expected
+
+
+def test_document_render_compact_workers():
+    doc = _stats_doc()
+    assert doc.render(workers=2, profile="compact") == doc.render(profile="compact")
+
+
+def test_document_render_unknown_profile():
+    with pytest.raises(ValueError):
+        Document().render(profile="tiny")
+
+
+def test_document_dump_compact(tmp_path):
+    doc = _stats_doc()
+    doc.dump("README", directory=tmp_path, compact=True)
+    with open(tmp_path / "README.md", encoding="utf-8") as output:
+        assert output.read() == doc.render(profile="compact")
+
+
+# Optimize
+
+
+def _edited_doc() -> Document:
+    doc = Document()
+    doc.add_heading("Glossary")
+    paragraph = doc.add_paragraph("SnakeMD writes Markdown from Python code")
+    for word in ["SnakeMD", "Markdown", "Python"]:
+        paragraph.replace(word, word.upper())
+    doc.add_raw("<!-- one -->")
+    doc.add_raw("<!-- two -->")
+    doc.add_unordered_list(["first", "second"])
+    doc.add_quote("Quoted text")
+    doc.add_raw("<!-- three -->")
+    doc.add_table(["Word"], [[Paragraph(["a", "b", Inline("c", bold=True)])]])
+    return doc
+
+
+def test_document_optimize_same_output():
+    doc = _edited_doc()
+    expected = str(doc)
+    compact = doc.render(profile="compact")
+    doc.optimize()
+    assert str(doc) == expected
+    assert doc.render(profile="compact") == compact
+
+
+def test_document_optimize_merges_raw_blocks():
+    doc = _edited_doc()
+    doc.optimize()
+    assert len(doc.get_elements()) == 7
+    assert len(doc.get_elements()[1]._content) == 1
+    assert len(doc.get_elements()[-1]._body[0][0]._content[0]._content) == 2
+
+
+def test_document_optimize_keeps_heading_index():
+    doc = _edited_doc()
+    doc.add_table_of_contents()
+    doc.add_heading("Section", level=2)
+    expected = str(doc)
+    doc.optimize()
+    assert str(doc) == expected
+
+
+# Autolink
+
+
+def _glossary_doc() -> Document:
+    doc = Document()
+    doc.add_paragraph("Python runs SnakeMD. Python is great.")
+    doc.add_heading("Lists")
+    doc.add_unordered_list(["Python", "SnakeMD"])
+    doc.add_heading("Quotes")
+    doc.add_block(Paragraph([Inline("Python", code=True), " and ", "Python 3"]))
+    doc.add_quote("Python in a quote")
+    doc.add_table(["Tool"], [["SnakeMD"], ["Python"]])
+    return doc
+
+
+def test_document_autolink_sections():
+    doc = _glossary_doc()
+    count = doc.autolink({"Python": "/py", "SnakeMD": "/md", "Python 3": "/py3"})
+    assert count == 7
+    assert str(doc) == (
+        "[Python](/py) runs [SnakeMD](/md). Python is great.\n\n"
+        "# Lists\n\n"
+        "- [Python](/py)\n"
+        "- [SnakeMD](/md)\n\n"
+        "# Quotes\n\n"
+        "`Python` and [Python 3](/py3)\n\n"
+        "> Python in a quote\n\n"
+        "| Tool           |\n"
+        "| -------------- |\n"
+        "| [SnakeMD](/md) |\n"
+        "| [Python](/py)  |"
+    )
+
+
+def test_document_autolink_document_scope():
+    doc = _glossary_doc()
+    assert doc.autolink({"Python": "/py", "SnakeMD": "/md"}, scope="document") == 2
+    assert str(doc).count("](") == 2
+
+
+def test_document_autolink_every_occurrence():
+    doc = _glossary_doc()
+    assert doc.autolink({"Python": "/py"}, first_occurrence_only=False) == 5
+    assert "`Python`" in str(doc)
+
+
+def test_document_autolink_skips_links():
+    doc = Document()
+    doc.add_paragraph("Read the docs").insert_link("docs", "/old")
+    assert doc.autolink({"docs": "/new"}) == 0
+    assert str(doc) == "Read the [docs](/old)"
+
+
+def test_document_autolink_empty_glossary():
+    doc = _glossary_doc()
+    expected = str(doc)
+    assert doc.autolink({"": "/nothing"}) == 0
+    assert str(doc) == expected
+
+
+def test_document_autolink_templates():
+    doc = Document()
+    doc.add_checklist(["Install Python"])
+    doc.add_block(Alert(Paragraph(["Python is required"]), Alert.Kind.NOTE))
+    assert doc.autolink({"Python": "/py", "NOTE": "/note"}, scope="document") == 1
+    assert doc.autolink({"Python": "/py"}) == 1
+    assert str(doc) == (
+        "- [ ] Install [Python](/py)\n\n"
+        "> [!NOTE]\n"
+        "> [Python](/py) is required"
+    )
+
+
+def test_document_autolink_string_cells():
+    doc = Document()
+    table = Table.from_records([{"Tool": "Python", "Use": "n/a"}])
+    table.add_row(["SnakeMD", "Python docs"])
+    doc.add_block(table)
+    doc.add_block(Table.from_columns(["Name"], [["pip", "uv"]]))
+    assert doc.autolink({"Python": "/py", "pip": "/pip"}) == 2
+    assert doc.autolink({"docs": "/docs"}) == 1
+    assert str(doc) == (
+        "| Tool          | Use                  |\n"
+        "| ------------- | -------------------- |\n"
+        "| [Python](/py) | n/a                  |\n"
+        "| SnakeMD       | Python [docs](/docs) |\n\n"
+        "| Name        |\n"
+        "| ----------- |\n"
+        "| [pip](/pip) |\n"
+        "| uv          |"
+    )
+
+
+def test_document_autolink_unknown_scope():
+    with pytest.raises(ValueError):
+        Document().autolink({"a": "/a"}, scope="page")
@@ -398,3 +398,18 @@ def test_repr_can_create_object():
     heading = Heading("", 1)
     obj = eval(repr(heading))
     assert isinstance(obj, Heading) 
+
+
+def test_heading_cache_invalidated_by_promote():
+    heading = Heading("Example heading", 3)
+    assert str(heading) == "### Example heading"
+    heading.promote()
+    assert str(heading) == "## Example heading"
+
+
+def test_heading_cache_invalidated_by_inline():
+    inline = Inline("Example heading")
+    heading = Heading(inline, 1)
+    assert str(heading) == "# Example heading"
+    inline.code()
+    assert str(heading) == "# `Example heading`"
@@ -1,6 +1,7 @@
 import markdown
+import pytest
 
-from snakemd import Inline
+from snakemd import Inline, Paragraph
 
 # Constructor tests (singles)
 
@@ -442,10 +443,8 @@ def test_reset_method():
     assert isinstance(text, Inline)
     assert not text._image
     assert not text._link
-    assert not text._code
-    assert not text._bold
-    assert not text._italics
-    assert not text._strikethrough
+    assert not text._styles
+    assert str(text) == "Howdy"
 
 
 def test_reset_image_method():
@@ -453,10 +452,8 @@ def test_reset_image_method():
     assert isinstance(text, Inline)
     assert not text._image
     assert not text._link
-    assert not text._code
-    assert not text._bold
-    assert not text._italics
-    assert not text._strikethrough
+    assert not text._styles
+    assert str(text) == "Howdy"
 
 
 def test_inline_is_text_text_method():
@@ -483,3 +480,118 @@ def test_repr_can_create_object():
     inline = Inline("")
     obj = eval(repr(inline))
     assert isinstance(obj, Inline)
+
+
+# Cache tests
+
+
+def test_inline_cache_reused():
+    inline = Inline("Hello")
+    assert str(inline) is str(inline)
+
+
+def test_inline_cache_invalidated_by_mutator():
+    inline = Inline("Hello")
+    assert str(inline) == "Hello"
+    inline.bold().link("https://snakemd.io")
+    assert str(inline) == "**[Hello](https://snakemd.io)**"
+    inline.reset()
+    assert str(inline) == "Hello"
+
+
+# Interning tests
+
+
+def test_inline_intern_shared():
+    assert Inline.intern("Yes") is Inline.intern("Yes")
+    assert Inline.intern("Yes") is not Inline.intern("No")
+
+
+def test_inline_intern_renders_plain():
+    inline = Inline.intern("Yes")
+    assert str(inline) == "Yes"
+    assert inline.is_text()
+    assert repr(inline) == repr(Inline("Yes"))
+
+
+def test_inline_intern_immutable():
+    inline = Inline.intern("Yes")
+    with pytest.raises(TypeError):
+        inline.bold()
+    with pytest.raises(TypeError):
+        inline.link("https://snakemd.io")
+    assert str(inline) == "Yes"
+
+
+def test_inline_intern_noop_mutators():
+    inline = Inline.intern("Yes")
+    assert inline.unbold().unlink().unbreakline().reset() is inline
+
+
+def test_inline_intern_not_adopted():
+    inline = Inline.intern("Shared")
+    Paragraph([inline])
+    Paragraph([inline])
+    assert inline._parents is None
+
+
+def test_inline_intern_subclass():
+    class Label(Inline):
+        __slots__ = ()
+
+    label = Label.intern("Shared")
+    assert type(label) is Label
+    assert Label.intern("Shared") is label
+    assert type(Inline.intern("Shared")) is Inline
+
+
+def test_inline_intern_limit(monkeypatch):
+    monkeypatch.setattr(Inline, "_interned", {})
+    monkeypatch.setattr(Inline, "_intern_limit", 1)
+    first = Inline.intern("First")
+    assert Inline.intern("First") is first
+    assert Inline.intern("Second") is not Inline.intern("Second")
+    with pytest.raises(TypeError):
+        Inline.intern("Second").bold()
+
+
+@pytest.mark.parametrize("image", [None, "logo.png"])
+@pytest.mark.parametrize("link", [None, "https://snakemd.io"])
+@pytest.mark.parametrize("styles", range(32))
+def test_inline_templates_match_styles(image, link, styles):
+    bold, italics, strikethrough, code, linebreak = (
+        bool(styles & (1 << i)) for i in range(5)
+    )
+    inline = Inline(
+        "{0} text",
+        image=image,
+        link=link,
+        bold=bold,
+        italics=italics,
+        strikethrough=strikethrough,
+        code=code,
+        linebreak=linebreak,
+    )
+    expected = "{0} text"
+    if image:
+        expected = f"![{expected}]({image})"
+    if link:
+        expected = f"[{expected}]({link})"
+    if bold:
+        expected = f"**{expected}**"
+    if italics:
+        expected = f"_{expected}_"
+    if strikethrough:
+        expected = f"~~{expected}~~"
+    if code:
+        expected = f"`{expected}`"
+    if linebreak:
+        expected = f"{expected}<br />"
+    assert str(inline) == expected
+
+
+def test_inline_render_cached_until_mutated():
+    inline = Inline("text", link="https://snakemd.io")
+    assert str(inline) is str(inline)
+    inline.bold()
+    assert str(inline) == "**[text](https://snakemd.io)**"
@@ -323,3 +323,18 @@ def test_repr_can_create_object():
     mdlist = MDList([])
     obj = eval(repr(mdlist))
     assert isinstance(obj, MDList) 
+
+
+def test_md_list_cache_invalidated_by_nested_inline():
+    inline = Inline("Bakugo")
+    mdlist = MDList(["Deku", MDList([inline])])
+    assert str(mdlist) == "- Deku\n  - Bakugo"
+    inline.bold()
+    assert str(mdlist) == "- Deku\n  - **Bakugo**"
+
+
+def test_md_list_cache_nested_indent():
+    inner = MDList(["Bakugo"])
+    assert str(inner) == "- Bakugo"
+    outer = MDList(["Deku", inner], ordered=True)
+    assert str(outer) == "1. Deku\n   - Bakugo"
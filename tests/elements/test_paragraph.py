@@ -1,3 +1,4 @@
+import re
 from types import GeneratorType
 
 from snakemd import Inline, Paragraph
@@ -190,3 +191,245 @@ def test_paragraph_with_linebreak():
         Inline("Second Line")
     ])
     assert str(paragraph) == "First Line<br />Second Line"
+
+
+# Cache tests
+
+
+def test_paragraph_cache_invalidated_by_inline():
+    inline = Inline("World")
+    paragraph = Paragraph(["Hello, ", inline])
+    assert str(paragraph) == "Hello, World"
+    inline.italicize()
+    assert str(paragraph) == "Hello, _World_"
+
+
+def test_paragraph_cache_invalidated_by_add():
+    paragraph = Paragraph("Hello")
+    assert str(paragraph) == "Hello"
+    paragraph.add(", World")
+    assert str(paragraph) == "Hello, World"
+
+
+def test_paragraph_cache_invalidated_by_insert_link():
+    paragraph = Paragraph("Go here")
+    assert str(paragraph) == "Go here"
+    paragraph.insert_link("here", "https://snakemd.io")
+    assert str(paragraph) == "Go [here](https://snakemd.io)"
+    paragraph.replace_link("https://snakemd.io", "https://example.com")
+    assert str(paragraph) == "Go [here](https://example.com)"
+
+
+def test_paragraph_cache_shared_inline():
+    inline = Inline("Shared")
+    first = Paragraph([inline])
+    second = Paragraph([inline])
+    assert str(first) == str(second) == "Shared"
+    inline.bold()
+    assert str(first) == str(second) == "**Shared**"
+
+
+# Multi-target replacement
+
+
+def test_paragraph_replace_many():
+    paragraph = Paragraph("How now brown cow")
+    paragraph.replace_many({"now": "then", "cow": "bull"})
+    assert str(paragraph) == "How then brown bull"
+
+
+def test_paragraph_replace_many_swap():
+    paragraph = Paragraph("cats chase dogs")
+    paragraph.replace_many({"cats": "dogs", "dogs": "cats"})
+    assert str(paragraph) == "dogs chase cats"
+
+
+def test_paragraph_replace_many_longest_match():
+    paragraph = Paragraph("Python 3 is not Python 2")
+    paragraph.replace_many({"Python": "Snake", "Python 3": "Py3k"})
+    assert str(paragraph) == "Py3k is not Snake 2"
+
+
+def test_paragraph_replace_many_keeps_styles():
+    paragraph = Paragraph(["plain ", Inline("bold word", bold=True, linebreak=True)])
+    paragraph.replace_many({"word": "text"})
+    assert str(paragraph) == "plain **bold ****text**<br />"
+    assert "linebreak=False" in repr(paragraph._content[1])
+    assert "linebreak=True" in repr(paragraph._content[2])
+
+
+def test_paragraph_replace_many_count():
+    paragraph = Paragraph(["a b a ", Inline("a b", italics=True)])
+    paragraph.replace_many({"a": "x", "b": "y"}, count=1)
+    assert str(paragraph) == "x y a _a b_"
+
+
+def test_paragraph_replace_many_count_per_target():
+    paragraph = Paragraph("ab ab aaa")
+    paragraph.replace_many({"ab": "Z", "a": "y"}, count={"ab": 1})
+    assert str(paragraph) == "Z ab yyy"
+
+
+def test_paragraph_replace_many_no_match_keeps_content():
+    inline = Inline("unchanged")
+    paragraph = Paragraph([inline])
+    paragraph.replace_many({"missing": "found", "": "empty"})
+    assert paragraph._content == [inline]
+
+
+def test_paragraph_insert_links():
+    paragraph = Paragraph(["Read the SnakeMD docs. ", Inline("SnakeMD", link="old")])
+    paragraph.insert_links({"SnakeMD": "https://snakemd.io", "docs": "/docs"})
+    assert str(paragraph) == (
+        "Read the [SnakeMD](https://snakemd.io) [docs](/docs). [SnakeMD](old)"
+    )
+
+
+def test_paragraph_insert_links_glossary():
+    terms = {f"term{i}": f"/glossary#{i}" for i in range(500)}
+    paragraph = Paragraph(" ".join(f"term{i}" for i in range(0, 500, 7)))
+    paragraph.insert_links(terms, count=1)
+    assert str(paragraph) == " ".join(
+        f"[term{i}](/glossary#{i})" for i in range(0, 500, 7)
+    )
+
+
+def test_paragraph_apply_rules():
+    paragraph = Paragraph("Test your code, then test it again")
+    paragraph.apply_rules({"code": Inline.code, "test": Inline.bold})
+    assert str(paragraph) == "Test your `code`, then **test** it again"
+
+
+def test_paragraph_apply_rules_cache_invalidated():
+    inline = Inline("old text")
+    paragraph = Paragraph([inline])
+    assert str(paragraph) == "old text"
+    paragraph.apply_rules({"old": Inline.italicize})
+    inline.bold()
+    assert str(paragraph) == "_old_ text"
+
+
+# Regular expressions
+
+
+def test_paragraph_sub_template():
+    paragraph = Paragraph("Call 555-1234 or 555-9876")
+    paragraph.sub(r"(\d{3})-(\d{4})", r"\2-\1")
+    assert str(paragraph) == "Call 1234-555 or 9876-555"
+
+
+def test_paragraph_sub_function():
+    paragraph = Paragraph("1 fish 2 fish")
+    paragraph.sub(r"\d", lambda match: str(int(match.group()) * 10))
+    assert str(paragraph) == "10 fish 20 fish"
+
+
+def test_paragraph_sub_function_inline():
+    paragraph = Paragraph(["See ", Inline("TODO and TODO", italics=True)])
+    paragraph.sub("TODO", lambda match: Inline("FIXME", code=True), count=1)
+    assert str(paragraph) == "See `FIXME`_ and TODO_"
+
+
+def test_paragraph_sub_keeps_styles():
+    paragraph = Paragraph([Inline("version 1.0", bold=True)])
+    paragraph.sub(r"\d+\.\d+", "2.0")
+    assert str(paragraph) == "**version ****2.0**"
+
+
+def test_paragraph_sub_compiled_pattern():
+    paragraph = Paragraph("Hello hello HELLO")
+    paragraph.sub(re.compile("hello", re.IGNORECASE), "bye")
+    assert str(paragraph) == "bye bye bye"
+
+
+def test_paragraph_sub_skips_code_and_links():
+    paragraph = Paragraph([Inline("x1", code=True), " x2 ", Inline("x3", link="x4")])
+    paragraph.sub(r"x\d", "y")
+    assert str(paragraph) == "`x1` y [x3](x4)"
+
+
+def test_paragraph_link_pattern():
+    paragraph = Paragraph("Fixes ABC-12, ABC-345, and ABC-6789")
+    paragraph.link_pattern(r"ABC-(\d+)", r"https://bugs.example.com/\1", count=2)
+    assert str(paragraph) == (
+        "Fixes [ABC-12](https://bugs.example.com/12), "
+        "[ABC-345](https://bugs.example.com/345), and ABC-6789"
+    )
+
+
+def test_paragraph_link_pattern_many_paragraphs():
+    paragraphs = [Paragraph(f"See #{i} and #{i + 1}") for i in range(100)]
+    for paragraph in paragraphs:
+        paragraph.link_pattern(r"#(\d+)", r"/issues/\1")
+    assert str(paragraphs[42]) == "See [#42](/issues/42) and [#43](/issues/43)"
+
+
+# Compaction
+
+
+def test_paragraph_compact_merges_plain_inlines():
+    paragraph = Paragraph(["a ", "b ", Inline("c", bold=True), " d", " e"])
+    expected = str(paragraph)
+    paragraph.compact()
+    assert str(paragraph) == expected
+    assert [item.get_text() for item in paragraph._content] == ["a b ", "c", " d e"]
+
+
+def test_paragraph_compact_drops_empty_inlines():
+    paragraph = Paragraph(["", Inline("x", link="/"), "", Inline("", bold=True)])
+    paragraph.compact()
+    assert str(paragraph) == "[x](/)****"
+    assert len(paragraph._content) == 2
+
+
+def test_paragraph_compact_linebreaks():
+    paragraph = Paragraph(["a", Inline("b", linebreak=True), "c", "d"])
+    expected = str(paragraph)
+    paragraph.compact()
+    assert str(paragraph) == expected == "ab<br />cd"
+    assert len(paragraph._content) == 2
+
+
+def test_paragraph_compact_after_replace():
+    paragraph = Paragraph("one, two, three, four")
+    for word in ["one", "two", "three", "four"]:
+        paragraph.replace(word, word.upper())
+    expected = str(paragraph)
+    assert len(paragraph._content) > 1
+    paragraph.compact()
+    assert str(paragraph) == expected
+    assert len(paragraph._content) == 1
+
+
+def test_paragraph_compact_detaches_merged_inlines():
+    inline = Inline("a")
+    paragraph = Paragraph([inline, "b"]).compact()
+    inline.bold()
+    assert str(paragraph) == "ab"
+
+
+def test_paragraph_compact_keeps_styles():
+    inlines = [Inline("a", italics=True), Inline("b", italics=True)]
+    paragraph = Paragraph(inlines).compact()
+    assert paragraph._content == inlines
+
+
+def test_paragraph_insert_links_count_compiles_once():
+    from snakemd.elements import _compile_targets
+
+    terms = {f"word{i:03}": f"/{i}" for i in range(300)}
+    paragraph = Paragraph(" ".join(f"word{i:03} word{i:03}" for i in range(300)))
+    before = _compile_targets.cache_info()
+    paragraph.insert_links(terms, count=1)
+    after = _compile_targets.cache_info()
+    assert after.misses + after.hits - before.misses - before.hits == 1
+    assert str(paragraph).count("](") == 300
+
+
+def test_paragraph_replace_disowns_split_inlines():
+    inline = Inline("Hello world")
+    paragraph = Paragraph([inline]).replace("world", "there")
+    assert inline._parents is None
+    assert str(paragraph) == "Hello there"
+    inline.bold()
+    assert paragraph._cache == "Hello there"
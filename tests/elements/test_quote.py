@@ -55,3 +55,11 @@ def test_repr_can_create_object():
     quote = Quote("")
     obj = eval(repr(quote))
     assert isinstance(obj, Quote)
+
+
+def test_quote_cache_invalidated_by_nested_inline():
+    inline = Inline("Inner")
+    quote = Quote(["Outer", Quote([inline])])
+    assert str(quote) == "> Outer\n> \n> > Inner\n> "
+    inline.bold()
+    assert str(quote) == "> Outer\n> \n> > **Inner**\n> "
@@ -1,3 +1,8 @@
+import collections
+import dataclasses
+from array import array
+from random import Random
+
 import pytest
 
 from snakemd import Inline, Paragraph, Table
@@ -92,3 +97,401 @@ def test_repr_can_create_object():
     table = Table([])
     obj = eval(repr(table))
     assert isinstance(obj, Table)
+
+
+# Cache tests
+
+
+def test_table_cache_invalidated_by_add_row():
+    table = Table(["Age"], [["24"]])
+    assert str(table) == "| Age |\n| --- |\n| 24  |"
+    table.add_row(["25"])
+    assert str(table) == "| Age |\n| --- |\n| 24  |\n| 25  |"
+
+
+def test_table_cache_invalidated_by_cell():
+    cell = Inline("24")
+    table = Table(["Age"], [[cell]])
+    assert str(table) == "| Age |\n| --- |\n| 24  |"
+    cell.bold()
+    assert str(table) == "| Age    |\n| ------ |\n| **24** |"
+
+
+def test_table_cells_rendered_once():
+    class Counted(Paragraph):
+        __slots__ = ()
+        renders = 0
+
+        def __str__(self):
+            Counted.renders += 1
+            return super().__str__()
+
+    table = Table(["Age"], [[Counted(["24"])], [Counted(["25"])]])
+    str(table)
+    table.add_row([Counted(["100"])])
+    assert str(table) == "| Age |\n| --- |\n| 24  |\n| 25  |\n| 100 |"
+    assert Counted.renders == 3
+
+
+# From columns tests
+
+
+def test_table_from_columns():
+    table = Table.from_columns(["Name", "Age"], [["Robert", "Sam"], [25, 7]])
+    assert str(table) == (
+        "| Name   | Age |\n"
+        "| ------ | --- |\n"
+        "| Robert | 25  |\n"
+        "| Sam    | 7   |"
+    )
+    assert str(table) == str(Table(["Name", "Age"], [["Robert", "25"], ["Sam", "7"]]))
+
+
+def test_table_from_columns_array():
+    table = Table.from_columns(
+        ["Ints", "Floats", "Bytes"],
+        [array("i", [1, -20]), array("d", [0.5, 1e16]), b"ab"],
+        align=[Table.Align.RIGHT, Table.Align.LEFT, Table.Align.CENTER],
+    )
+    assert str(table) == (
+        "| Ints | Floats | Bytes |\n"
+        "| ---: | :----- | :---: |\n"
+        "| 1    | 0.5    | 97    |\n"
+        "| -20  | 1e+16  | 98    |"
+    )
+
+
+def test_table_from_columns_formats():
+    table = Table.from_columns(
+        ["A", "B", "C"], [[1.234], [3], ["x"]], formats=[".1f", hex, None]
+    )
+    assert str(table) == "| A   | B   | C |\n| --- | --- | - |\n| 1.2 | 0x3 | x |"
+
+
+def test_table_from_columns_array_like():
+    class ArrayLike:
+        def __array__(self):
+            raise AssertionError("numpy should only be used when installed")
+
+        def __iter__(self):
+            return iter([1, 2])
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        table = Table.from_columns(["A"], [ArrayLike()])
+        assert str(table) == "| A |\n| - |\n| 1 |\n| 2 |"
+    else:
+        pytest.skip("numpy is installed")
+
+
+def test_table_from_columns_numpy():
+    numpy = pytest.importorskip("numpy")
+    table = Table.from_columns(
+        ["Ints", "Floats"], [numpy.arange(3), numpy.array([0.1, 2.5, 3.0])]
+    )
+    assert str(table) == (
+        "| Ints | Floats |\n"
+        "| ---- | ------ |\n"
+        "| 0    | 0.1    |\n"
+        "| 1    | 2.5    |\n"
+        "| 2    | 3.0    |"
+    )
+
+
+def test_table_from_columns_add_row():
+    table = Table.from_columns(["Name"], [["Sam"]])
+    table.add_row([Inline("Robert", bold=True)])
+    assert str(table) == "| Name       |\n| ---------- |\n| Sam        |\n| **Robert** |"
+    assert table._body[0] == ["Sam"]
+
+
+def test_table_from_columns_errors():
+    with pytest.raises(ValueError):
+        Table.from_columns(["A", "B"], [[1]])
+    with pytest.raises(ValueError):
+        Table.from_columns(["A", "B"], [[1], [1, 2]])
+    with pytest.raises(ValueError):
+        Table.from_columns(["A"], [[1]], formats=[None, None])
+
+
+# Add rows tests
+
+
+def test_table_add_rows_generator():
+    table = Table(["Name", "Age"])
+    table.add_rows(([f"Person {i}", str(i)] for i in range(5000)))
+    expected = Table(["Name", "Age"])
+    for i in range(5000):
+        expected.add_row([f"Person {i}", str(i)])
+    assert str(table) == str(expected)
+
+
+def test_table_add_rows_after_render():
+    table = Table(["Age"], [["24"]])
+    assert str(table) == "| Age |\n| --- |\n| 24  |"
+    cell = Inline("25")
+    table.add_rows([[cell], ["100"]])
+    assert str(table) == "| Age |\n| --- |\n| 24  |\n| 25  |\n| 100 |"
+    cell.bold()
+    assert str(table).endswith("| **25** |\n| 100    |")
+
+
+def test_table_add_rows_error_adds_nothing():
+    table = Table(["Age"], [["24"]])
+    with pytest.raises(ValueError):
+        table.add_rows([["25"]] * 5000 + [["26", "27"]])
+    assert str(table) == "| Age |\n| --- |\n| 24  |"
+
+
+def test_table_add_rows_error_disowns_cells():
+    table = Table(["Age"], [["24"]])
+    cell = Paragraph(["25"])
+    with pytest.raises(ValueError):
+        table.add_rows([[cell]] + [["25"]] * 5000 + [["26", "27"]])
+    assert cell._parents is None
+
+
+
+def test_table_sort_by_text():
+    table = Table(["Name", "Age"], [["Sam", "5"], ["Ada", "40"], ["Bo", "12"]])
+    table.sort_by("Name")
+    assert str(table) == (
+        "| Name | Age |\n| ---- | --- |\n| Ada  | 40  |\n| Bo   | 12  |\n| Sam  | 5   |"
+    )
+
+
+def test_table_sort_by_key_reverse():
+    table = Table(["Name", "Age"], [["Sam", "5"], ["Ada", "40"], ["Bo", "12"]])
+    assert str(table)
+    table.sort_by(1, key=int, reverse=True)
+    assert [str(row[0]) for row in table._body] == ["Ada", "Bo", "Sam"]
+    assert str(table).endswith("| Ada  | 40  |\n| Bo   | 12  |\n| Sam  | 5   |")
+
+
+def test_table_sort_by_key_once_per_row():
+    calls = []
+    table = Table(["Age"], [[str(i)] for i in range(100, 0, -1)])
+    table.sort_by(0, key=lambda cell: calls.append(cell) or int(cell))
+    assert len(calls) == 100
+    assert str(table).splitlines()[2] == "| 1   |"
+
+
+def test_table_sort_by_then_add_row():
+    table = Table(["Age"], [["5"], ["40"]])
+    table.sort_by("Age", key=int, reverse=True)
+    table.add_row(["100"])
+    assert str(table) == "| Age |\n| --- |\n| 40  |\n| 5   |\n| 100 |"
+
+
+def test_table_sort_by_columns():
+    table = Table.from_columns(["Name", "Age"], [["Sam", "Ada"], [5, 40]])
+    table.sort_by(-1, key=int, reverse=True)
+    assert str(table) == "| Name | Age |\n| ---- | --- |\n| Ada  | 40  |\n| Sam  | 5   |"
+
+
+@pytest.mark.parametrize("column", ["Height", 2, -3])
+def test_table_sort_by_unknown_column(column):
+    table = Table(["Name", "Age"], [["Sam", "5"]])
+    with pytest.raises(ValueError):
+        table.sort_by(column)
+
+
+# Table top_k
+
+
+def test_table_top_k():
+    rows = ([f"Person {i}", str(i * 7 % 1000)] for i in range(10000))
+    table = Table(["Name", "Score"]).top_k(rows, 3, "Score", key=int)
+    expected = sorted(
+        ([f"Person {i}", str(i * 7 % 1000)] for i in range(10000)),
+        key=lambda row: int(row[1]),
+        reverse=True,
+    )[:3]
+    assert str(table) == str(Table(["Name", "Score"], expected))
+
+
+def test_table_top_k_smallest():
+    rows = [["a", "3"], ["b", "1"], ["c", "2"]]
+    table = Table(["Name", "Score"]).top_k(rows, 2, 1, reverse=False)
+    assert table._body == [["b", "1"], ["c", "2"]]
+
+
+def test_table_top_k_more_than_rows():
+    table = Table(["Score"], [["9"]]).top_k(iter([["1"], ["5"]]), 10, 0, key=int)
+    assert str(table).endswith("| 9     |\n| 5     |\n| 1     |")
+
+
+def test_table_top_k_zero():
+    table = Table(["Score"]).top_k([["1"]], 0, "Score")
+    assert str(table) == "| Score |\n| ----- |"
+
+
+def test_table_top_k_negative():
+    with pytest.raises(ValueError):
+        Table(["Score"]).top_k([["1"]], -1, "Score")
+
+
+def test_table_top_k_short_row():
+    table = Table(["Name", "Score"])
+    with pytest.raises(ValueError):
+        table.top_k([["a", "3"], ["b"]], 1, "Score")
+    assert table._body == []
+
+
+# Table from_records
+
+
+def test_table_from_records_dicts():
+    records = [{"Name": "Sam", "Age": 5}, {"Name": "Ada", "Age": 40}]
+    table = Table.from_records(records)
+    assert str(table) == str(Table(["Name", "Age"], [["Sam", "5"], ["Ada", "40"]]))
+
+
+def test_table_from_records_namedtuples():
+    Person = collections.namedtuple("Person", ["name", "age"])
+    table = Table.from_records(Person("Sam", i) for i in range(3))
+    assert str(table) == str(
+        Table(["name", "age"], [["Sam", "0"], ["Sam", "1"], ["Sam", "2"]])
+    )
+
+
+def test_table_from_records_dataclasses():
+    @dataclasses.dataclass
+    class Person:
+        name: str
+        age: int
+
+    table = Table.from_records([Person("Sam", 5)], columns=["age"])
+    assert str(table) == "| age |\n| --- |\n| 5   |"
+
+
+def test_table_from_records_mixed_types():
+    Person = collections.namedtuple("Person", ["age", "name"])
+    records = [{"name": "Sam", "age": 5}, Person(40, "Ada"), {"age": 7, "name": "Bo"}]
+    table = Table.from_records(records, columns=["name", "age"])
+    assert str(table) == str(
+        Table(["name", "age"], [["Sam", "5"], ["Ada", "40"], ["Bo", "7"]])
+    )
+
+
+def test_table_from_records_many():
+    records = ({"id": i, "square": i * i} for i in range(10000))
+    table = Table.from_records(records, align=[Table.Align.RIGHT] * 2)
+    assert len(table._body) == 10000
+    assert str(table).splitlines()[-1] == "| 9999 | 99980001 |"
+
+
+def test_table_from_records_empty():
+    with pytest.raises(ValueError):
+        Table.from_records([])
+    assert str(Table.from_records([], columns=["a"])) == "| a |\n| - |"
+
+
+def test_table_from_records_unknown_type():
+    with pytest.raises(ValueError):
+        Table.from_records([["Sam", 5]])
+
+
+def test_table_from_records_missing_column():
+    with pytest.raises(ValueError):
+        Table.from_records([{"name": "Sam"}, {"age": 5}])
+
+
+# Table update_cell, delete_row, and insert_row
+
+
+def test_table_update_cell_shrinks():
+    table = Table(["Name", "Status"], [["Sam", "Unavailable"], ["Ada", "OK"]])
+    assert str(table).endswith("| Ada  | OK          |")
+    table.update_cell(0, "Status", "OK")
+    assert str(table) == (
+        "| Name | Status |\n| ---- | ------ |\n| Sam  | OK     |\n| Ada  | OK     |"
+    )
+
+
+def test_table_update_cell_grows():
+    table = Table(["Name"], [["Sam"]])
+    table.update_cell(-1, 0, Inline("Samantha", bold=True))
+    assert str(table) == "| Name         |\n| ------------ |\n| **Samantha** |"
+
+
+def test_table_update_cell_inline_mutation():
+    cell = Inline("Sam")
+    table = Table(["Name"]).add_row([cell])
+    assert str(table)
+    table.update_cell(0, "Name", "Ada")
+    cell.bold()
+    assert cell._parents is None
+    assert str(table) == "| Name |\n| ---- |\n| Ada  |"
+
+
+def test_table_delete_row():
+    table = Table(["Name"], [["Sam"], ["Samantha"], ["Ada"]])
+    assert str(table)
+    table.delete_row(1)
+    assert str(table) == "| Name |\n| ---- |\n| Sam  |\n| Ada  |"
+    table.delete_row(-1).delete_row(0)
+    assert str(table) == "| Name |\n| ---- |"
+
+
+def test_table_insert_row():
+    table = Table(["Name"], [["Sam"]])
+    assert str(table)
+    table.insert_row(0, ["Samantha"]).insert_row(10, ["Ada"])
+    assert str(table) == (
+        "| Name     |\n| -------- |\n| Samantha |\n| Sam      |\n| Ada      |"
+    )
+
+
+def test_table_row_changes_match_rebuild():
+    random = Random(0)
+    rows = [[str(i), "x" * random.randrange(20)] for i in range(50)]
+    table = Table(["Id", "Value"], rows)
+    assert str(table)
+    for i in range(500):
+        action = random.randrange(3)
+        if action == 0 and rows:
+            index = random.randrange(len(rows))
+            value = "y" * random.randrange(25)
+            rows[index] = [rows[index][0], value]
+            table.update_cell(index, "Value", value)
+        elif action == 1 and rows:
+            index = random.randrange(len(rows))
+            del rows[index]
+            table.delete_row(index)
+        else:
+            index = random.randrange(len(rows) + 1)
+            rows.insert(index, [f"new {i}", "z" * random.randrange(30)])
+            table.insert_row(index, rows[index])
+        assert str(table) == str(Table(["Id", "Value"], rows))
+
+
+def test_table_row_changes_after_add_rows():
+    table = Table(["Value"], [["a"]])
+    assert str(table)
+    table.delete_row(0)
+    table.add_rows([["bbbbbbbb"], ["cc"]])
+    table.add_row(["ddd"])
+    table.delete_row(0)
+    assert str(table) == "| Value |\n| ----- |\n| cc    |\n| ddd   |"
+
+
+def test_table_row_changes_columns():
+    table = Table.from_columns(["Value"], [["aaaaaaaa", "b"]])
+    table.delete_row(0)
+    assert str(table) == "| Value |\n| ----- |\n| b     |"
+
+
+@pytest.mark.parametrize("index", [1, -2])
+def test_table_row_changes_unknown_row(index):
+    table = Table(["Name"], [["Sam"]])
+    with pytest.raises(ValueError):
+        table.update_cell(index, 0, "Ada")
+    with pytest.raises(ValueError):
+        table.delete_row(index)
+
+
+def test_table_insert_row_wrong_width():
+    with pytest.raises(ValueError):
+        Table(["Name"]).insert_row(0, ["Sam", "Ada"])
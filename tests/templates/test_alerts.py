@@ -1,4 +1,4 @@
-from snakemd.elements import Inline
+from snakemd.elements import Inline, Paragraph, Quote
 from snakemd.templates import Alert
 
 def test_alert_note():
@@ -23,4 +23,12 @@ def test_alert_caution():
     
 def test_alert_inline():
     alert = Alert(Inline("Hello, World!", italics=True), Alert.Kind.NOTE)
-    assert str(alert) == "> [!NOTE]\n> _Hello, World!_" 
+    assert str(alert) == "> [!NOTE]\n> _Hello, World!_"
+
+
+def test_alert_nested_invalidation():
+    paragraph = Paragraph(["Hello"])
+    quote = Quote([Alert(paragraph, Alert.Kind.NOTE)])
+    assert str(quote) == "> > [!NOTE]\n> > Hello"
+    paragraph.add(", World!")
+    assert str(quote) == "> > [!NOTE]\n> > Hello, World!"
@@ -1,4 +1,4 @@
-from snakemd.elements import MDList
+from snakemd.elements import MDList, Paragraph
 from snakemd.templates import Checklist
 
 def test_checklist_one_item_true():
@@ -24,3 +24,11 @@ def test_checklist_many_items_nested_true():
 def test_checklist_many_items_nested_mdlist_true():
     checklist = Checklist(["Write code", MDList(["Implement TODO"]), "Do Laundry"], True)
     assert str(checklist) == "- [X] Write code\n  - Implement TODO\n- [X] Do Laundry"
+
+
+def test_checklist_nested_invalidation():
+    paragraph = Paragraph(["hello"])
+    mdlist = MDList([Checklist([paragraph])])
+    assert str(mdlist) == "- - [ ] hello"
+    paragraph._content[0].bold()
+    assert str(mdlist) == "- - [ ] **hello**"
@@ -1,5 +1,10 @@
+import csv
+
 import pytest
 
+from snakemd import instrument, uninstrument
+from snakemd.document import Document
+from snakemd.elements import Table
 from snakemd.templates import CSVTable
 
 
@@ -29,3 +34,154 @@ def test_csv_table_sample_file():
         for actual, expected in zip(md.readlines(), table_lines):
             assert actual == expected
             
+
+
+def _write_csv(path, rows, encoding="utf-8"):
+    with open(path, "w", encoding=encoding, newline="") as csv_file:
+        csv.writer(csv_file).writerows(rows)
+    return path
+
+
+ROWS = [["Name", "Note"]] + [[f"Row {i}", f"line\n{i}, \"quoted\""] for i in range(5)]
+
+
+def _table(rows):
+    table = Table(ROWS[0])
+    for row in rows:
+        table.add_row(row)
+    return str(table)
+
+
+def test_csv_table_is_lazy(tmp_path):
+    """
+    Verifies that the CSV file is not read until render.
+    """
+    path = _write_csv(tmp_path / "lazy.csv", [["A"], ["1"]])
+    table = CSVTable(path)
+    _write_csv(path, [["B"], ["2"]])
+    assert str(table) == "| B |\n| - |\n| 2 |"
+
+
+def test_csv_table_lazy_repr_and_events(tmp_path):
+    """
+    Verifies that neither repr nor instrumentation parse the
+    CSV file ahead of render.
+    """
+    path = _write_csv(tmp_path / "lazy.csv", [["A"], ["1"]])
+    events = []
+    observer = instrument(events.append)
+    try:
+        table = Document().add_table_from_csv(path)
+        assert repr(table).startswith("CSVTable(path=")
+        assert table._table is None
+        assert events[0].cells == 0
+        str(table)
+        assert table._count_cells() == 2
+    finally:
+        uninstrument(observer)
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+@pytest.mark.parametrize(
+    "sample,page,expected",
+    [("head", 0, [0, 1]), ("head", 2, [4]), ("tail", 0, [3, 4]), ("tail", 1, [1, 2])],
+)
+def test_csv_table_max_rows(tmp_path, encoding, sample, page, expected):
+    """
+    Verifies that only the selected rows are rendered, with a note
+    for the rest, whether or not the file can be memory mapped.
+    """
+    path = _write_csv(tmp_path / "rows.csv", ROWS, encoding)
+    table = CSVTable(path, encoding, max_rows=2, sample=sample, page=page)
+    rows = [ROWS[i + 1] for i in expected]
+    omitted = 5 - len(rows)
+    assert str(table) == f"{_table(rows)}\n\n_{omitted} more rows_"
+
+
+def test_csv_table_max_rows_no_note(tmp_path):
+    """
+    Verifies that the note can be turned off and is never
+    shown when every row fits.
+    """
+    path = _write_csv(tmp_path / "rows.csv", ROWS)
+    assert str(CSVTable(path, max_rows=1, note=False)) == _table(ROWS[1:2])
+    assert str(CSVTable(path, max_rows=5)) == _table(ROWS[1:])
+    assert str(CSVTable(path, max_rows=4)).endswith("_1 more row_")
+
+
+def test_csv_table_index_no_trailing_newline():
+    """
+    Verifies that records are indexed correctly, including
+    quoted newlines and a missing newline at the end.
+    """
+    data = b'a,b\n"x\ny",1\r\n"say ""hi""",2'
+    assert list(CSVTable._index_records(data)) == [0, 4, 13, len(data)]
+
+
+def test_csv_table_errors(tmp_path):
+    """
+    Verifies that bad row selections raise ValueErrors.
+    """
+    path = _write_csv(tmp_path / "rows.csv", ROWS)
+    with pytest.raises(ValueError):
+        CSVTable(path, max_rows=0)
+    with pytest.raises(ValueError):
+        CSVTable(path, max_rows=1, sample="middle")
+    with pytest.raises(ValueError):
+        CSVTable(path, page=1)
+    with pytest.raises(ValueError):
+        str(CSVTable(_write_csv(tmp_path / "empty.csv", []), max_rows=1))
+
+
+def test_csv_table_split_records():
+    """
+    Verifies that chunks always end on record boundaries.
+    """
+    data = b'h\n"a\nb"\nc\n"d\n""e""\nf"\ng'
+    offsets = list(CSVTable._index_records(data))
+    for parts in range(1, 8):
+        bounds = CSVTable._split_records(data, parts)
+        assert bounds[0] == offsets[1]
+        assert bounds[-1] == len(data)
+        assert set(bounds) <= set(offsets)
+
+
+def test_csv_table_workers(tmp_path):
+    """
+    Verifies that parsing in parallel matches parsing serially.
+    """
+    rows = [["Name", "Note", "Count"]]
+    notes = ["a,\r\nb", 'say "hi"', "plain"]
+    rows += [[f"Row {i}", notes[i % 3], str(i)] for i in range(60000)]
+    path = _write_csv(tmp_path / "big.csv", rows)
+    assert path.stat().st_size > 1 << 20
+    assert str(CSVTable(path, workers=2)) == str(CSVTable(path))
+
+
+def test_csv_table_empty_file(tmp_path):
+    """
+    Verifies that empty files raise a ValueError, both when the
+    table is created and when the file is emptied before rendering.
+    """
+    path = _write_csv(tmp_path / "rows.csv", ROWS)
+    with pytest.raises(ValueError):
+        CSVTable(_write_csv(tmp_path / "empty.csv", []))
+    table = CSVTable(path)
+    path.write_text("")
+    with pytest.raises(ValueError):
+        str(table)
+    doc = Document([table])
+    with pytest.raises(ValueError):
+        list(doc.iter_render())
+
+
+@pytest.mark.parametrize("max_rows", [None, 1])
+def test_csv_table_not_byte_compatible(tmp_path, max_rows):
+    """
+    Verifies that files which cannot be memory mapped and indexed
+    fall back to the buffered parsers.
+    """
+    path = _write_csv(tmp_path / "rows.csv", ROWS, encoding="utf-16")
+    table = CSVTable(path, encoding="utf-16", max_rows=max_rows, workers=2)
+    expected = CSVTable(_write_csv(tmp_path / "utf8.csv", ROWS), max_rows=max_rows)
+    assert str(table) == str(expected)
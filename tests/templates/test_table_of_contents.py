@@ -1,6 +1,7 @@
 import markdown
 
 from snakemd.document import Document
+from snakemd.elements import Heading, Paragraph
 from snakemd.templates import TableOfContents
 
 
@@ -121,3 +122,24 @@ def test_table_of_contents_triple_nesting():
         "   1. [Subsection 1A](#subsection-1a)\n"
         "      1. [Subsubsection 1Ai](#subsubsection-1ai)"
     )
+
+
+def test_table_of_contents_after_element_changes():
+    doc = Document()
+    toc = doc.add_table_of_contents()
+    doc.add_heading("Section 1", level=2)
+    doc.add_heading("Section 2", level=2)
+    assert str(doc).startswith("1. [Section 1](#section-1)\n2. [Section 2]")
+    elements = doc.get_elements()
+    elements.insert(1, Heading("Section 0", level=2))
+    elements.remove(elements[-1])
+    assert str(toc) == "1. [Section 0](#section-0)\n2. [Section 1](#section-1)"
+    elements[1] = Heading("Section A", level=2)
+    elements.reverse()
+    assert str(toc) == "1. [Section 1](#section-1)\n2. [Section A](#section-a)"
+
+
+def test_table_of_contents_plain_list():
+    toc = TableOfContents()
+    toc.load([Heading("Section 1", level=2), Paragraph(["Text"])])
+    assert str(toc) == "1. [Section 1](#section-1)"
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from snakemd import Inline, bench
+
+
+def test_bench_table_memory():
+    results = bench.bench_table_memory(rows=50, columns=2)
+    assert results["cells"] == 100
+    assert 0 < results["slots_bytes_per_cell"] < results["dict_bytes_per_cell"]
+
+
+def test_bench_interned_memory():
+    shared = Inline.intern("Kept")
+    results = bench.bench_interned_memory(rows=50, columns=2)
+    assert results["cells"] == 100
+    assert 0 < results["interned_bytes_per_cell"] < results["fresh_bytes_per_cell"]
+    assert Inline.intern("Kept") is shared
+
+
+def test_bench_run():
+    results = bench.run(["inline_render", "readme"], scale=0.001, repeat=2)
+    assert results["format"] == bench.FORMAT_VERSION
+    assert set(results["benchmarks"]) == {"inline_render", "readme"}
+    timing = results["benchmarks"]["readme"]
+    assert timing["repeat"] == 2
+    assert 0 < timing["best"] <= timing["mean"]
+
+
+def test_bench_run_unknown():
+    with pytest.raises(ValueError):
+        bench.run(["nope"])
+
+
+def test_bench_main_output(tmp_path):
+    output = tmp_path / "results.json"
+    bench.main(
+        ["--only", "csv_table", "--scale", "0.0001", "--repeat", "1", "--output", str(output)]
+    )
+    results = json.loads(output.read_text())
+    assert results["benchmarks"]["csv_table"]["rows"] > 0
+
+
+def test_bench_paragraph_insert_links():
+    results = bench.run(["paragraph_insert_links"], scale=0.01, repeat=1)
+    timing = results["benchmarks"]["paragraph_insert_links"]
+    assert timing["count"] == 1
+    assert timing["first"]["best"] > 0
@@ -0,0 +1,79 @@
+import snakemd
+from snakemd import Document, Event, instrument, uninstrument
+
+
+def test_instrument_add_event():
+    events = []
+    observer = instrument(events.append)
+    try:
+        doc = Document()
+        doc.add_paragraph("Hello")
+    finally:
+        uninstrument(observer)
+    assert events == [Event("add", "Paragraph", 0.0, 0, 0)]
+
+
+def test_instrument_render_event():
+    events = []
+    doc = Document()
+    doc.add_heading("Title")
+    doc.add_table(["x", "y"], [["1", "2"], ["3", "4"]])
+    observer = instrument(events.append)
+    try:
+        rendered = str(doc)
+    finally:
+        uninstrument(observer)
+    assert [event.action for event in events] == ["render", "render"]
+    assert [event.element for event in events] == ["Heading", "Table"]
+    assert events[0].size == len("# Title")
+    assert events[1].cells == 6
+    assert sum(event.size for event in events) + 2 == len(rendered)
+    assert all(event.elapsed >= 0 for event in events)
+
+
+def test_instrument_render_workers_event():
+    events = []
+    doc = Document()
+    doc.add_heading("Title")
+    doc.add_table(["x", "y"], [["1", "2"], ["3", "4"]])
+    doc.add_table_of_contents()
+    observer = instrument(events.append)
+    try:
+        rendered = doc.render(workers=2)
+    finally:
+        uninstrument(observer)
+    assert [event.action for event in events] == ["render"] * 3
+    assert [event.element for event in events] == [
+        "Heading",
+        "Table",
+        "TableOfContents",
+    ]
+    assert events[1].cells == 6
+    assert sum(event.size for event in events) + 4 == len(rendered)
+    assert all(event.elapsed >= 0 for event in events)
+
+
+def test_instrument_decorator():
+    events = []
+
+    @snakemd.instrument
+    def observer(event):
+        events.append(event)
+
+    try:
+        Document().add_horizontal_rule()
+    finally:
+        uninstrument(observer)
+    assert events[0].element == "HorizontalRule"
+
+
+def test_uninstrument_stops_events():
+    events = []
+    observer = instrument(events.append)
+    uninstrument(observer)
+    Document().add_horizontal_rule()
+    assert events == []
+
+
+def test_uninstrument_unknown_observer():
+    uninstrument(print)
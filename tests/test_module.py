@@ -4,3 +4,31 @@ import snakemd
 def test_new_doc():
     doc = snakemd.new_doc()
     assert isinstance(doc, snakemd.Document)
+
+
+def test_elements_have_no_instance_dict():
+    elements = [
+        snakemd.Inline("Text"),
+        snakemd.Code("x = 5"),
+        snakemd.Heading("Title", 1),
+        snakemd.HorizontalRule(),
+        snakemd.MDList(["Item"]),
+        snakemd.Paragraph("Text"),
+        snakemd.Quote("Text"),
+        snakemd.Raw("Text"),
+        snakemd.Table(["Header"], [["Cell"]]),
+        snakemd.Alert("Text", snakemd.Alert.Kind.NOTE),
+        snakemd.Checklist(["Item"]),
+        snakemd.TableOfContents(),
+    ]
+    for element in elements:
+        assert not hasattr(element, "__dict__"), type(element)
+
+
+def test_elements_can_be_extended():
+    class Custom(snakemd.Inline):
+        pass
+
+    custom = Custom("Text")
+    custom.extra = True
+    assert str(custom) == "Text"
@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+from snakemd import Document, DocumentWriter
+
+
+def _make_doc(i):
+    doc = Document()
+    doc.add_heading(f"Document {i}")
+    doc.add_table(["x", "y"], [[str(i), str(i * 2)]])
+    return doc
+
+
+def test_document_writer_one(tmp_path):
+    doc = _make_doc(1)
+    with DocumentWriter() as writer:
+        future = writer.submit(doc, "test", tmp_path)
+    path = future.result()
+    assert path == str(tmp_path / "test.md")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == str(doc)
+
+
+def test_document_writer_many(tmp_path):
+    docs = [_make_doc(i) for i in range(50)]
+    with DocumentWriter(workers=4, max_pending=2) as writer:
+        futures = [
+            writer.submit(doc, f"doc{i}", tmp_path / "nested" / str(i % 3))
+            for i, doc in enumerate(docs)
+        ]
+    for doc, future in zip(docs, futures):
+        with open(future.result(), encoding="utf-8") as f:
+            assert f.read() == str(doc)
+    assert len(list((tmp_path / "nested").iterdir())) == 3
+
+
+def test_document_writer_ext(tmp_path):
+    with DocumentWriter() as writer:
+        path = writer.submit(_make_doc(0), "test", tmp_path, ext="txt").result()
+    assert path.endswith("test.txt")
+
+
+def test_document_writer_error_in_future(tmp_path):
+    (tmp_path / "file").write_text("")
+    with DocumentWriter() as writer:
+        future = writer.submit(_make_doc(0), "test", tmp_path / "file")
+        with pytest.raises(OSError):
+            future.result()
+
+
+def test_document_writer_bounded(tmp_path):
+    gate = threading.Event()
+
+    class Blocking(Document):
+        def render_to(self, fp):
+            gate.wait()
+            super().render_to(fp)
+
+    writer = DocumentWriter(workers=1, max_pending=1)
+    first = writer.submit(Blocking(), "first", tmp_path)
+    submitted = threading.Event()
+
+    def submit_second():
+        writer.submit(Document(), "second", tmp_path)
+        submitted.set()
+
+    thread = threading.Thread(target=submit_second)
+    thread.start()
+    assert not submitted.wait(0.1)
+    gate.set()
+    thread.join()
+    writer.close()
+    assert first.done()
+    assert (tmp_path / "second.md").exists()
+
+
+def test_document_writer_max_pending_exception():
+    with pytest.raises(ValueError):
+        DocumentWriter(max_pending=0)
@@ -0,0 +1,79 @@
+import csv
+import io
+
+import pytest
+
+from snakemd import Inline, Paragraph, Table, TableWriter
+
+HEADER = ["Rank", Inline("Player", bold=True), "Goals"]
+ROWS = [
+    ["1st", "Crosby", "42"],
+    ["2nd", Paragraph(["Connor   McDavid"]), "64"],
+    ["3rd", "Matthews", Inline("69", italics=True)],
+]
+ALIGN = [Table.Align.LEFT, Table.Align.CENTER, Table.Align.RIGHT]
+
+
+def _write(writer: TableWriter, rows, **kwargs) -> str:
+    output = io.StringIO()
+    assert writer.write(output, rows, **kwargs) == len(ROWS)
+    return output.getvalue()
+
+
+# Strategy tests
+
+
+@pytest.mark.parametrize("strategy", ["scan", "spill"])
+def test_table_writer_matches_table(strategy):
+    writer = TableWriter(HEADER, ALIGN, indent=2, buffer_rows=2)
+    expected = str(Table(HEADER, ROWS, ALIGN, indent=2))
+    assert _write(writer, ROWS, strategy=strategy) == expected
+
+
+def test_table_writer_fixed():
+    writer = TableWriter(["A", "B"], widths=[3, 1])
+    output = io.StringIO()
+    writer.write(output, iter([["x", "y"], ["long", "z"]]))
+    assert output.getvalue() == (
+        "| A   | B |\n"
+        "| --- | - |\n"
+        "| x   | y |\n"
+        "| long | z |"
+    )
+
+
+def test_table_writer_spills_iterators():
+    writer = TableWriter(HEADER)
+    assert _write(writer, (row for row in ROWS)) == str(Table(HEADER, ROWS))
+
+
+def test_table_writer_no_rows():
+    output = io.StringIO()
+    assert TableWriter(["A"]).write(output, []) == 0
+    assert output.getvalue() == str(Table(["A"]))
+
+
+def test_table_writer_csv(tmp_path):
+    path = tmp_path / "table.csv"
+    with open(path, "w", encoding="utf-8", newline="") as csv_file:
+        csv.writer(csv_file).writerows([["Name", "Note"], ["Sam", "a, b"], ["Al", ""]])
+    output = io.StringIO()
+    rows = [["Sam", "a, b"], ["Al", ""]]
+    assert TableWriter(["Name", "Note"]).write_csv(output, path) == 2
+    assert output.getvalue() == str(Table(["Name", "Note"], rows))
+
+
+# Error tests
+
+
+def test_table_writer_errors():
+    with pytest.raises(ValueError):
+        TableWriter(["A"], widths=[1, 2])
+    with pytest.raises(ValueError):
+        TableWriter(["A"]).write(io.StringIO(), [], strategy="fixed")
+    with pytest.raises(ValueError):
+        TableWriter(["A"]).write(io.StringIO(), iter([]), strategy="scan")
+    with pytest.raises(ValueError):
+        TableWriter(["A"]).write(io.StringIO(), [], strategy="guess")
+    with pytest.raises(ValueError):
+        TableWriter(["A"]).write(io.StringIO(), [["x", "y"]])